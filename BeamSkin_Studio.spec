@@ -72,6 +72,10 @@ hiddenimports = [
     'core.changelog',
     'core.colorable_ops',
     'core.add_vehicles',
+    'core.jbeam_index',
+    'core.template_generator',
+    'core.template_sources',
+    'core.rough_met',
 
     'gui',
     'gui.main_window',
@@ -79,12 +83,17 @@ hiddenimports = [
     'gui.theme',
     'gui.widgets',
     'gui.icon_helper',
+    'gui.image_cache',
+    'gui.vehicle_search',
     'gui.confirmation_dialog',
 
     'gui.components',
     'gui.components.dialogs',
     'gui.components.navigation',
     'gui.components.preview',
+    'gui.components.preview_loader',
+    'gui.components.card_thumbs',
+    'gui.components.rough_met_dialog',
     'gui.components.setup_wizard',
     'gui.components.path_configuration',
     'gui.components.changelog_dialog',
@@ -105,6 +114,16 @@ hiddenimports = [
     'utils.file_ops',
     'utils.single_instance',
     'utils.config_helper',
+    'utils.lenient_json',
+    'utils.vehicle_catalog',
+    'utils.thumb_cache',
+    'utils.dds_reader',
+    'utils.texture_info',
+    'utils.search_index',
+    'utils.archive_index',
+    'utils.archive_extract',
+    'utils.variant_index',
+    'utils.vehicle_images',
     'utils.connection',
 
     # ── PySide6 core modules ───────────────────────────────────────────────── #
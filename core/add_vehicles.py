@@ -3,14 +3,20 @@ Core Developer Module - Vehicle File Processing
 """
 import os
 import shutil
-from typing import Optional
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
+from core import template_sources
+from core.mod_scanner import ARCHIVE_SEP, mod_source_batch, open_mod_source
 from utils.file_ops import (
-    create_vehicle_folders,
     delete_vehicle_folders,
     edit_material_json,
     edit_jbeam_material,
+    install_template,
+    materials_output_name,
     add_vehicle_to_json,
+    add_entries_to_json,
     remove_vehicle_from_json,
     VEHICLE_FOLDER
 )
@@ -21,88 +27,137 @@ def process_custom_vehicle(
     carname: str,
     json_path: str,
     jbeam_path: str,
-    image_path: Optional[str] = None
+    image_path: Optional[str] = None,
+    archive_path: Optional[str] = None,
 ) -> bool:
+    """
+    archive_path: when set, json/jbeam/image paths are member names inside
+    that mod zip and only those members are read — nothing is extracted.
 
-    print(f"[DEBUG] \n{'='*60}")
-    print(f"[DEBUG] PROCESSING VEHICLE: {carname} ({carid})")
-    print(f"[DEBUG] {'='*60}")
+    If the vehicle's template was already built from this exact source
+    (see core.template_sources) it is left untouched.
+    """
+    key = template_sources.source_key(carid)
+    with open_mod_source(archive_path) as src:
+        if template_sources.is_current(key, src, archive_path, json_path, jbeam_path,
+                                       _template_folder(carid), image_path):
+            print(f"[DEBUG] Template for {carid} is up to date — skipping rebuild")
+            add_vehicle_to_json(carid, carname)
+            return True
+        ok = _process_custom_vehicle(src, carid, carname, json_path, jbeam_path, image_path)
+        if ok:
+            template_sources.record(key, src, archive_path, json_path, jbeam_path, image_path)
+        return ok
 
-    try:
-        if not os.path.exists(json_path):
-            print(f"[ERROR] JSON file not found: {json_path}")
-            return False
-
-        if not os.path.exists(jbeam_path):
-            print(f"[ERROR] JBEAM file not found: {jbeam_path}")
-            return False
-
-        if image_path:
-            if os.path.exists(image_path):
-                if not image_path.lower().endswith(('.jpg', '.jpeg')):
-                    print(f"[WARNING] Image is not a JPG, skipping: {image_path}")
-                    image_path = None
-            else:
-                print(f"[WARNING] Image file not found: {image_path}")
-                image_path = None
 
-        try:
-            create_vehicle_folders(carid)
-        except Exception as e:
-            print(f"[ERROR] Failed to create vehicle folders: {e}")
-            return False
+def _template_folder(carid: str, suffix: Optional[str] = None) -> str:
+    name = f"SKINNAME{suffix.upper()}" if suffix else "SKINNAME"
+    return os.path.join(VEHICLE_FOLDER, carid, name)
 
-        car_folder = os.path.join(VEHICLE_FOLDER, carid)
-        skinname_folder = os.path.join(car_folder, "SKINNAME")
 
-        if not os.path.exists(skinname_folder):
-            print(f"[ERROR] SKINNAME folder was not created: {skinname_folder}")
-            return False
+# Templates are built in a temporary folder and only swapped into
+# vehicles/<carid>/SKINNAME* once every file was generated, so a source
+# that fails to convert never costs an installed vehicle its template.
 
-        try:
-            edit_material_json(json_path, skinname_folder, carid)
-        except Exception as e:
-            print(f"[ERROR] Failed to process JSON file: {e}")
-            import traceback
-            traceback.print_exc()
-            delete_vehicle_folders(carid)
-            return False
+_STAGED_PREVIEW = "preview.jpg"
 
+
+def _check_sources(src, json_path, jbeam_path, image_path) -> Tuple[bool, Optional[str]]:
+    """(sources present, usable preview image or None)."""
+    if not src.isfile(json_path):
+        print(f"[ERROR] JSON file not found: {json_path}")
+        return False, None
+    if not src.isfile(jbeam_path):
+        print(f"[ERROR] JBEAM file not found: {jbeam_path}")
+        return False, None
+    if image_path:
+        if not src.isfile(image_path):
+            print(f"[WARNING] Image file not found, skipping: {image_path}")
+            image_path = None
+        elif not image_path.lower().endswith(('.jpg', '.jpeg')):
+            print(f"[WARNING] Image is not a JPG, skipping: {image_path}")
+            image_path = None
+    return True, image_path
+
+
+def _build_template(src, carid, json_path, jbeam_path, image_path) -> Optional[str]:
+    """Generate the template (and copy the preview) into a new temporary
+    folder and return it; None on failure.  Nothing under vehicles/ is touched."""
+    staging = tempfile.mkdtemp(prefix=f"bss_tpl_{carid}_")
+    try:
+        edit_material_json(json_path, staging, carid, content=src.read_text(json_path))
+        edit_jbeam_material(jbeam_path, staging, carid)
+        materials_name = materials_output_name(json_path)
+        if not os.path.isfile(os.path.join(staging, materials_name)):
+            raise FileNotFoundError(f"{materials_name} was not generated")
+    except Exception as e:
+        print(f"[ERROR] Failed to build template for {carid}: {e}")
+        import traceback
+        traceback.print_exc()
+        shutil.rmtree(staging, ignore_errors=True)
+        return None
+    if image_path:
         try:
-            edit_jbeam_material(jbeam_path, skinname_folder, carid)
+            src.copy_to(image_path, os.path.join(staging, _STAGED_PREVIEW))
         except Exception as e:
-            print(f"[ERROR] Failed to process JBEAM file: {e}")
-            import traceback
-            traceback.print_exc()
-            delete_vehicle_folders(carid)
-            return False
+            print(f"[WARNING] Failed to copy preview image: {e}")
+    return staging
+
 
-        if image_path:
+def _install_staged(staging: str, carid: str, suffix: Optional[str] = None) -> None:
+    """Move a staged template and preview into place; staging is removed."""
+    try:
+        previous = template_sources.generated_jbeam_name(template_sources.source_key(carid, suffix))
+        install_template(staging, _template_folder(carid, suffix),
+                         replaced_jbeams=[previous] if previous else ())
+        preview = os.path.join(staging, _STAGED_PREVIEW)
+        if os.path.isfile(preview):
             try:
                 preview_folder = os.path.join("gui", "images", "vehicles", carid)
                 os.makedirs(preview_folder, exist_ok=True)
-                shutil.copy2(image_path, os.path.join(preview_folder, "default.jpg"))
+                name = f"default_{suffix.lower()}.jpg" if suffix else "default.jpg"
+                shutil.copy2(preview, os.path.join(preview_folder, name))
             except Exception as e:
                 print(f"[WARNING] Failed to copy preview image: {e}")
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
 
-        print(f"[DEBUG] ✓ SUCCESS: Vehicle {carid} processed successfully!")
 
+def _process_custom_vehicle(src, carid, carname, json_path, jbeam_path, image_path,
+                            register: bool = True) -> bool:
+    """register=False builds the vehicle folder but leaves added_vehicles.json alone."""
+    print(f"[DEBUG] \n{'='*60}")
+    print(f"[DEBUG] PROCESSING VEHICLE: {carname} ({carid})")
+    print(f"[DEBUG] {'='*60}")
+
+    ok, image_path = _check_sources(src, json_path, jbeam_path, image_path)
+    if not ok:
+        return False
+    staging = _build_template(src, carid, json_path, jbeam_path, image_path)
+    if staging is None:
+        return False
+
+    existed = os.path.isdir(os.path.join(VEHICLE_FOLDER, carid))
+    try:
+        _install_staged(staging, carid)
+    except Exception as e:
+        print(f"[ERROR] Failed to install template for {carid}: {e}")
+        if not existed:
+            try:
+                delete_vehicle_folders(carid)
+            except Exception:
+                pass
+        return False
+
+    print(f"[DEBUG] ✓ SUCCESS: Vehicle {carid} processed successfully!")
+
+    if register:
         try:
             add_vehicle_to_json(carid, carname)
         except Exception as e:
             print(f"[WARNING] Failed to save to JSON: {e}")
 
-        return True
-
-    except Exception as e:
-        print(f"[ERROR] Unexpected error processing vehicle files: {e}")
-        import traceback
-        traceback.print_exc()
-        try:
-            delete_vehicle_folders(carid)
-        except:
-            pass
-        return False
+    return True
 
 
 def delete_custom_vehicle(carid: str) -> bool:
@@ -123,15 +178,27 @@ def process_custom_variant(
     json_path: str,
     jbeam_path: str,
     image_path: Optional[str] = None,
+    archive_path: Optional[str] = None,
 ) -> bool:
-    from utils.file_ops import (
-        create_variant_folders,
-        delete_variant_folders,
-        edit_material_json,
-        edit_jbeam_material,
-        add_variant_to_json,
-        VEHICLE_FOLDER,
-    )
+    """archive_path and change detection: see process_custom_vehicle."""
+    from utils.file_ops import add_variant_to_json
+
+    key = template_sources.source_key(carid, variant_suffix)
+    with open_mod_source(archive_path) as src:
+        if template_sources.is_current(key, src, archive_path, json_path, jbeam_path,
+                                       _template_folder(carid, variant_suffix), image_path):
+            print(f"[DEBUG] Template for {carid}+{variant_suffix.upper()} is up to date — skipping rebuild")
+            add_variant_to_json(carid, variant_suffix.lower())
+            return True
+        ok = _process_custom_variant(src, carid, variant_suffix, json_path, jbeam_path, image_path)
+        if ok:
+            template_sources.record(key, src, archive_path, json_path, jbeam_path, image_path)
+        return ok
+
+
+def _process_custom_variant(src, carid, variant_suffix, json_path, jbeam_path, image_path,
+                            register: bool = True) -> bool:
+    from utils.file_ops import add_variant_to_json, delete_variant_folders
 
     suffix_upper = variant_suffix.upper()
     suffix_lower = variant_suffix.lower()
@@ -140,69 +207,33 @@ def process_custom_variant(
     print(f"[DEBUG] PROCESSING VARIANT: {carid} + {suffix_upper}")
     print(f"[DEBUG] {'='*60}")
 
-    try:
-        if not os.path.exists(json_path):
-            print(f"[ERROR] JSON file not found: {json_path}")
-            return False
-        if not os.path.exists(jbeam_path):
-            print(f"[ERROR] JBEAM file not found: {jbeam_path}")
-            return False
-        if image_path and not os.path.exists(image_path):
-            print(f"[WARNING] Image file not found, skipping: {image_path}")
-            image_path = None
-
-        try:
-            create_variant_folders(carid, suffix_upper)
-        except Exception as e:
-            print(f"[ERROR] Failed to create variant folders: {e}")
-            return False
-
-        variant_folder = os.path.join(VEHICLE_FOLDER, carid, f"SKINNAME{suffix_upper}")
-        if not os.path.exists(variant_folder):
-            print(f"[ERROR] Variant folder was not created: {variant_folder}")
-            return False
-
-        try:
-            edit_material_json(json_path, variant_folder, carid)
-        except Exception as e:
-            print(f"[ERROR] Failed to process JSON file: {e}")
-            import traceback; traceback.print_exc()
-            delete_variant_folders(carid, suffix_upper)
-            return False
-
-        try:
-            edit_jbeam_material(jbeam_path, variant_folder, carid)
-        except Exception as e:
-            print(f"[ERROR] Failed to process JBEAM file: {e}")
-            import traceback; traceback.print_exc()
-            delete_variant_folders(carid, suffix_upper)
-            return False
+    ok, image_path = _check_sources(src, json_path, jbeam_path, image_path)
+    if not ok:
+        return False
+    staging = _build_template(src, carid, json_path, jbeam_path, image_path)
+    if staging is None:
+        return False
 
-        if image_path and image_path.lower().endswith(('.jpg', '.jpeg')):
+    existed = os.path.isdir(_template_folder(carid, variant_suffix))
+    try:
+        _install_staged(staging, carid, variant_suffix)
+    except Exception as e:
+        print(f"[ERROR] Failed to install template for {carid}+{suffix_upper}: {e}")
+        if not existed:
             try:
-                preview_folder = os.path.join("gui", "images", "vehicles", carid)
-                os.makedirs(preview_folder, exist_ok=True)
-                shutil.copy2(image_path, os.path.join(preview_folder, f"default_{suffix_lower}.jpg"))
-            except Exception as e:
-                print(f"[WARNING] Failed to copy preview image: {e}")
+                delete_variant_folders(carid, suffix_upper)
+            except Exception:
+                pass
+        return False
 
+    if register:
         try:
             add_variant_to_json(carid, suffix_lower)
         except Exception as e:
             print(f"[WARNING] Failed to save variant to JSON: {e}")
 
-        print(f"[DEBUG] ✓ SUCCESS: Variant {carid}+{suffix_upper} processed successfully!")
-        return True
-
-    except Exception as e:
-        print(f"[ERROR] Unexpected error processing variant: {e}")
-        import traceback; traceback.print_exc()
-        try:
-            from utils.file_ops import delete_variant_folders as _dvf
-            _dvf(carid, suffix_upper)
-        except Exception:
-            pass
-        return False
+    print(f"[DEBUG] ✓ SUCCESS: Variant {carid}+{suffix_upper} processed successfully!")
+    return True
 
 
 def delete_custom_variant(carid: str, suffix: str) -> bool:
@@ -222,9 +253,84 @@ def delete_custom_variant(carid: str, suffix: str) -> bool:
         return False
 
 
+# ── Batch import ──────────────────────────────────────────────────────────────
+#
+# process_multiple_vehicles() runs in three phases:
+#   1. validate   — sequential, cheap; bad selections are skipped
+#   2. stage      — templates and previews are built in parallel, each in
+#                   its own temporary folder; vehicles/ is not touched
+#   3. commit     — staged templates are swapped into vehicles/ and every
+#                   entry is registered in one atomic write
+# A failure while staging only discards that item's temporary folder, so
+# re-importing or refreshing an installed vehicle can never delete it.  If
+# the registry write fails, only folders this batch created are removed;
+# existing entries keep their (freshly built) templates.  Items whose
+# template is already current are not rebuilt at all — see
+# core.template_sources.
+
+_IMPORT_MAX_WORKERS = 4
+
+_BUILT, _UNCHANGED, _FAILED = "built", "unchanged", "failed"
+
+
+def _stage_selection(sel: dict) -> str:
+    suffix = sel["suffix"] if sel["type"] == "variant" else None
+    key    = template_sources.source_key(sel["carid"], suffix)
+    with open_mod_source(sel["archive_path"]) as src:
+        if template_sources.is_current(key, src, sel["archive_path"], sel["json_path"],
+                                       sel["jbeam_path"], _template_folder(sel["carid"], suffix),
+                                       sel["image_path"]):
+            print(f"[DEBUG] Template for {sel['label']} is up to date — skipping rebuild")
+            return _UNCHANGED
+
+        ok, image_path = _check_sources(src, sel["json_path"], sel["jbeam_path"], sel["image_path"])
+        if not ok:
+            return _FAILED
+        staging = _build_template(src, sel["carid"], sel["json_path"], sel["jbeam_path"], image_path)
+        if staging is None:
+            return _FAILED
+        sel["staging"] = staging
+        sel["source"]  = template_sources.make_record(
+            src, sel["archive_path"], sel["json_path"], sel["jbeam_path"],
+            image_path=sel["image_path"])
+    return _BUILT
+
+
+def _discard_staging(sel: dict) -> None:
+    staging = sel.pop("staging", None)
+    if staging:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _rollback_selection(sel: dict) -> None:
+    """Remove what installing sel created.  Templates that replaced an
+    existing entry's files are left in place."""
+    from utils.file_ops import delete_variant_folders
+
+    _discard_staging(sel)
+    if not sel.get("created"):
+        return
+    carid = sel["carid"]
+    try:
+        if sel["type"] == "vehicle":
+            delete_vehicle_folders(carid)
+        else:
+            suffix = sel["suffix"]
+            delete_variant_folders(carid, suffix.upper())
+            preview = os.path.join("gui", "images", "vehicles", carid, f"default_{suffix.lower()}.jpg")
+            if os.path.exists(preview):
+                os.remove(preview)
+        print(f"[DEBUG] Rolled back {sel['label']}")
+    except Exception as e:
+        print(f"[ERROR] Rollback of {sel['label']} failed: {e}")
+
+
 def process_multiple_vehicles(
     selections: list,
     known_carids: Optional[set] = None,
+    max_workers: Optional[int] = None,
+    all_or_nothing: bool = False,
+    on_item_staged: Optional[Callable[[int, bool], None]] = None,
 ) -> dict:
     """
     Process multiple vehicles/variants from a multi-select import.
@@ -235,17 +341,30 @@ def process_multiple_vehicles(
         json_path  : str
         jbeam_path : str
         image_path : str | None
+        archive_path : str | None (paths are members of this zip)
         carname    : str          (vehicle only)
         suffix     : str          (variant only)
 
-    Returns {"succeeded": [...], "failed": [...], "skipped": [...]}.
+    Templates are built on a worker pool and added_vehicles.json is written
+    once at the end.  on_item_staged(index, ok) is called from the worker
+    threads as each selection finishes staging.
+
+    Returns {"succeeded": [...], "failed": [...], "skipped": [...],
+    "unchanged": [...], "results": [bool per selection, in input order]}.
+    Unchanged items (template already built from the same source) are
+    also listed in succeeded.
     """
     print(f"[DEBUG] Batch import: {len(selections)} item(s)")
 
     succeeded: list = []
     failed:    list = []
     skipped:   list = []
+    unchanged: list = []
+    results:   list = [False] * len(selections)
 
+    # ── 1. validate ───────────────────────────────────────────────────────────
+    jobs:   list = []
+    labels: set  = set()
     for idx, sel in enumerate(selections):
         item_type = sel.get("type", "")
         carid     = sel.get("carid", "").strip()
@@ -256,48 +375,165 @@ def process_multiple_vehicles(
             skipped.append(label)
             continue
 
-        json_path  = sel.get("json_path")  or ""
-        jbeam_path = sel.get("jbeam_path") or ""
-        image_path = sel.get("image_path") or None
+        suffix = sel.get("suffix", "").strip()
+        label  = carid if item_type == "vehicle" else f"{carid}+{suffix or '?'}"
 
-        if not json_path or not jbeam_path:
-            label = carid if item_type == "vehicle" else f"{carid}+{sel.get('suffix', '?')}"
+        if not sel.get("json_path") or not sel.get("jbeam_path"):
             print(f"[WARNING] Skipping {label}: missing json_path or jbeam_path")
             skipped.append(label)
             continue
+        if item_type == "variant" and not suffix:
+            print(f"[WARNING] Skipping variant for {carid}: missing suffix")
+            skipped.append(label)
+            continue
+        if label.lower() in labels:
+            print(f"[WARNING] Skipping {label}: already selected in this batch")
+            skipped.append(label)
+            continue
+        labels.add(label.lower())
+
+        jobs.append({
+            "index":        idx,
+            "label":        label,
+            "type":         item_type,
+            "carid":        carid,
+            "carname":      sel.get("carname") or carid.replace("_", " ").title(),
+            "suffix":       suffix,
+            "json_path":    sel["json_path"],
+            "jbeam_path":   sel["jbeam_path"],
+            "image_path":   sel.get("image_path") or None,
+            "archive_path": sel.get("archive_path") or None,
+        })
 
-        if item_type == "vehicle":
-            carname = sel.get("carname") or carid.replace("_", " ").title()
-            print(f"\n[DEBUG] Importing vehicle {idx + 1}/{len(selections)}: {carid}")
-            ok = process_custom_vehicle(
-                carid=carid, carname=carname,
-                json_path=json_path, jbeam_path=jbeam_path, image_path=image_path,
-            )
-            (succeeded if ok else failed).append(carid)
-
-        elif item_type == "variant":
-            suffix = sel.get("suffix", "").strip()
-            if not suffix:
-                print(f"[WARNING] Skipping variant for {carid}: missing suffix")
-                skipped.append(f"{carid}+?")
-                continue
-
-            label = f"{carid}+{suffix}"
-            print(f"\n[DEBUG] Importing variant {idx + 1}/{len(selections)}: {label}")
-            ok = process_custom_variant(
-                carid=carid, variant_suffix=suffix,
-                json_path=json_path, jbeam_path=jbeam_path, image_path=image_path,
+    # ── 2. stage (parallel) ───────────────────────────────────────────────────
+    def _run(job: dict) -> str:
+        try:
+            status = _stage_selection(job)
+        except Exception as e:
+            print(f"[ERROR] Staging {job['label']} failed: {e}")
+            status = _FAILED
+        if on_item_staged is not None:
+            on_item_staged(job["index"], status != _FAILED)
+        return status
+
+    staged:  list = []   # rebuilt in this batch — rolled back on failure
+    current: list = []   # already up to date — registered, never touched
+    if jobs:
+        workers = max(1, min(max_workers or _IMPORT_MAX_WORKERS, len(jobs)))
+        # Items of one mod pack share nested archives; decompress each once.
+        with mod_source_batch(), \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import") as pool:
+            for job, status in zip(jobs, pool.map(_run, jobs)):
+                if status == _BUILT:
+                    staged.append(job)
+                elif status == _UNCHANGED:
+                    current.append(job)
+                else:
+                    failed.append(job["label"])
+
+    # ── 3. commit ─────────────────────────────────────────────────────────────
+    if staged and all_or_nothing and failed:
+        print(f"[WARNING] {len(failed)} item(s) failed — discarding the whole batch")
+        for job in staged:
+            _discard_staging(job)
+        failed.extend(job["label"] for job in staged + current)
+        staged, current = [], []
+
+    installed: list = []
+    for job in staged:
+        suffix = job["suffix"] if job["type"] == "variant" else None
+        # Only folders created here may be removed again by a rollback.
+        if job["type"] == "vehicle":
+            job["created"] = not os.path.isdir(os.path.join(VEHICLE_FOLDER, job["carid"]))
+        else:
+            job["created"] = not os.path.isdir(_template_folder(job["carid"], suffix))
+        try:
+            _install_staged(job.pop("staging"), job["carid"], suffix)
+            installed.append(job)
+        except Exception as e:
+            print(f"[ERROR] Installing {job['label']} failed: {e}")
+            _rollback_selection(job)
+            failed.append(job["label"])
+    staged = installed
+    committed = staged + current
+
+    if committed:
+        try:
+            add_entries_to_json(
+                {j["carid"]: j["carname"] for j in committed if j["type"] == "vehicle"},
+                [(j["carid"], j["suffix"].lower()) for j in committed if j["type"] == "variant"],
+                {template_sources.source_key(j["carid"], j["suffix"] or None): j["source"]
+                 for j in staged if j.get("source")},
             )
-            (succeeded if ok else failed).append(label)
+        except Exception as e:
+            print(f"[ERROR] Failed to save batch to JSON, rolling back: {e}")
+            for job in staged:
+                _rollback_selection(job)
+            failed.extend(job["label"] for job in committed)
+            committed = []
+
+    for job in committed:
+        succeeded.append(job["label"])
+        results[job["index"]] = True
+        if job in current:
+            unchanged.append(job["label"])
 
     print(f"\n[DEBUG] {'='*60}")
-    print(f"[DEBUG] BATCH COMPLETE — OK: {len(succeeded)}  Failed: {len(failed)}  Skipped: {len(skipped)}")
+    print(f"[DEBUG] BATCH COMPLETE — OK: {len(succeeded)} ({len(unchanged)} unchanged)  "
+          f"Failed: {len(failed)}  Skipped: {len(skipped)}")
     if succeeded: print(f"[DEBUG]   ✓ {', '.join(succeeded)}")
     if failed:    print(f"[DEBUG]   ✗ {', '.join(failed)}")
     if skipped:   print(f"[DEBUG]   — {', '.join(skipped)}")
     print(f"[DEBUG] {'='*60}\n")
 
-    return {"succeeded": succeeded, "failed": failed, "skipped": skipped}
+    return {"succeeded": succeeded, "failed": failed, "skipped": skipped,
+            "unchanged": unchanged, "results": results}
+
+
+def refresh_custom_templates(max_workers: Optional[int] = None) -> dict:
+    """
+    Re-check every imported vehicle / variant against the source it was
+    built from and rebuild only the templates whose source changed.
+    Unchanged zip members are detected from the central directory alone,
+    so refreshing a large library mostly costs one directory read per mod.
+    A changed preview image counts as a change; entries recorded before
+    previews were tracked are refreshed without one, which keeps their
+    current preview.  Run it with  python -m core.add_vehicles --refresh
+
+    Returns process_multiple_vehicles()' dict plus "missing": entries whose
+    source mod no longer exists.
+    """
+    from utils.vehicle_catalog import catalog
+
+    vehicles = catalog.vehicles()
+    variants = catalog.variants()
+    selections: list = []
+    missing:    list = []
+
+    for key, rec in sorted(catalog.sources().items()):
+        if key in vehicles:
+            sel = {"type": "vehicle", "carid": key, "carname": vehicles[key]}
+        elif key in variants:
+            sel = {"type": "variant", "carid": variants[key]["carid"],
+                   "suffix": variants[key]["suffix"]}
+        else:
+            continue    # base-game templates — see core.template_generator
+
+        archive = rec.get("archive")
+        origin  = archive.split(ARCHIVE_SEP)[0] if archive else rec.get("json", "")
+        if not origin or not os.path.exists(origin):
+            print(f"[WARNING] Source of {key} no longer exists: {origin}")
+            missing.append(key)
+            continue
+        sel.update(json_path=rec.get("json"), jbeam_path=rec.get("jbeam"),
+                   image_path=rec.get("image"), archive_path=archive)
+        selections.append(sel)
+
+    print(f"[DEBUG] Refreshing {len(selections)} imported template(s)")
+    result = process_multiple_vehicles(selections, max_workers=max_workers) if selections else {
+        "succeeded": [], "failed": [], "skipped": [], "unchanged": [], "results": []}
+    result["missing"] = missing
+    return result
 
 
 def build_selections_from_scan(
@@ -322,6 +558,7 @@ def build_selections_from_scan(
         selections.append({
             "type": "vehicle", "carid": v.carid, "carname": v.display_name,
             "json_path": v.json_path, "jbeam_path": v.jbeam_path, "image_path": v.image_path,
+            "archive_path": v.archive_path,
         })
 
     for var in variants:
@@ -333,6 +570,7 @@ def build_selections_from_scan(
         selections.append({
             "type": "variant", "carid": var.carid, "suffix": var.suffix,
             "json_path": var.json_path, "jbeam_path": var.jbeam_path, "image_path": var.image_path,
+            "archive_path": var.archive_path,
         })
 
     return selections
@@ -406,6 +644,19 @@ def list_custom_vehicles() -> list:
 
 
 if __name__ == "__main__":
+    import sys
+
+    if "--refresh" in sys.argv:
+        # python -m core.add_vehicles --refresh   (run from the app folder)
+        result = refresh_custom_templates()
+        rebuilt = len(result["succeeded"]) - len(result["unchanged"])
+        print(f"Rebuilt {rebuilt}, unchanged {len(result['unchanged'])}, "
+              f"failed {len(result['failed']) + len(result['skipped'])}, "
+              f"source missing {len(result['missing'])}")
+        for key in result["failed"] + result["skipped"] + result["missing"]:
+            print(f"  - {key}")
+        sys.exit(1 if result["failed"] or result["skipped"] else 0)
+
     print("Core Developer Module - Vehicle File Processing")
     vehicles = list_custom_vehicles()
     if vehicles:
@@ -7,6 +7,8 @@ import shutil
 import json
 import re
 
+from utils import lenient_json
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SANITISERS
@@ -344,11 +346,8 @@ def _process_material_properties(folder_path, material_props, skin_id):
 
     try:
         for mat_file in mat_files:
-            with open(mat_file, "r", encoding="utf-8") as fh:
-                raw = fh.read()
-            raw_clean = re.sub(r",(\s*[}\]])", r"\1", raw)
             try:
-                mat_data = json.loads(raw_clean)
+                mat_data = lenient_json.load(mat_file)
             except json.JSONDecodeError as exc:
                 print(f"[ERROR] JSON decode error in {os.path.basename(mat_file)}: {exc}")
                 continue
@@ -10,6 +10,7 @@ import getpass
 import re
 import json
 
+from utils import lenient_json
 from core.colorable_ops import (
     generate_colorable_skin,
     generate_colorable_skin_variant,
@@ -341,11 +342,8 @@ def process_material_properties(skin_data, base_carid, skin_id, dest_skin_folder
 
     try:
         for mat_file in mat_files:
-            with open(mat_file, "r", encoding="utf-8") as f:
-                content = f.read()
-            content = re.sub(r",(\s*[}\]])", r"\1", content)
             try:
-                mat_data = json.loads(content)
+                mat_data = lenient_json.load(mat_file)
             except json.JSONDecodeError as e:
                 print(f"[ERROR] JSON decode error in {os.path.basename(mat_file)}: {e}")
                 continue
@@ -522,10 +520,9 @@ def process_json_files_variant_dds(
 
             with open(file_path, "r", encoding="utf-8") as f:
                 raw = f.read()
-            raw_clean = re.sub(r",(\s*[}\]])", r"\1", raw)
 
             try:
-                data      = json.loads(raw_clean); parsed_ok = True
+                data      = lenient_json.loads(raw); parsed_ok = True
             except json.JSONDecodeError:
                 print(f"[WARNING] JSON parse failed: {file_path}"); parsed_ok = False
 
@@ -722,11 +719,8 @@ def _inject_rough_met(skin_data, base_carid, skin_folder, dest_skin_folder,
         return False
 
     for mat_file in mat_files:
-        with open(mat_file, "r", encoding="utf-8") as fh:
-            raw = fh.read()
-        raw_clean = re.sub(r",(\s*[}\]])", r"\1", raw)
         try:
-            mat_data = json.loads(raw_clean)
+            mat_data = lenient_json.load(mat_file)
         except json.JSONDecodeError as exc:
             print(f"[WARNING] _inject_rough_met JSON error in {os.path.basename(mat_file)}: {exc}")
             continue
@@ -0,0 +1,199 @@
+"""
+core/jbeam_index.py — Structural part index for .jbeam files.
+
+A jbeam file is a top-level object of parts:
+
+    {
+        "pickup_skin_police": {
+            "information": {...},
+            "slotType": "paint_design",
+            "globalSkin": "police",
+            ...
+        },
+        ...
+    }
+
+Vehicles whose skin slot lives in the body jbeam (miramar, nine, the
+md_series bus/armor) instead list per-body "skin_<body>" slotTypes and may
+declare "skinType": "paint_design"; those parts count as skins too.
+
+index_jbeam() reads a file once and records every part name together with
+its slotType, skinType and globalSkin, without building the full (often
+huge) node / beam tree.  Results are cached per file fingerprint (size + mtime), so the
+scanner can ask the same question about a file many times for free.
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Only the tokens that carry structure: strings, comments, brackets, colons.
+# Numbers, commas and literals are skipped by findall's search.
+_STRUCT_RE = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*"'
+    r'|//[^\n]*|/\*.*?(?:\*/|\Z)'
+    r'|[{}\[\]:]',
+    re.DOTALL,
+)
+
+_TRACKED_KEYS = ("slotType", "skinType", "globalSkin")
+
+PAINT_DESIGN_SLOT = "paint_design"
+SKIN_SLOT_PREFIX  = "skin_"
+
+
+@dataclass
+class JbeamPart:
+    name:        str
+    slot_types:  List[str] = field(default_factory=list)
+    skin_type:   Optional[str] = None
+    global_skin: Optional[str] = None
+
+    @property
+    def slot_type(self) -> Optional[str]:
+        return self.slot_types[0] if self.slot_types else None
+
+    @property
+    def is_skin(self) -> bool:
+        return (
+            PAINT_DESIGN_SLOT in self.slot_types
+            or self.skin_type == PAINT_DESIGN_SLOT
+            or bool(self.global_skin)
+            or any(st.startswith(SKIN_SLOT_PREFIX) for st in self.slot_types)
+        )
+
+
+@dataclass
+class JbeamIndex:
+    path:  str
+    parts: Dict[str, JbeamPart] = field(default_factory=dict)
+
+    @property
+    def skin_parts(self) -> List[JbeamPart]:
+        """Parts that plug into a paint_design or skin_* slot."""
+        return [p for p in self.parts.values() if p.is_skin]
+
+    @property
+    def is_skin(self) -> bool:
+        return any(p.is_skin for p in self.parts.values())
+
+    @property
+    def global_skins(self) -> List[str]:
+        return [p.global_skin for p in self.parts.values() if p.global_skin]
+
+
+def index_jbeam_text(text: str, path: str = "") -> JbeamIndex:
+    """Build a JbeamIndex from jbeam source text in a single token pass."""
+    index = JbeamIndex(path=path)
+    depth   = 0
+    part: Optional[JbeamPart] = None
+    last_str: Optional[str] = None   # most recent key at root / part level
+    key:      Optional[str] = None   # tracked key whose value comes next
+    in_list = False                  # inside a slotType: [...] array
+
+    for tok in _STRUCT_RE.findall(text):
+        c = tok[0]
+        if c == '"':
+            s = tok[1:-1]
+            if depth == 1:
+                last_str = s
+            elif depth == 2 and part is not None:
+                if key == "slotType":
+                    part.slot_types.append(s)
+                    key = None
+                elif key == "skinType":
+                    part.skin_type = s
+                    key = None
+                elif key == "globalSkin":
+                    part.global_skin = s
+                    key = None
+                else:
+                    last_str = s
+            elif in_list and depth == 3 and part is not None:
+                part.slot_types.append(s)
+        elif c == ":":
+            if depth == 2:
+                key = last_str if last_str in _TRACKED_KEYS else None
+        elif c == "{" or c == "[":
+            if depth == 1 and c == "{" and last_str is not None:
+                part = index.parts.setdefault(last_str, JbeamPart(name=last_str))
+            elif depth == 2 and key == "slotType" and c == "[":
+                in_list = True
+            key = None
+            depth += 1
+        elif c == "}" or c == "]":
+            depth -= 1
+            if depth == 2:
+                in_list = False
+            elif depth <= 1:
+                part = None
+                last_str = None
+        # comments fall through untouched
+
+    return index
+
+
+# ── Fingerprint cache ─────────────────────────────────────────────────────────
+
+_cache: Dict[str, Tuple[Tuple[int, int], JbeamIndex]] = {}
+_cache_lock = threading.Lock()
+
+
+def _fingerprint(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def index_jbeam_cached(
+    key: str,
+    fingerprint: Tuple[int, int],
+    read_text: Callable[[], str],
+    path: str = "",
+) -> Optional[JbeamIndex]:
+    """
+    Shared cache entry point: return the index stored under key if its
+    fingerprint still matches, otherwise build it from read_text().
+    Used for plain files and for members read straight out of archives.
+    """
+    with _cache_lock:
+        hit = _cache.get(key)
+    if hit is not None and hit[0] == fingerprint:
+        return hit[1]
+
+    try:
+        index = index_jbeam_text(read_text(), path or key)
+    except (OSError, ValueError) as e:
+        print(f"[jbeam_index] Could not read {path or key}: {e}")
+        return None
+
+    with _cache_lock:
+        _cache[key] = (fingerprint, index)
+    return index
+
+
+def index_jbeam(path: str) -> Optional[JbeamIndex]:
+    """
+    Return the part index for a jbeam file, or None if it cannot be read.
+    Re-reads the file only when its size or mtime changed.
+    """
+    key = os.path.abspath(path)
+    fp  = _fingerprint(key)
+    if fp is None:
+        return None
+
+    def _read() -> str:
+        with open(key, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    return index_jbeam_cached(key, fp, _read, path)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
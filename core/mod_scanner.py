@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import json
+import io
 import os
+import posixpath
+import queue
 import re
 import shutil
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from core.jbeam_index import JbeamIndex, index_jbeam, index_jbeam_cached
+from utils import lenient_json
 
 
 @dataclass
@@ -19,7 +27,8 @@ class DiscoveredVehicle:
     image_path:    Optional[str]
     uv_map_paths:  List[str] = field(default_factory=list)
     from_zip:      bool = False
-    temp_dir:      Optional[str] = None
+    archive_path:  Optional[str] = None
+    origin:        str = ""      # where in a mod pack it was found (deep scans)
     warnings:      List[str] = field(default_factory=list)
 
     @property
@@ -45,7 +54,8 @@ class DiscoveredVariant:
     image_path:   Optional[str]
     uv_map_paths: List[str] = field(default_factory=list)
     from_zip:     bool = False
-    temp_dir:     Optional[str] = None
+    archive_path: Optional[str] = None
+    origin:       str = ""
     warnings:     List[str] = field(default_factory=list)
 
     @property
@@ -57,44 +67,81 @@ class DiscoveredVariant:
         return f"vehicles/{self.carid}/SKINNAME_{self.suffix}/"
 
 
-ScanResult = Tuple[List[DiscoveredVehicle], List[DiscoveredVariant], Optional[str]]
+ScanResult = Tuple[List[DiscoveredVehicle], List[DiscoveredVariant]]
+ScanItem   = Union[DiscoveredVehicle, DiscoveredVariant]
 
 
-def scan_mod(path: str, known_carids: Optional[set] = None) -> ScanResult:
+def scan_mod(path: str, known_carids: Optional[set] = None, deep: bool = False) -> ScanResult:
     """
     Scan a BeamNG mod (zip or folder) for vehicles and variants.
-    Returns (vehicles, variants, temp_dir).
-    temp_dir is set for zip inputs and must be deleted by the caller.
+    Returns (vehicles, variants).  See iter_scan_mod for deep.
+    """
+    vehicles: List[DiscoveredVehicle] = []
+    variants: List[DiscoveredVariant] = []
+
+    for item in iter_scan_mod(path, known_carids, deep=deep):
+        if isinstance(item, DiscoveredVariant):
+            variants.append(item)
+        else:
+            vehicles.append(item)
+
+    return vehicles, variants
+
+
+def iter_scan_mod(
+    path: str,
+    known_carids: Optional[set] = None,
+    deep: bool = False,
+    max_workers: Optional[int] = None,
+) -> Iterator[ScanItem]:
+    """
+    Streaming variant of scan_mod: yield each DiscoveredVehicle /
+    DiscoveredVariant as soon as its car folder has been resolved.
+
+    ZIPs are scanned straight from their central directory — nothing is
+    extracted.  Items found in a zip carry ``archive_path`` and their
+    json/jbeam/image/uv paths are member names inside that archive; read
+    them through open_mod_source(item.archive_path).
+
+    deep=True is the mod-pack mode: every vehicles/ root is scanned, not
+    just the first, including roots inside zips nested in the source.
+    Roots are scanned on a thread pool; items still stream per car folder,
+    and each item's origin names the archive chain / folder it came from.
+    When the same vehicle or variant appears in several roots the first
+    one wins.
     """
     if not os.path.exists(path):
-        return [], [], None
+        return
+
+    if deep:
+        yield from _iter_scan_pack(path, known_carids, max_workers)
+        return
 
     if os.path.isfile(path):
         if zipfile.is_zipfile(path):
-            return _scan_zip(path, known_carids)
-        return [], [], None
+            yield from _iter_scan_zip(path, known_carids)
+        return
 
     if os.path.isdir(path):
-        vehicles, variants = _scan_folder(path, known_carids)
-        return vehicles, variants, None
-
-    return [], [], None
+        yield from _iter_scan_folder(_OS_FS, path, known_carids)
 
 
 def scan_mod_for_multiselect(
     path: str,
     known_carids: Optional[set] = None,
+    deep: bool = False,
 ) -> dict:
     """
     Scan a mod and return a dict ready for a multi-select UI.
 
     Each item in "vehicles" / "variants" has:
         key, type, carid, display_name, json_path, jbeam_path,
-        image_path, uv_map_paths, ready, warnings, from_zip, temp_dir
+        image_path, uv_map_paths, ready, warnings, from_zip, archive_path,
+        origin
 
-    Caller must shutil.rmtree(result["temp_dir"]) when done if it's not None.
+    When archive_path is set the *_path values are member names inside it.
     """
-    vehicles_raw, variants_raw, temp_dir = scan_mod(path, known_carids)
+    vehicles_raw, variants_raw = scan_mod(path, known_carids, deep=deep)
 
     vehicles_out: List[dict] = []
     variants_out: List[dict] = []
@@ -112,7 +159,8 @@ def scan_mod_for_multiselect(
             "ready":        v.ready,
             "warnings":     v.warnings,
             "from_zip":     v.from_zip,
-            "temp_dir":     v.temp_dir,
+            "archive_path": v.archive_path,
+            "origin":       v.origin,
         })
 
     for var in variants_raw:
@@ -129,7 +177,8 @@ def scan_mod_for_multiselect(
             "ready":        var.ready,
             "warnings":     var.warnings,
             "from_zip":     var.from_zip,
-            "temp_dir":     var.temp_dir,
+            "archive_path": var.archive_path,
+            "origin":       var.origin,
         })
 
     all_items   = vehicles_out + variants_out
@@ -138,47 +187,290 @@ def scan_mod_for_multiselect(
     return {
         "vehicles":    vehicles_out,
         "variants":    variants_out,
-        "temp_dir":    temp_dir,
         "ready_count": ready_count,
         "total_count": len(all_items),
     }
 
 
-def _scan_zip(zip_path: str, known_carids: Optional[set]) -> ScanResult:
-    tmp = tempfile.mkdtemp(prefix="bss_scan_")
+# ─────────────────────────────────────────────────────────────────────────────
+# Mod sources — the scanner walks folders and zip archives through the same
+# small filesystem interface, so a zip never has to be extracted to be scanned.
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _OsFs:
+    """Plain filesystem access."""
+
+    archive_path: Optional[str] = None
+
+    join     = staticmethod(os.path.join)
+    basename = staticmethod(os.path.basename)
+    isfile   = staticmethod(os.path.isfile)
+    isdir    = staticmethod(os.path.isdir)
+    listdir  = staticmethod(os.listdir)
+    walk     = staticmethod(os.walk)
+
+    @staticmethod
+    def read_text(path: str, limit: int = -1) -> str:
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+            return f.read(limit)
+
+    @staticmethod
+    def copy_to(path: str, dest: str) -> None:
+        shutil.copy2(path, dest)
+
+    @staticmethod
+    def stamp(path: str) -> Tuple[int, int]:
+        """Cheap change marker: (size, mtime_ns)."""
+        st = os.stat(path)
+        return st.st_size, st.st_mtime_ns
+
+    @staticmethod
+    def jbeam_index(path: str) -> Optional[JbeamIndex]:
+        return index_jbeam(path)
+
+
+_OS_FS = _OsFs()
+
+
+class _ZipFs:
+    """
+    Read-only view of a ZipFile built from its central directory.
+    Paths are posix-style member names; lookups are case-insensitive like
+    the Windows filesystem the scanner rules were written against.
+    """
+
+    def __init__(self, zf: zipfile.ZipFile, archive_path: str):
+        self._zf          = zf
+        self.archive_path = archive_path
+        self._files: Dict[str, zipfile.ZipInfo] = {}       # lower path → info
+        self._dirs:  Dict[str, Tuple[Dict[str, str], List[str]]] = {"": ({}, [])}
+
+        for info in zf.infolist():
+            name = info.filename.replace("\\", "/").strip("/")
+            if not name:
+                continue
+            parts = name.split("/")
+            if info.is_dir():
+                self._add_dir(parts)
+                continue
+            parent = self._add_dir(parts[:-1])
+            self._dirs[parent][1].append(parts[-1])
+            self._files[name.lower()] = info
+
+    def _add_dir(self, parts: List[str]) -> str:
+        """Register every directory along parts; return the lower-cased key."""
+        key = ""
+        for part in parts:
+            child = f"{key}/{part.lower()}" if key else part.lower()
+            if child not in self._dirs:
+                self._dirs[key][0][part.lower()] = part
+                self._dirs[child] = ({}, [])
+            key = child
+        return key
+
+    @staticmethod
+    def join(*parts: str) -> str:
+        return posixpath.join(*parts)
+
+    @staticmethod
+    def basename(path: str) -> str:
+        return posixpath.basename(path)
+
+    def isfile(self, path: str) -> bool:
+        return path.lower() in self._files
+
+    def isdir(self, path: str) -> bool:
+        return path.strip("/").lower() in self._dirs
+
+    def listdir(self, path: str) -> List[str]:
+        entry = self._dirs.get(path.strip("/").lower())
+        if entry is None:
+            raise FileNotFoundError(path)
+        return list(entry[0].values()) + list(entry[1])
+
+    def walk(self, top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """Top-down walk with the same contract as os.walk (dirnames prunable)."""
+        entry = self._dirs.get(top.strip("/").lower())
+        if entry is None:
+            return
+        dirnames  = sorted(entry[0].values())
+        filenames = list(entry[1])
+        yield top, dirnames, filenames
+        for d in dirnames:
+            yield from self.walk(posixpath.join(top, d))
+
+    def info(self, path: str) -> zipfile.ZipInfo:
+        try:
+            return self._files[path.lower()]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def read_bytes(self, path: str, limit: int = -1) -> bytes:
+        with self._zf.open(self.info(path)) as f:
+            return f.read(limit)
+
+    def read_text(self, path: str, limit: int = -1) -> str:
+        return self.read_bytes(path, limit).decode("utf-8-sig", errors="replace")
+
+    def copy_to(self, path: str, dest: str) -> None:
+        with self._zf.open(self.info(path)) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    def stamp(self, path: str) -> Tuple[int, int]:
+        """Cheap change marker from the central directory: (size, CRC-32)."""
+        info = self.info(path)
+        return info.file_size, info.CRC
+
+    def jbeam_index(self, path: str) -> Optional[JbeamIndex]:
+        info = self.info(path)
+        return index_jbeam_cached(
+            f"{os.path.abspath(self.archive_path)}::{info.filename}",
+            (info.file_size, info.CRC),
+            lambda: self.read_text(path),
+            path,
+        )
+
+
+_ModFs = Union[_OsFs, _ZipFs]
+
+
+@contextmanager
+def open_mod_source(archive_path: Optional[str] = None) -> Iterator[_ModFs]:
+    """
+    Open the source a scanned item's paths refer to.  With no archive_path
+    the paths are plain filesystem paths; otherwise they are members of
+    that zip.  A nested archive is addressed as "outer.zip::inner.zip" and
+    is opened in memory.  The returned object offers isfile / read_text /
+    copy_to.
+    """
+    if not archive_path:
+        yield _OS_FS
+        return
+    outer, *members = archive_path.split(ARCHIVE_SEP)
+    nested = _batch_nested
+    with ExitStack() as stack:
+        zf = stack.enter_context(zipfile.ZipFile(outer, "r"))
+        fs = _ZipFs(zf, outer)
+        for i, member in enumerate(members):
+            chain = ARCHIVE_SEP.join([outer] + members[:i + 1])
+            if nested is not None:
+                if chain not in nested:
+                    nested.put(chain, fs, member)
+                zf = stack.enter_context(nested.open(chain))
+            else:
+                zf = stack.enter_context(zipfile.ZipFile(io.BytesIO(fs.read_bytes(member)), "r"))
+            fs = _ZipFs(zf, chain)
+        yield fs
+
+
+@contextmanager
+def mod_source_batch() -> Iterator[None]:
+    """
+    While active (on any thread), nested archives opened through
+    open_mod_source are decompressed once and reused, instead of once per
+    call.  Wrap a batch import in it: every item of a mod pack reads the
+    same nested zip.  Re-entrant; the cache is dropped when the outermost
+    batch ends.
+    """
+    global _batch_nested, _batch_depth
+    with _batch_lock:
+        if _batch_depth == 0:
+            _batch_nested = _NestedArchives()
+        _batch_depth += 1
     try:
-        with zipfile.ZipFile(zip_path, "r") as z:
-            z.extractall(tmp)
+        yield
+    finally:
+        with _batch_lock:
+            _batch_depth -= 1
+            done = _batch_nested if _batch_depth == 0 else None
+            if done is not None:
+                _batch_nested = None
+        if done is not None:
+            done.close()
+
+
+class _NestedArchives:
+    """
+    Decompressed nested archives by archive chain.  Small ones are kept in
+    memory; bigger ones are spilled to temporary files (removed by close()),
+    so a mod pack of large bundled zips doesn't have to fit in RAM.  Every
+    open() returns a new ZipFile, so threads never share a handle.
+    """
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._data: Dict[str, Union[bytes, str]] = {}     # bytes, or temp file path
+        self._files: List[str] = []
+
+    def __contains__(self, chain: str) -> bool:
+        with self._lock:
+            return chain in self._data
+
+    def put(self, chain: str, fs: "_ZipFs", member: str) -> None:
+        if fs.info(member).file_size <= _NESTED_SPILL_BYTES:
+            value: Union[bytes, str] = fs.read_bytes(member)
+        else:
+            fd, value = tempfile.mkstemp(prefix="bss_nested_", suffix=".zip")
+            os.close(fd)
+            with self._lock:
+                self._files.append(value)
+            fs.copy_to(member, value)
+        with self._lock:
+            self._data.setdefault(chain, value)
+
+    def discard(self, chain: str) -> None:
+        with self._lock:
+            self._data.pop(chain, None)
+
+    def open(self, chain: str) -> zipfile.ZipFile:
+        with self._lock:
+            value = self._data[chain]
+        return zipfile.ZipFile(io.BytesIO(value) if isinstance(value, bytes) else value, "r")
+
+    def close(self) -> None:
+        with self._lock:
+            files, self._files = self._files, []
+            self._data.clear()
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_batch_lock = threading.Lock()
+_batch_nested: Optional[_NestedArchives] = None
+_batch_depth  = 0
+
+
+def _iter_scan_zip(zip_path: str, known_carids: Optional[set]) -> Iterator[ScanItem]:
+    try:
+        zf = zipfile.ZipFile(zip_path, "r")
     except Exception as e:
-        print(f"[mod_scanner] Failed to extract ZIP: {e}")
-        shutil.rmtree(tmp, ignore_errors=True)
-        return [], [], None
-
-    vehicles, variants = _scan_folder(tmp, known_carids)
-    for v in vehicles:
-        v.from_zip = True
-        v.temp_dir = tmp
-    for v in variants:
-        v.from_zip = True
-        v.temp_dir = tmp
-    return vehicles, variants, tmp
-
-
-def _scan_folder(
-    root: str,
-    known_carids: Optional[set],
-) -> Tuple[List[DiscoveredVehicle], List[DiscoveredVariant]]:
-    vehicles_dir = _find_vehicles_dir(root)
+        print(f"[mod_scanner] Failed to open ZIP: {e}")
+        return
+
+    with zf:
+        fs = _ZipFs(zf, zip_path)
+        for item in _iter_scan_folder(fs, "", known_carids):
+            item.from_zip     = True
+            item.archive_path = zip_path
+            yield item
+
+
+def _iter_scan_folder(fs: _ModFs, root: str, known_carids: Optional[set]) -> Iterator[ScanItem]:
+    vehicles_dir = _find_vehicles_dir(fs, root)
     if not vehicles_dir:
-        return [], []
+        return
+    yield from _iter_scan_vehicles_dir(fs, vehicles_dir, known_carids)
 
-    vehicles: List[DiscoveredVehicle] = []
-    variants: List[DiscoveredVariant] = []
 
+def _iter_scan_vehicles_dir(fs: _ModFs, vehicles_dir: str,
+                            known_carids: Optional[set]) -> Iterator[ScanItem]:
     try:
-        entries = sorted(os.listdir(vehicles_dir))
+        entries = sorted(fs.listdir(vehicles_dir))
     except OSError:
-        return [], []
+        return
 
     _SKIP_EXACT    = {"common"}
     _SKIP_CONTAINS = {"traffic"}
@@ -187,36 +479,205 @@ def _scan_folder(
         lower = carid.lower()
         if lower in _SKIP_EXACT or any(kw in lower for kw in _SKIP_CONTAINS):
             continue
-        car_dir = os.path.join(vehicles_dir, carid)
-        if not os.path.isdir(car_dir):
+        car_dir = fs.join(vehicles_dir, carid)
+        if not fs.isdir(car_dir):
             continue
 
         is_known = known_carids is not None and carid in known_carids
 
         if is_known:
-            variants.extend(_scan_for_variants(carid, car_dir))
+            yield from _scan_for_variants(fs, carid, car_dir)
         else:
-            v = _scan_vehicle_dir(carid, car_dir)
+            v = _scan_vehicle_dir(fs, carid, car_dir)
             if v is not None:
-                vehicles.append(v)
-
-    return vehicles, variants
+                yield v
 
 
-def _find_vehicles_dir(root: str) -> Optional[str]:
+def _find_vehicles_dir(fs: _ModFs, root: str) -> Optional[str]:
     """Search the full tree for the first vehicles/ directory."""
-    for dirpath, _dirnames, _ in os.walk(root):
-        if os.path.basename(dirpath).lower() == "vehicles":
+    for dirpath, _dirnames, _ in fs.walk(root):
+        if fs.basename(dirpath).lower() == "vehicles":
             return dirpath
     return None
 
 
-def _scan_vehicle_dir(carid: str, car_dir: str) -> Optional[DiscoveredVehicle]:
-    json_path    = _find_skin_json(car_dir, carid)
-    jbeam_path   = _find_skin_jbeam(car_dir, carid)
-    image_path   = _find_preview_image(car_dir)
-    uv_map_paths = _find_uv_maps(car_dir)
-    display      = _read_display_name(car_dir, carid)
+# ─────────────────────────────────────────────────────────────────────────────
+# Mod packs (deep scan) — every vehicles/ root, zips nested inside the source
+# ─────────────────────────────────────────────────────────────────────────────
+
+ARCHIVE_SEP = "::"                      # outer.zip::inner.zip member chain
+
+_NESTED_MAX_DEPTH   = 3
+_NESTED_MAX_BYTES   = 512 * 1024 * 1024   # larger nested zips are skipped
+_NESTED_SPILL_BYTES = 32 * 1024 * 1024    # larger ones are kept in a temp file, not RAM
+_PACK_MAX_WORKERS   = 8
+
+
+@dataclass
+class _ScanRoot:
+    archive_path: Optional[str]   # None for plain folders
+    vehicles_dir: str
+    origin:       str
+
+
+def _iter_scan_pack(path: str, known_carids: Optional[set],
+                    max_workers: Optional[int]) -> Iterator[ScanItem]:
+    nested = _NestedArchives()     # nested archives found during discovery
+    try:
+        roots = _collect_scan_roots(path, nested)
+        if not roots:
+            return
+        print(f"[mod_scanner] Deep scan of '{os.path.basename(path)}': {len(roots)} vehicles/ root(s)")
+        yield from _iter_scan_roots(roots, known_carids, nested, max_workers)
+    finally:
+        nested.close()
+
+
+_ROOT_DONE = object()
+
+
+def _iter_scan_roots(roots: List[_ScanRoot], known_carids: Optional[set],
+                     nested: _NestedArchives, max_workers: Optional[int]) -> Iterator[ScanItem]:
+    """
+    Scan roots on a thread pool.  Each worker pushes items into its root's
+    queue as each car folder is resolved; the queues are drained in root
+    order, so the first root streams live and "first one wins" does not
+    depend on timing.
+    """
+    queues = [queue.Queue() for _ in roots]
+    stop   = threading.Event()
+
+    def _work(i: int, root: _ScanRoot) -> None:
+        try:
+            for item in _iter_scan_root(root, known_carids, nested):
+                if stop.is_set():
+                    break
+                queues[i].put(item)
+        finally:
+            queues[i].put(_ROOT_DONE)
+
+    seen: Dict[tuple, ScanItem] = {}
+    workers = max(1, min(max_workers or _PACK_MAX_WORKERS, len(roots)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mod-scan") as pool:
+        for i, root in enumerate(roots):
+            pool.submit(_work, i, root)
+        try:
+            for q in queues:
+                while True:
+                    item = q.get()
+                    if item is _ROOT_DONE:
+                        break
+                    if isinstance(item, DiscoveredVariant):
+                        key = (item.carid, item.suffix.lower())
+                    else:
+                        key = (item.carid,)
+                    first = seen.get(key)
+                    if first is not None:
+                        msg = f"Duplicate in {item.origin} ignored"
+                        print(f"[mod_scanner] {'+'.join(key)}: {msg}")
+                        first.warnings.append(msg)
+                        continue
+                    seen[key] = item
+                    yield item
+        finally:
+            stop.set()          # consumer stopped early — let the workers wind down
+
+
+def _iter_scan_root(root: _ScanRoot, known_carids: Optional[set],
+                    nested: _NestedArchives) -> Iterator[ScanItem]:
+    try:
+        with _open_scan_source(root.archive_path, nested) as fs:
+            for item in _iter_scan_vehicles_dir(fs, root.vehicles_dir, known_carids):
+                item.from_zip     = root.archive_path is not None
+                item.archive_path = root.archive_path
+                item.origin       = root.origin
+                yield item
+    except Exception as e:
+        print(f"[mod_scanner] Failed to scan {root.origin}: {e}")
+
+
+@contextmanager
+def _open_scan_source(archive_path: Optional[str], nested: _NestedArchives) -> Iterator[_ModFs]:
+    """Like open_mod_source, but nested archives come from the copies made
+    during discovery.  Every worker gets its own ZipFile handle."""
+    if archive_path and archive_path in nested:
+        with nested.open(archive_path) as zf:
+            yield _ZipFs(zf, archive_path)
+        return
+    with open_mod_source(archive_path) as fs:
+        yield fs
+
+
+def _collect_scan_roots(path: str, nested: _NestedArchives) -> List[_ScanRoot]:
+    label = os.path.basename(os.path.normpath(path))
+    if os.path.isdir(path):
+        return _find_scan_roots(_OS_FS, path, None, label, 0, nested)
+    try:
+        with zipfile.ZipFile(path, "r") as zf:
+            return _find_scan_roots(_ZipFs(zf, path), "", path, label, 0, nested)
+    except Exception as e:
+        print(f"[mod_scanner] Failed to open ZIP: {e}")
+        return []
+
+
+def _find_scan_roots(fs: _ModFs, top: str, archive_path: Optional[str], label: str,
+                     depth: int, nested: _NestedArchives) -> List[_ScanRoot]:
+    """Every vehicles/ directory under top, recursing into nested zips."""
+    roots: List[_ScanRoot] = []
+    for dirpath, dirnames, filenames in fs.walk(top):
+        dirnames.sort()
+        if fs.basename(dirpath).lower() == "vehicles":
+            if fs is _OS_FS:
+                rel = os.path.relpath(os.path.dirname(dirpath), top)
+            else:
+                rel = posixpath.dirname(dirpath)
+            origin = label if rel in ("", ".") else f"{label} › {rel}"
+            roots.append(_ScanRoot(archive_path, dirpath, origin))
+            dirnames[:] = []          # car folders are not searched further
+            continue
+
+        if depth >= _NESTED_MAX_DEPTH:
+            continue
+        for name in sorted(filenames):
+            if name.lower().endswith(".zip"):
+                roots.extend(_find_nested_roots(
+                    fs, fs.join(dirpath, name), archive_path, label, depth, nested))
+    return roots
+
+
+def _find_nested_roots(fs: _ModFs, member: str, archive_path: Optional[str], label: str,
+                       depth: int, nested: _NestedArchives) -> List[_ScanRoot]:
+    inner_label = f"{label} › {fs.basename(member)}"
+    try:
+        if fs is _OS_FS:
+            # A zip sitting in a scanned folder is just another archive on disk.
+            with zipfile.ZipFile(member, "r") as zf:
+                return _find_scan_roots(_ZipFs(zf, member), "", member,
+                                        inner_label, depth + 1, nested)
+
+        size = fs.info(member).file_size
+        if size > _NESTED_MAX_BYTES:
+            print(f"[mod_scanner] Skipping nested archive {inner_label} ({size // (1024 * 1024)} MB)")
+            return []
+        chain = f"{archive_path}{ARCHIVE_SEP}{member}"
+        nested.put(chain, fs, member)
+        with nested.open(chain) as zf:
+            roots = _find_scan_roots(_ZipFs(zf, chain), "", chain,
+                                     inner_label, depth + 1, nested)
+        if not roots:
+            nested.discard(chain)
+        return roots
+    except (zipfile.BadZipFile, OSError, RuntimeError) as e:
+        print(f"[mod_scanner] Could not open nested archive {inner_label}: {e}")
+        return []
+
+
+def _scan_vehicle_dir(fs: _ModFs, carid: str, car_dir: str) -> Optional[DiscoveredVehicle]:
+    json_path    = _find_skin_json(fs, car_dir, carid)
+    jbeam_path   = _find_skin_jbeam(fs, car_dir, carid)
+    image_path   = _find_preview_image(fs, car_dir)
+    uv_map_paths = _find_uv_maps(fs, car_dir)
+    display      = _read_display_name(fs, car_dir, carid)
 
     warnings: List[str] = []
     if not json_path:
@@ -235,12 +696,12 @@ def _scan_vehicle_dir(carid: str, car_dir: str) -> Optional[DiscoveredVehicle]:
     )
 
 
-def _scan_for_variants(carid: str, car_dir: str) -> List[DiscoveredVariant]:
+def _scan_for_variants(fs: _ModFs, carid: str, car_dir: str) -> List[DiscoveredVariant]:
     """Find variant JBEAMs/JSONs matching {carid}_{suffix}.* patterns."""
     results: List[DiscoveredVariant] = []
 
     try:
-        files = os.listdir(car_dir)
+        files = fs.listdir(car_dir)
     except OSError:
         return results
 
@@ -252,19 +713,19 @@ def _scan_for_variants(carid: str, car_dir: str) -> List[DiscoveredVariant]:
 
         if lower.endswith(".jbeam") and lower.startswith(f"{carid}_"):
             suffix = f[len(carid) + 1 : -6]
-            fpath = os.path.join(car_dir, f)
-            if _jbeam_is_skin(fpath):
+            fpath = fs.join(car_dir, f)
+            if _jbeam_is_skin(fs, fpath):
                 jbeam_by_suffix[suffix] = fpath
 
         if lower.endswith(".materials.json"):
             stem = f[: -len(".materials.json")]
             if "_" in stem:
                 suffix = stem.rsplit("_", 1)[-1]
-                json_by_suffix[suffix] = os.path.join(car_dir, f)
+                json_by_suffix[suffix] = fs.join(car_dir, f)
 
     all_suffixes = set(jbeam_by_suffix) | set(json_by_suffix)
     skip = {"main", "body", "base", "skin", "skins", "a", "b", "c"}
-    uv_maps = _find_uv_maps(car_dir)
+    uv_maps = _find_uv_maps(fs, car_dir)
 
     for suffix in sorted(all_suffixes):
         if suffix in skip or len(suffix) < 2:
@@ -274,49 +735,47 @@ def _scan_for_variants(carid: str, car_dir: str) -> List[DiscoveredVariant]:
             display_name=suffix.replace("_", " ").title(),
             json_path=json_by_suffix.get(suffix),
             jbeam_path=jbeam_by_suffix.get(suffix),
-            image_path=_find_preview_image(car_dir),
+            image_path=_find_preview_image(fs, car_dir),
             uv_map_paths=uv_maps,
         ))
 
     return results
 
 
-def _list_vehicle_files(car_dir: str, suffix: str) -> List[str]:
+def _list_vehicle_files(fs: _ModFs, car_dir: str, suffix: str) -> List[str]:
     """Return files matching suffix anywhere under car_dir (full recursive walk)."""
     results: List[str] = []
     suffix_lower = suffix.lower()
-    for dirpath, _dirs, filenames in os.walk(car_dir):
+    for dirpath, _dirs, filenames in fs.walk(car_dir):
         for fn in sorted(filenames):
             if fn.lower().endswith(suffix_lower):
-                results.append(os.path.join(dirpath, fn))
+                results.append(fs.join(dirpath, fn))
     return results
 
 
-def _json_is_skin_materials(path: str) -> bool:
+def _json_is_skin_materials(fs: _ModFs, path: str) -> bool:
     """Check first 4 KB for .skin. key patterns."""
     try:
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            chunk = f.read(4096)
-        import re as _re
-        return bool(_re.search(r'"[^"]*\.skin\.[^"]*"', chunk))
-    except OSError:
+        chunk = fs.read_text(path, 4096)
+    except (OSError, zipfile.BadZipFile):
         return False
+    return bool(_SKIN_KEY_RE.search(chunk))
 
 
-def _find_skin_jsons_in_skins_dir(car_dir: str) -> List[str]:
+def _find_skin_jsons_in_skins_dir(fs: _ModFs, car_dir: str) -> List[str]:
     """Recursively collect *.materials.json files from vehicles/{carid}/skins/."""
     results: List[str] = []
-    skins_dir = os.path.join(car_dir, "skins")
-    if not os.path.isdir(skins_dir):
+    skins_dir = fs.join(car_dir, "skins")
+    if not fs.isdir(skins_dir):
         return results
-    for dirpath, _dirs, filenames in os.walk(skins_dir):
+    for dirpath, _dirs, filenames in fs.walk(skins_dir):
         for fn in sorted(filenames):
             if fn.lower().endswith(".materials.json"):
-                results.append(os.path.join(dirpath, fn))
+                results.append(fs.join(dirpath, fn))
     return results
 
 
-def _find_skin_json(car_dir: str, carid: str) -> Optional[str]:
+def _find_skin_json(fs: _ModFs, car_dir: str, carid: str) -> Optional[str]:
     """
     Find the best skin materials JSON. Priority:
     1. skins/*/skin.materials.json (validated)
@@ -325,12 +784,12 @@ def _find_skin_json(car_dir: str, carid: str) -> Optional[str]:
     4. Any *.materials.json (validated)
     5. main.materials.json (last resort)
     """
-    skins_jsons = _find_skin_jsons_in_skins_dir(car_dir)
+    skins_jsons = _find_skin_jsons_in_skins_dir(fs, car_dir)
     for p in skins_jsons:
-        if os.path.basename(p).lower() == "skin.materials.json" and _json_is_skin_materials(p):
+        if fs.basename(p).lower() == "skin.materials.json" and _json_is_skin_materials(fs, p):
             return p
     for p in skins_jsons:
-        if _json_is_skin_materials(p):
+        if _json_is_skin_materials(fs, p):
             return p
     if skins_jsons:
         return skins_jsons[0]
@@ -341,23 +800,23 @@ def _find_skin_json(car_dir: str, carid: str) -> Optional[str]:
         f"{carid}.skin.materials.json",
         f"{carid}.materials.json",
     ]
-    for root in [car_dir, os.path.join(car_dir, "materials")]:
+    for root in [car_dir, fs.join(car_dir, "materials")]:
         for name in named_candidates:
-            p = os.path.join(root, name)
-            if os.path.isfile(p):
+            p = fs.join(root, name)
+            if fs.isfile(p):
                 return p
 
-    all_json = _list_vehicle_files(car_dir, ".materials.json")
-    non_main = [p for p in all_json if os.path.basename(p).lower() != "main.materials.json"]
+    all_json = _list_vehicle_files(fs, car_dir, ".materials.json")
+    non_main = [p for p in all_json if fs.basename(p).lower() != "main.materials.json"]
 
     for p in non_main:
-        if "skin" in os.path.basename(p).lower() and _json_is_skin_materials(p):
+        if "skin" in fs.basename(p).lower() and _json_is_skin_materials(fs, p):
             return p
     for p in non_main:
-        if _json_is_skin_materials(p):
+        if _json_is_skin_materials(fs, p):
             return p
     for p in all_json:
-        if os.path.basename(p).lower() == "main.materials.json":
+        if fs.basename(p).lower() == "main.materials.json":
             return p
     if all_json:
         return all_json[0]
@@ -365,7 +824,7 @@ def _find_skin_json(car_dir: str, carid: str) -> Optional[str]:
     return None
 
 
-def _find_skin_jbeam(car_dir: str, carid: str) -> Optional[str]:
+def _find_skin_jbeam(fs: _ModFs, car_dir: str, carid: str) -> Optional[str]:
     """Find the best skin JBEAM. Checks named candidates, then walks the tree."""
     candidates = [
         f"{carid}_skins.jbeam",
@@ -375,19 +834,19 @@ def _find_skin_jbeam(car_dir: str, carid: str) -> Optional[str]:
         "main.jbeam",
         f"{carid}.jbeam",
     ]
-    for root in [car_dir, os.path.join(car_dir, "jbeams")]:
+    for root in [car_dir, fs.join(car_dir, "jbeams")]:
         for name in candidates:
-            p = os.path.join(root, name)
-            if os.path.isfile(p) and _jbeam_is_skin(p):
+            p = fs.join(root, name)
+            if fs.isfile(p) and _jbeam_is_skin(fs, p):
                 return p
 
-    all_jbeam = _list_vehicle_files(car_dir, ".jbeam")
+    all_jbeam = _list_vehicle_files(fs, car_dir, ".jbeam")
 
     for p in all_jbeam:
-        if "skin" in os.path.basename(p).lower() and _jbeam_is_skin(p):
+        if "skin" in fs.basename(p).lower() and _jbeam_is_skin(fs, p):
             return p
     for p in all_jbeam:
-        if _jbeam_is_skin(p):
+        if _jbeam_is_skin(fs, p):
             return p
     if all_jbeam:
         return all_jbeam[0]
@@ -395,15 +854,14 @@ def _find_skin_jbeam(car_dir: str, carid: str) -> Optional[str]:
     return None
 
 
-def _jbeam_is_skin(path: str) -> bool:
-    try:
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read(8192)
-        return "paint_design" in content
-    except OSError:
-        return False
+def _jbeam_is_skin(fs: _ModFs, path: str) -> bool:
+    """True if any part in the file is a skin part (see JbeamPart.is_skin)."""
+    index = fs.jbeam_index(path)
+    return bool(index and index.is_skin)
 
 
+_SKIN_KEY_RE = re.compile(r'"[^"]*\.skin\.[^"]*"')
+
 _UV_KEYWORDS = ("uv", "uvmap", "uv_map", "uv_layout", "uv1_layout")
 _UV_EXTS     = (".dds", ".png", ".jpg", ".jpeg", ".pdn")
 
@@ -425,12 +883,12 @@ _UV_FUNC_KEYWORDS = (
 _UV_MAX_UNDERSCORES = 3
 
 
-def _find_uv_maps(car_dir: str) -> List[str]:
+def _find_uv_maps(fs: _ModFs, car_dir: str) -> List[str]:
     """Return UV layout template images, filtering out typed/functional textures."""
     results: List[str] = []
     seen: set = set()
 
-    for dirpath, _dirs, filenames in os.walk(car_dir):
+    for dirpath, _dirs, filenames in fs.walk(car_dir):
         for fn in sorted(filenames):
             lower = fn.lower()
 
@@ -451,7 +909,7 @@ def _find_uv_maps(car_dir: str) -> List[str]:
             if stem.count("_") > _UV_MAX_UNDERSCORES:
                 continue
 
-            full_path = os.path.join(dirpath, fn)
+            full_path = fs.join(dirpath, fn)
             if full_path not in seen:
                 seen.add(full_path)
                 results.append(full_path)
@@ -459,36 +917,28 @@ def _find_uv_maps(car_dir: str) -> List[str]:
     return sorted(results)
 
 
-def _find_preview_image(car_dir: str) -> Optional[str]:
+def _find_preview_image(fs: _ModFs, car_dir: str) -> Optional[str]:
     for name in ("default.jpg", "default.jpeg", "default.png"):
-        p = os.path.join(car_dir, name)
-        if os.path.isfile(p):
+        p = fs.join(car_dir, name)
+        if fs.isfile(p):
             return p
     try:
-        for f in sorted(os.listdir(car_dir)):
+        for f in sorted(fs.listdir(car_dir)):
             if f.lower().endswith((".jpg", ".jpeg")):
-                return os.path.join(car_dir, f)
+                return fs.join(car_dir, f)
     except OSError:
         pass
     return None
 
 
-def _strip_json_comments(text: str) -> str:
-    """Strip // comments, trailing commas, and missing commas between entries."""
-    text = re.sub(r'(?<!:)//[^\n]*', '', text)
-    text = re.sub(r',(\s*[}\]])', r'\1', text)
-    # Insert missing commas: value/closing-bracket on one line, quoted key on next
-    text = re.sub(r'(["\d\w\]}])\s*\n(\s*")', r'\1,\n\2', text)
-    return text
-
-
-def _read_display_name(car_dir: str, carid: str) -> str:
+def _read_display_name(fs: _ModFs, car_dir: str, carid: str) -> str:
     """Read display name from info.json (Brand + Name), or prettify carid."""
     candidates: List[str] = []
     try:
-        for entry in os.scandir(car_dir):
-            if entry.name.lower() == "info.json" and entry.is_file():
-                candidates.append(entry.path)
+        for name in fs.listdir(car_dir):
+            p = fs.join(car_dir, name)
+            if name.lower() == "info.json" and fs.isfile(p):
+                candidates.append(p)
     except OSError:
         pass
 
@@ -496,9 +946,7 @@ def _read_display_name(car_dir: str, carid: str) -> str:
 
     if p:
         try:
-            with open(p, "r", encoding="utf-8-sig") as f:
-                raw = f.read()
-            data  = json.loads(_strip_json_comments(raw))
+            data  = lenient_json.loads(fs.read_text(p))
             brand = (data.get("Brand") or data.get("brand") or "").strip()
             name  = (data.get("Name")  or data.get("name")  or "").strip()
             if brand and name:
@@ -0,0 +1,226 @@
+"""
+core/rough_met.py — Build rough_met.png from separate maps.
+
+_inject_rough_met() points both metallicMap and roughnessMap of every
+material at a single rough_met.png, so the two (and an optional clear-coat
+mask) have to be packed into one image.  Channel layout — glTF's
+metallic-roughness convention, with clear coat in the otherwise unused red
+channel:
+
+    R  clear coat     G  roughness     B  metallic     A  255
+
+Two ways to build one:
+
+  compose_rough_met()            one greyscale map (or a constant 0..1)
+                                 per channel
+  compose_rough_met_from_mask()  a material-ID mask plus roughness /
+                                 metallic / clear coat values per ID colour
+
+Both work on whole arrays with NumPy.  The mask path compares whole
+texels as uint32 in row bands, so temporaries stay small even for 8k
+maps; PNG decode/encode is most of the remaining time.  Maps of different
+sizes are resampled to the largest one.
+
+    compose_rough_met("rough_met.png", "rough.png", "metal.png", clearcoat=0.0)
+"""
+from __future__ import annotations
+
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    from PIL import Image
+    _DEPS_OK = True
+except ImportError as _e:
+    print(f"[DEBUG] rough_met: numpy/Pillow not available: {_e}")
+    _DEPS_OK = False
+
+CLEARCOAT, ROUGHNESS, METALLIC = 0, 1, 2       # channel index of each value
+
+Source   = Union[str, float, None]             # map path or constant in 0..1
+Values   = Tuple[float, float, float]          # (roughness, metallic, clear coat)
+MaskId   = Union[str, int, Tuple[int, int, int]]
+
+DEFAULT_VALUES: Values = (0.7, 0.0, 0.0)
+_BAND_ROWS = 512
+_PNG_LEVEL = 1         # zlib level: large maps save many times faster than at 6
+
+
+class RoughMetError(Exception):
+    pass
+
+
+def available() -> bool:
+    return _DEPS_OK
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Separate maps
+# ─────────────────────────────────────────────────────────────────────────────
+
+def compose_rough_met(dest: str, roughness: Source, metallic: Source,
+                      clearcoat: Source = None,
+                      size: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+    """
+    Pack roughness / metallic / clear coat into dest.  Each source is a
+    greyscale image path or a constant 0..1 (None → DEFAULT_VALUES).
+    size defaults to the largest input map.  Returns the (width, height)
+    written.
+    """
+    _require()
+    sources = {ROUGHNESS: roughness, METALLIC: metallic, CLEARCOAT: clearcoat}
+    images  = {ch: _open(src) for ch, src in sources.items() if isinstance(src, str) and src}
+    if size is None:
+        if not images:
+            raise RoughMetError("At least one roughness, metallic or clear coat map is needed")
+        size = max((im.size for im in images.values()), key=lambda s: s[0] * s[1])
+    w, h = size
+
+    out = np.empty((h, w, 4), dtype=np.uint8)
+    out[:, :, 3] = 255
+    defaults = {ROUGHNESS: DEFAULT_VALUES[0], METALLIC: DEFAULT_VALUES[1], CLEARCOAT: DEFAULT_VALUES[2]}
+    for ch, src in sources.items():
+        if ch in images:
+            out[:, :, ch] = _grey(images[ch], size)
+        else:
+            out[:, :, ch] = _to_byte(defaults[ch] if src is None or src == "" else float(src))
+
+    _save(out, dest)
+    print(f"[DEBUG] rough_met: composed {w}x{h} from {len(images)} map(s) → {dest}")
+    return w, h
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Material-ID mask
+# ─────────────────────────────────────────────────────────────────────────────
+
+def parse_mask_id(key: MaskId) -> Tuple[int, int, int]:
+    """'#rrggbb', (r, g, b) or a grey level 0..255 → (r, g, b)."""
+    if isinstance(key, int):
+        return key, key, key
+    if isinstance(key, str):
+        text = key.strip().lstrip("#")
+        if len(text) != 6:
+            raise RoughMetError(f"Bad mask colour {key!r} (expected #rrggbb)")
+        return int(text[0:2], 16), int(text[2:4], 16), int(text[4:6], 16)
+    r, g, b = key
+    return int(r), int(g), int(b)
+
+
+def mask_ids(mask_path: str, limit: int = 32, sample: int = 1024) -> List[Tuple[Tuple[int, int, int], float]]:
+    """
+    Distinct colours of a material mask with their share of the image,
+    most common first.  Counted on a downsampled copy, so very small
+    regions may be missed; at most `limit` colours are returned.
+    """
+    _require()
+    Image.MAX_IMAGE_PIXELS = None
+    with Image.open(mask_path) as im:
+        if max(im.size) > sample:
+            im = im.resize(_fit(im.size, sample), Image.Resampling.NEAREST)
+        rgb = np.asarray(im.convert("RGB")).reshape(-1, 3)
+    colours, counts = np.unique(rgb, axis=0, return_counts=True)
+    order = np.argsort(-counts)[:limit]
+    total = float(len(rgb))
+    return [(tuple(int(c) for c in colours[i]), counts[i] / total) for i in order]
+
+
+def compose_rough_met_from_mask(dest: str, mask_path: str,
+                                values: Dict[MaskId, Values],
+                                default: Values = DEFAULT_VALUES) -> Tuple[int, int]:
+    """
+    Fill each region of a material-ID mask with its (roughness, metallic,
+    clear coat) values; colours not in `values` get `default`.
+    """
+    _require()
+    Image.MAX_IMAGE_PIXELS = None
+    with Image.open(mask_path) as im:
+        rgba = np.asarray(im.convert("RGBA"))
+    h, w = rgba.shape[:2]
+
+    # Work on whole texels as little-endian uint32 (r | g << 8 | b << 16 | a << 24):
+    # one compare per material instead of per-channel lookups.
+    texels = rgba.view(np.uint32).reshape(h, w)
+    ids    = {_key32(parse_mask_id(k)): _value32(v) for k, v in values.items()}
+
+    out   = np.empty((h, w, 4), dtype=np.uint8)
+    out32 = out.view(np.uint32).reshape(h, w)
+    out32.fill(_value32(default))
+    for top in range(0, h, _BAND_ROWS):
+        band = texels[top:top + _BAND_ROWS] & np.uint32(0x00FFFFFF)
+        dst  = out32[top:top + _BAND_ROWS]
+        for key, value in ids.items():
+            dst[band == key] = value
+
+    _save(out, dest)
+    print(f"[DEBUG] rough_met: composed {w}x{h} from mask {os.path.basename(mask_path)} "
+          f"({len(ids)} material(s))")
+    return w, h
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _require() -> None:
+    if not _DEPS_OK:
+        raise RoughMetError("Composing rough_met maps needs numpy and Pillow")
+
+
+def _open(path: str):
+    if not os.path.isfile(path):
+        raise RoughMetError(f"Map not found: {path}")
+    Image.MAX_IMAGE_PIXELS = None     # 8k/16k maps are normal here
+    try:
+        im = Image.open(path)
+        im.load()
+        return im
+    except Exception as e:
+        raise RoughMetError(f"Could not read {os.path.basename(path)}: {e}") from e
+
+
+def _grey(im, size: Tuple[int, int]):
+    """Image → (h, w) uint8 array at size.  16-bit maps keep their top byte."""
+    if im.mode in ("I;16", "I;16B", "I;16L", "I"):
+        arr = np.asarray(im, dtype=np.uint32)
+        im  = Image.fromarray((arr >> 8).clip(0, 255).astype(np.uint8), "L")
+    elif im.mode != "L":
+        im = im.convert("L")
+    if im.size != tuple(size):
+        im = im.resize(size, Image.Resampling.BILINEAR)
+    return np.asarray(im)
+
+
+def _fit(size: Tuple[int, int], limit: int) -> Tuple[int, int]:
+    scale = limit / max(size)
+    return max(1, int(size[0] * scale)), max(1, int(size[1] * scale))
+
+
+def _to_byte(v: float) -> int:
+    return int(round(min(1.0, max(0.0, v)) * 255))
+
+
+def _texel(v: Sequence[float]) -> Tuple[int, int, int, int]:
+    rough, metal, coat = (list(v) + [0.0, 0.0, 0.0])[:3]
+    px = [0, 0, 0, 255]
+    px[ROUGHNESS], px[METALLIC], px[CLEARCOAT] = _to_byte(rough), _to_byte(metal), _to_byte(coat)
+    return tuple(px)
+
+
+def _key32(rgb: Tuple[int, int, int]) -> int:
+    return rgb[0] | (rgb[1] << 8) | (rgb[2] << 16)
+
+
+def _value32(v: Sequence[float]) -> int:
+    r, g, b, a = _texel(v)
+    return r | (g << 8) | (b << 16) | (a << 24)
+
+
+def _save(arr, dest: str) -> None:
+    folder = os.path.dirname(dest)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = dest + ".tmp"
+    Image.fromarray(arr, "RGBA").save(tmp, format="PNG", compress_level=_PNG_LEVEL)
+    os.replace(tmp, dest)
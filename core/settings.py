@@ -27,20 +27,14 @@ def save_settings():
     with open(SETTINGS_FILE, "w") as f:
         json.dump(app_settings, f, indent=4)
 
+from utils.vehicle_catalog import catalog as _vehicle_catalog
+
 ADDED_VEHICLES_FILE = "vehicles/added_vehicles.json"
-added_vehicles = {}
 
 os.makedirs("vehicles", exist_ok=True)
 
-if not os.path.exists(ADDED_VEHICLES_FILE):
-    with open(ADDED_VEHICLES_FILE, "w") as f:
-        json.dump({}, f)
-
-with open(ADDED_VEHICLES_FILE, "r") as f:
-    try:
-        added_vehicles = json.load(f)
-    except:
-        added_vehicles = {}
+# Live mirror of the catalog's vehicle entries (gui.state keeps it in sync).
+added_vehicles = _vehicle_catalog.vehicles()
 
 def show_wip_warning(app=None, force=False):
     """Show WIP warning on first launch using CustomTkinter
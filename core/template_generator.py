@@ -0,0 +1,281 @@
+"""
+core/template_generator.py — Regenerate base-game SKINNAME templates.
+
+Every base-game vehicle ships as <install>/content/vehicles/<carid>.zip.
+regenerate_base_templates() reads those archives through their central
+directory (nothing is extracted), locates each vehicle's skin materials
+and jbeam with the same rules the mod scanner uses, and rebuilds
+vehicles/<carid>/SKINNAME/ through edit_material_json / edit_jbeam_material.
+All vehicles are processed at once on a worker pool; each result says
+whether the template on disk was created, updated or already current.
+Vehicles whose materials member has the same size and CRC as when their
+template was last generated are skipped without being decompressed.
+
+Templates this module did not generate (the hand-authored ones shipped
+with the app) are left alone unless force is set.  A rebuild only swaps
+the materials file: an existing jbeam keeps its name and parts, and a new
+template gets a generic <carid>.jbeam.
+
+    python -m core.template_generator [<beamng install>] [--dry-run] [--force]
+"""
+from __future__ import annotations
+
+import glob
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+
+from core import template_sources
+from core.mod_scanner import DiscoveredVehicle, iter_scan_mod, open_mod_source
+from utils.file_ops import (VEHICLE_FOLDER, edit_jbeam_material, edit_material_json,
+                            install_template, materials_output_name, template_files)
+
+CREATED   = "created"
+UPDATED   = "updated"
+UNCHANGED = "unchanged"
+SKIPPED   = "skipped"
+FAILED    = "failed"
+
+_MAX_WORKERS = 4
+
+
+@dataclass
+class TemplateResult:
+    carid:         str
+    display_name:  str
+    status:        str
+    source_zip:    str = ""
+    changed_files: List[str] = field(default_factory=list)
+    message:       str = ""
+
+    @property
+    def changed(self) -> bool:
+        return self.status in (CREATED, UPDATED)
+
+
+def find_content_zips(install_path: str) -> List[str]:
+    """<install>/content/vehicles/*.zip, sorted by name."""
+    return sorted(glob.glob(os.path.join(install_path, "content", "vehicles", "*.zip")))
+
+
+def regenerate_base_templates(
+    install_path: Optional[str] = None,
+    only: Optional[Iterable[str]] = None,
+    dry_run: bool = False,
+    force: bool = False,
+    register_new: bool = True,
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[TemplateResult], None]] = None,
+) -> List[TemplateResult]:
+    """
+    Rebuild the SKINNAME template of every base-game vehicle.
+
+    install_path : BeamNG.drive install folder (defaults to the configured one)
+    only         : restrict to these carids
+    dry_run      : report what would change without touching vehicles/
+    force        : also rebuild templates this module did not generate
+    register_new : add vehicles missing from core.config.VEHICLE_IDS to the
+                   vehicle catalog so their new templates show up in the app
+    on_result    : called from the worker threads as each vehicle finishes
+
+    Returns one TemplateResult per vehicle found, sorted by carid.
+    """
+    if install_path is None:
+        from core.settings import get_beamng_install_path
+        install_path = get_beamng_install_path()
+    zips = find_content_zips(install_path) if install_path else []
+    if not zips:
+        print(f"[WARNING] No vehicle content zips found under '{install_path}'")
+        return []
+
+    wanted = {c.lower() for c in only} if only else None
+    if wanted is not None:
+        # Base-game zips are named after their carid; skip the rest unopened.
+        zips = [z for z in zips if _zip_stem(z) in wanted] or zips
+
+    print(f"[DEBUG] Regenerating templates from {len(zips)} content zip(s)"
+          f"{' (dry run)' if dry_run else ''}")
+
+    records: dict = {}    # carid → provenance of templates verified this run
+
+    def _run(zip_path: str) -> List[TemplateResult]:
+        results = _process_zip(zip_path, wanted, dry_run, force, records)
+        if on_result is not None:
+            for r in results:
+                on_result(r)
+        return results
+
+    results: List[TemplateResult] = []
+    workers = max(1, min(max_workers or _MAX_WORKERS, len(zips)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="templates") as pool:
+        for batch in pool.map(_run, zips):
+            results.extend(batch)
+
+    results.sort(key=lambda r: r.carid)
+    if not dry_run:
+        if records:
+            from utils.vehicle_catalog import catalog
+            catalog.update(sources=records)
+        if register_new:
+            _register_new_vehicles(results)
+    counts = {s: sum(1 for r in results if r.status == s)
+              for s in (CREATED, UPDATED, UNCHANGED, SKIPPED, FAILED)}
+    print("[DEBUG] Templates — " + "  ".join(f"{k}: {v}" for k, v in counts.items()))
+    for r in results:
+        if r.changed:
+            print(f"[DEBUG]   {r.status:<9} {r.carid}: {', '.join(r.changed_files)}")
+    return results
+
+
+def _register_new_vehicles(results: List[TemplateResult]) -> None:
+    from core.config import VEHICLE_IDS
+    from utils.vehicle_catalog import catalog
+
+    new = {r.carid: r.display_name for r in results
+           if r.status == CREATED and r.carid not in VEHICLE_IDS
+           and not catalog.has_vehicle(r.carid)}
+    if new:
+        print(f"[DEBUG] Registering {len(new)} vehicle(s) not in VEHICLE_IDS: {', '.join(sorted(new))}")
+        catalog.update(vehicles=new, flush=True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-zip work
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _zip_stem(zip_path: str) -> str:
+    return os.path.splitext(os.path.basename(zip_path))[0].lower()
+
+
+def _process_zip(zip_path: str, wanted: Optional[set], dry_run: bool, force: bool,
+                 records: dict) -> List[TemplateResult]:
+    results: List[TemplateResult] = []
+    try:
+        vehicles = [item for item in iter_scan_mod(zip_path)
+                    if isinstance(item, DiscoveredVehicle)]
+    except Exception as e:
+        print(f"[ERROR] Failed to scan {zip_path}: {e}")
+        return [TemplateResult(_zip_stem(zip_path), "", FAILED, zip_path, message=str(e))]
+
+    for vehicle in vehicles:
+        if wanted is not None and vehicle.carid.lower() not in wanted:
+            continue
+        results.append(_regenerate_vehicle(vehicle, zip_path, dry_run, force, records))
+    return results
+
+
+def _regenerate_vehicle(vehicle: DiscoveredVehicle, zip_path: str, dry_run: bool,
+                        force: bool, records: dict) -> TemplateResult:
+    result = TemplateResult(vehicle.carid, vehicle.display_name, UNCHANGED, zip_path)
+    if not vehicle.ready:
+        result.status  = SKIPPED
+        result.message = "; ".join(vehicle.warnings) or "no skin materials / jbeam"
+        return result
+
+    if _is_custom_import(vehicle.carid):
+        result.status  = SKIPPED
+        result.message = "a custom vehicle with this carid was imported from a mod"
+        return result
+
+    target   = _template_folder(vehicle.carid)
+    existing = template_files(target)
+    if existing and not force and not _is_generated(vehicle.carid):
+        result.status  = SKIPPED
+        result.message = "template was not generated here; use --force to rebuild it"
+        return result
+    jbeams = [name for key, name in existing.items() if key.endswith(".jbeam")]
+
+    try:
+        with tempfile.TemporaryDirectory(prefix=f"bss_tpl_{vehicle.carid}_") as staging, \
+                open_mod_source(vehicle.archive_path) as src:
+            if template_sources.is_current(vehicle.carid, src, vehicle.archive_path,
+                                           vehicle.json_path, vehicle.jbeam_path, target):
+                return result
+
+            text = src.read_text(vehicle.json_path)
+            edit_material_json(vehicle.json_path, staging, vehicle.carid, content=text)
+            if jbeams:
+                # keep the installed jbeam(s) and their parts; only materials change
+                for name in jbeams:
+                    shutil.copy2(os.path.join(target, name), os.path.join(staging, name))
+            else:
+                edit_jbeam_material(vehicle.jbeam_path, staging, vehicle.carid,
+                                    output_name=f"{vehicle.carid}.jbeam")
+            materials_name = materials_output_name(vehicle.json_path)
+            if not os.path.isfile(os.path.join(staging, materials_name)):
+                result.status  = FAILED
+                result.message = f"{materials_name} was not generated"
+                return result
+
+            result.changed_files = _diff_template(staging, target)
+            if result.changed_files:
+                result.status = UPDATED if os.path.isdir(target) else CREATED
+                if not dry_run:
+                    install_template(staging, target)
+            records[vehicle.carid] = template_sources.make_record(
+                src, vehicle.archive_path, vehicle.json_path, vehicle.jbeam_path, text,
+                jbeam_name=jbeams[0] if jbeams else f"{vehicle.carid}.jbeam")
+    except Exception as e:
+        print(f"[ERROR] Template regeneration failed for {vehicle.carid}: {e}")
+        result.status  = FAILED
+        result.message = str(e)
+    return result
+
+
+def _is_custom_import(carid: str) -> bool:
+    """True if carid belongs to a vehicle the user imported from a mod."""
+    from utils.vehicle_catalog import catalog
+
+    if not catalog.has_vehicle(carid):
+        return False
+    archive = (catalog.get_source(carid) or {}).get("archive") or ""
+    parent  = os.path.dirname(archive)
+    return not (os.path.basename(parent).lower() == "vehicles"
+                and os.path.basename(os.path.dirname(parent)).lower() == "content")
+
+
+def _is_generated(carid: str) -> bool:
+    """True if this module (or an import) recorded building carid's template."""
+    from utils.vehicle_catalog import catalog
+
+    return catalog.get_source(carid) is not None
+
+
+def _template_folder(carid: str) -> str:
+    """Existing vehicles/<carid>/SKINNAME folder (any casing), or the default."""
+    car_dir = os.path.join(VEHICLE_FOLDER, carid)
+    if os.path.isdir(car_dir):
+        for name in os.listdir(car_dir):
+            if name.lower() == "skinname" and os.path.isdir(os.path.join(car_dir, name)):
+                return os.path.join(car_dir, name)
+    return os.path.join(car_dir, "SKINNAME")
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _diff_template(staging: str, target: str) -> List[str]:
+    """Names of template files that differ between staging and target."""
+    new, old = template_files(staging), template_files(target)
+    changed = [name for key, name in sorted(new.items())
+               if key not in old
+               or _read_bytes(os.path.join(staging, name)) != _read_bytes(os.path.join(target, old[key]))]
+    changed += [f"-{name}" for key, name in sorted(old.items()) if key not in new]
+    return changed
+
+
+if __name__ == "__main__":
+    import sys
+
+    args    = [a for a in sys.argv[1:] if not a.startswith("--")]
+    results = regenerate_base_templates(args[0] if args else None, dry_run="--dry-run" in sys.argv,
+                                        force="--force" in sys.argv)
+    changed = [r for r in results if r.changed]
+    print(f"{len(changed)} of {len(results)} template(s) {'would change' if '--dry-run' in sys.argv else 'changed'}")
+    for r in changed:
+        print(f"  {r.status:<9} {r.carid:<20} {', '.join(r.changed_files)}")
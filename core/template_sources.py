@@ -0,0 +1,132 @@
+"""
+core/template_sources.py — Provenance of generated SKINNAME templates.
+
+When a template is built from a mod (or a base-game content zip) we record
+where it came from: the archive, the materials JSON and jbeam members,
+the name of the generated materials file (materials.json or
+skin.materials.json), the name the jbeam was installed under, a hash of
+the materials text and, for mod imports, the preview image with its stamp.
+The generated files depend on nothing else, so on re-import or refresh a
+template whose source still matches can be left as it is.
+
+The check is cheap on purpose:
+  * zip members are compared by (size, CRC-32) straight from the central
+    directory — nothing is decompressed;
+  * loose files are compared by (size, mtime) first and only hashed when
+    that differs, so a touched-but-identical file is still "unchanged".
+
+Records live in the vehicle catalog under __sources__, keyed by carid or
+variant_key(carid, suffix).
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from utils.file_ops import materials_output_name
+from utils.vehicle_catalog import catalog, variant_key
+
+
+def source_key(carid: str, suffix: Optional[str] = None) -> str:
+    return variant_key(carid, suffix) if suffix else carid
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _image_stamp(src, image_path: Optional[str]) -> Optional[list]:
+    if not image_path:
+        return None
+    try:
+        return list(src.stamp(image_path))
+    except OSError:
+        return None
+
+
+def make_record(src, archive_path: Optional[str], json_path: str, jbeam_path: str,
+                text: Optional[str] = None, image_path: Optional[str] = None,
+                jbeam_name: Optional[str] = None) -> Dict[str, Any]:
+    """Provenance entry for a template just built from src.  jbeam_name is
+    the installed jbeam's file name when it isn't the source's."""
+    if text is None:
+        text = src.read_text(json_path)
+    record = {
+        "archive": archive_path,
+        "json":    json_path,
+        "jbeam":   jbeam_path,
+        "materials": materials_output_name(json_path),
+        "jbeam_name": jbeam_name or src.basename(jbeam_path),
+        "stamp":   list(src.stamp(json_path)),
+        "sha1":    content_hash(text),
+    }
+    if image_path:
+        record["image"]       = image_path
+        record["image_stamp"] = _image_stamp(src, image_path)
+    return record
+
+
+def _template_exists(target_folder: str, materials_name: str, jbeam_name: str) -> bool:
+    return (os.path.isfile(os.path.join(target_folder, materials_name))
+            and os.path.isfile(os.path.join(target_folder, jbeam_name)))
+
+
+def is_current(key: str, src, archive_path: Optional[str], json_path: str,
+               jbeam_path: str, target_folder: str, image_path: Optional[str] = None) -> bool:
+    """
+    True if the template in target_folder was generated from exactly this
+    source and is still on disk, i.e. rebuilding it would change nothing.
+    A preview image is compared by path and stamp only when one is given.
+    """
+    stored = catalog.get_source(key)
+    if not stored:
+        return False
+    if (stored.get("archive") != archive_path or stored.get("json") != json_path
+            or stored.get("jbeam") != jbeam_path):
+        return False
+    if image_path and (stored.get("image") != image_path
+                       or stored.get("image_stamp") != _image_stamp(src, image_path)):
+        return False
+    # The generated file names only depend on the source file names; records
+    # written before "materials" was stored get it derived the same way.
+    materials_name = stored.get("materials") or materials_output_name(json_path)
+    jbeam_name = stored.get("jbeam_name") or src.basename(jbeam_path)
+    if not _template_exists(target_folder, materials_name, jbeam_name):
+        return False
+
+    try:
+        stamp = list(src.stamp(json_path))
+    except OSError:
+        return False
+    if stamp == stored.get("stamp"):
+        return True
+    if archive_path:
+        return False            # a different CRC means different content
+
+    # Loose file with a new mtime: hash it before deciding.
+    try:
+        same = content_hash(src.read_text(json_path)) == stored.get("sha1")
+    except OSError:
+        return False
+    if same:
+        catalog.update(sources={key: {**stored, "stamp": stamp}})
+    return same
+
+
+def generated_jbeam_name(key: str) -> Optional[str]:
+    """File name of the jbeam last generated for key, or None."""
+    stored = catalog.get_source(key) or {}
+    if stored.get("jbeam_name"):
+        return stored["jbeam_name"]
+    return os.path.basename(stored["jbeam"]) if stored.get("jbeam") else None
+
+
+def record(key: str, src, archive_path: Optional[str], json_path: str, jbeam_path: str,
+           image_path: Optional[str] = None) -> None:
+    """Store provenance for a single freshly built template."""
+    try:
+        catalog.update(sources={key: make_record(src, archive_path, json_path, jbeam_path,
+                                                 image_path=image_path)})
+    except Exception as e:
+        print(f"[WARNING] Could not record template source for {key}: {e}")
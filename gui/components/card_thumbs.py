@@ -0,0 +1,167 @@
+"""
+gui/components/card_thumbs.py — Card-sized vehicle thumbnails, rendered off the GUI thread.
+
+Modern car list cards show the vehicle image cover-cropped to the card's
+image area.  Doing that from the full-size source (decode, smooth scale,
+crop) for every card on every resize is far too slow, so:
+
+  * card widths are rounded up to BUCKET pixels and one base image is
+    rendered per (image, width bucket, theme background) on a worker pool;
+  * base images live in gui.image_cache (memory) and utils.thumb_cache
+    (disk), so reopening the tab or restarting the app skips the source;
+  * every card width inside a bucket is a centre crop of the same base,
+    so resizing the window never decodes or smooth-scales anything.
+
+    thumbs = CardThumbnails(CARD_IMG_H, parent=view)
+    thumbs.ready.connect(lambda path: view.viewport().update())
+    base = thumbs.base(path, card_w)     # QPixmap, or None while it renders
+"""
+from __future__ import annotations
+
+import math
+from typing import Optional, Set
+
+from PySide6.QtCore import QObject, QRunnable, QSize, QThreadPool, Signal
+from PySide6.QtGui  import QColor, QImage, QImageReader, QPainter, QPixmap
+
+from gui.theme import COLORS
+from gui.image_cache import image_cache
+
+try:
+    from utils.thumb_cache import thumb_cache as _thumb_cache
+except ImportError as _tc_imp_exc:
+    print(f"[DEBUG] card_thumbs: thumbnail cache not available: {_tc_imp_exc}")
+    _thumb_cache = None
+
+BUCKET = 32
+
+
+def bucket_width(width: int) -> int:
+    return max(BUCKET, math.ceil(width / BUCKET) * BUCKET)
+
+
+def _render(path: str, w: int, h: int, background: str) -> Optional[QImage]:
+    """Cover-crop path to w × h over background.  QImage only — thread safe."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    src = reader.size()
+    if src.isValid() and src.width() > 0 and src.height() > 0:
+        scale = max(w / src.width(), h / src.height())
+        # JPEG decodes straight at the reduced size; other formats are
+        # smooth-scaled by the reader.
+        reader.setScaledSize(QSize(max(w, math.ceil(src.width() * scale)),
+                                   max(h, math.ceil(src.height() * scale))))
+    image = reader.read()
+    if image.isNull():
+        print(f"[DEBUG] card_thumbs: could not read {path}: {reader.errorString()}")
+        return None
+
+    out = QImage(w, h, QImage.Format.Format_RGB32)
+    out.fill(QColor(background))
+    p = QPainter(out)
+    p.drawImage(0, 0, image, (image.width() - w) // 2, (image.height() - h) // 2, w, h)
+    p.end()
+    return out
+
+
+def _store(key: str, image: QImage) -> None:
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    data = QByteArray()
+    buf  = QBuffer(data)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    ok = image.save(buf, "PNG")
+    buf.close()
+    if ok:
+        _thumb_cache.put(key, bytes(data.data()))
+
+
+def _from_disk(disk_key: Optional[str], w: int, h: int) -> Optional[QImage]:
+    hit = _thumb_cache.get(disk_key) if disk_key else None
+    if hit:
+        image = QImage(hit)
+        if not image.isNull() and image.width() == w and image.height() == h:
+            return image
+    return None
+
+
+class _RenderTask(QRunnable):
+
+    def __init__(self, owner: "CardThumbnails", key, path: str,
+                 w: int, h: int, background: str, disk_key: Optional[str]):
+        super().__init__()
+        self._owner    = owner
+        self._key      = key
+        self._path     = path
+        self._size     = (w, h)
+        self._bg       = background
+        self._disk_key = disk_key
+
+    def run(self):
+        image = None
+        try:
+            image = _from_disk(self._disk_key, *self._size)
+            if image is None:
+                image = _render(self._path, *self._size, self._bg)
+                if image is not None and self._disk_key:
+                    _store(self._disk_key, image)
+        except Exception as e:
+            print(f"[ERROR] Card thumbnail failed for {self._path}: {e}")
+        try:
+            self._owner._finished.emit(self._key, self._path, image)
+        except RuntimeError:        # owner destroyed while we were rendering
+            pass
+
+
+class CardThumbnails(QObject):
+
+    ready = Signal(str)                         # image path whose thumbnail just arrived
+
+    # image-cache key, path, QImage | None — emitted from worker threads
+    _finished = Signal(object, str, object)
+
+    def __init__(self, height: int, parent: Optional[QObject] = None, max_threads: int = 2):
+        super().__init__(parent)
+        self._h = height
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._pending: Set[tuple] = set()
+        self._failed:  Set[tuple] = set()
+        self._seq = 0
+        self._finished.connect(self._deliver)
+
+    def base(self, path: str, width: int) -> Optional[QPixmap]:
+        """
+        Base thumbnail covering a card image area `width` wide (the pixmap
+        is bucket_width(width) wide; crop its centre).  None while it is
+        being rendered or if the image can't be read.
+        """
+        bw  = bucket_width(width)
+        bg  = COLORS.get("frame_bg", COLORS["card_bg"])
+        key = image_cache.key(path, (bw, self._h), f"card_base:{bg}")
+        if key is None or key in self._failed:
+            return None
+        px = image_cache.get(key)
+        if px is not None:
+            return px
+        if key in self._pending:
+            return None
+
+        # A disk hit is a small PNG — cheap enough to load right here, so a
+        # reopened tab paints complete cards on its first frame.
+        disk_key = _thumb_cache.key(path, bw, self._h, f"card:{bg}") if _thumb_cache else None
+        cached = _from_disk(disk_key, bw, self._h)
+        if cached is not None:
+            return image_cache.put_image(key, cached)
+
+        self._pending.add(key)
+        self._seq += 1              # newest first: those cards are most likely still on screen
+        self._pool.start(_RenderTask(self, key, path, bw, self._h, bg, disk_key), self._seq)
+        return None
+
+    def _deliver(self, key, path: str, image) -> None:
+        self._pending.discard(key)
+        if image is None or image.isNull():
+            self._failed.add(key)
+            return
+        image_cache.put_image(key, image)
+        self.ready.emit(path)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import bisect
 import os
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -15,6 +16,10 @@ from gui.widgets import (AnimButton, GhostButton, VehicleCard,
                           HSeparator, LabelledEntry, Badge, Spinner,
                           ToggleSwitch)
 from gui.state   import state
+from gui.components.preview import PREFETCH_NEIGHBORS
+from gui.vehicle_search import vehicle_index
+from utils.variant_index import variant_index
+from utils.vehicle_images import vehicle_images
 
 try:
     from core.localization import t
@@ -22,11 +27,15 @@ except ImportError:
     def t(key, **kw): return key
 
 
+FILTER_DELAY_MS = 80
+
+
 # VARIANT  DETECTION  HELPER
 
 def _get_vehicle_variants(carid: str) -> List[Tuple[str, str]]:
     """
-    Scan vehicles/<carid>/ for SKINNAME* subdirectories.
+    Variant bodies of carid, from the SKINNAME* subdirectories of
+    vehicles/<carid>/.
 
     Returns a list of (variant_suffix, display_label) tuples.
       ("",          "Normal")     — the standard body (SKINNAME folder)
@@ -36,28 +45,10 @@ def _get_vehicle_variants(carid: str) -> List[Tuple[str, str]]:
 
     Always returns at least [("", "Normal")].
     The list is sorted: normal first, then alphabetically by label.
+    Served from utils.variant_index, so no filesystem calls after the
+    first scan.
     """
-    vehicles_dir = os.path.join("vehicles", carid)
-    if not os.path.isdir(vehicles_dir):
-        return [("", "Normal")]
-
-    variants: List[Tuple[str, str]] = []
-    for entry in os.listdir(vehicles_dir):
-        full = os.path.join(vehicles_dir, entry)
-        if not os.path.isdir(full):
-            continue
-        dl = entry.lower()
-        if dl == "skinname":
-            variants.append(("", "Normal"))
-        elif dl.startswith("skinname"):
-            suffix = dl[len("skinname"):]          # e.g. "ambulance", "box"
-            variants.append((suffix, suffix.capitalize()))
-
-    if not variants:
-        return [("", "Normal")]
-
-    variants.sort(key=lambda x: (x[0] != "", x[1].lower()))
-    return variants
+    return variant_index.get(carid)
 
 
 # VEHICLE  VARIANT  EXPANDER
@@ -94,6 +85,7 @@ class VehicleVariantExpander(QFrame):
         self.carid        = carid
         self.display_name = display_name
         self.variants     = variants
+        self.is_custom    = is_custom
         self._expanded    = False
         self._added:      set = set()      # variant suffixes already in project
         self._buttons:    Dict[str, QPushButton] = {}
@@ -245,9 +237,23 @@ class VehicleVariantExpander(QFrame):
         if suffix in self._buttons:
             self._buttons[suffix].setVisible(False)
         # Hide the whole expander once every variant has been added
-        if {s for s, _ in self.variants}.issubset(self._added):
+        if self.all_added:
             self.setVisible(False)
 
+    @property
+    def all_added(self) -> bool:
+        return {s for s, _ in self.variants}.issubset(self._added)
+
+    def set_added(self, suffixes: set):
+        """Show exactly the pills whose variant is not in the project."""
+        if suffixes == self._added:
+            return
+        for suffix, btn in self._buttons.items():
+            added = suffix in suffixes
+            btn.setVisible(not added)
+            btn.setEnabled(True)
+        self._added = set(suffixes)
+
 
 # NAV  PILL  BUTTON  (topbar tab)
 
@@ -467,6 +473,12 @@ class Sidebar(QFrame):
         self._vehicle_cards: List[VehicleCard] = []
         # Tracks VehicleVariantExpander widgets keyed by carid.
         self._variant_expanders: Dict[str, VehicleVariantExpander] = {}
+        # carids currently hidden by the search filter
+        self._filter_hidden: set = set()
+        # Sort keys (name.lower(), carid) of the vehicle rows, in layout
+        # order, and the widget of each carid — cards and expanders alike.
+        self._order: List[Tuple[str, str]] = []
+        self._rows:  Dict[str, QWidget] = {}
 
         self._mod_name_text = ""
         self._author_text   = ""
@@ -680,6 +692,11 @@ class Sidebar(QFrame):
         self._search.textChanged.connect(self._filter_vehicles)
         inner_layout.addWidget(self._search)
 
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_vehicle_filter)
+
         self._vehicle_list = QVBoxLayout()
         self._vehicle_list.setSpacing(4)
         self._vehicle_list.setContentsMargins(0, 0, 0, 0)
@@ -691,23 +708,64 @@ class Sidebar(QFrame):
 
 
     def populate_vehicles(self, add_callback: Callable[[str, str, str], None]):
-        """Called by the main window to populate the sidebar vehicle list."""
+        """
+        Called by the main window to (re)populate the sidebar vehicle list.
+
+        Diff-based: rows that are still wanted keep their widget (pills are
+        re-synced with the project), rows that are gone are removed, and new
+        ones are inserted at their sorted position.  Only vehicles whose
+        name, variants or custom flag changed are rebuilt.
+        """
         self._populate_callback = add_callback
-        state.sidebar_vehicle_buttons.clear()
-        self._clear_vehicle_list()
+        from gui.tabs.generator import _make_project_key
 
         gen = self._get_generator()
         project_keys = set(gen.project_data["cars"].keys()) if gen else set()
 
         all_vehicles = {**state.vehicle_ids, **state.added_vehicles}
-        for cid, name in sorted(all_vehicles.items(), key=lambda x: x[1].lower()):
-            if self._is_fully_in_project(cid, project_keys):
-                continue
+        wanted = {cid: name for cid, name in all_vehicles.items()
+                  if not self._is_fully_in_project(cid, project_keys)}
+
+        removed = added = 0
+        for cid, widget in list(self._rows.items()):
             variants = _get_vehicle_variants(cid)
-            if len(variants) > 1:
-                self._add_variant_expander(cid, name, variants, add_callback)
-            else:
-                self._add_vehicle_card(cid, name, add_callback)
+            stale = (
+                cid not in wanted
+                or widget.display_name != wanted[cid]
+                or getattr(widget, "is_custom", False) != (cid in state.added_vehicles)
+                or (len(variants) > 1) != isinstance(widget, VehicleVariantExpander)
+                or (isinstance(widget, VehicleVariantExpander) and widget.variants != variants)
+            )
+            if stale:
+                self._remove_row(cid)
+                removed += 1
+
+        for cid, name in wanted.items():
+            variants = _get_vehicle_variants(cid)
+            if cid not in self._rows:
+                if len(variants) > 1:
+                    self._add_variant_expander(cid, name, variants, add_callback)
+                else:
+                    self._add_vehicle_card(cid, name, add_callback)
+                added += 1
+            exp = self._variant_expanders.get(cid)
+            if exp is not None:
+                exp.set_added({s for s, _ in variants
+                               if _make_project_key(cid, s) in project_keys})
+                # mark_variant_added() hides a reused expander once all its
+                # variants are added; show it again now that some are not.
+                hide = exp.all_added or cid in self._filter_hidden
+                if exp.isHidden() != hide:
+                    exp.setVisible(not hide)
+
+        state.sidebar_vehicle_buttons = [
+            (w, cid, w.display_name, "") for _key, cid in self._order
+            for w in (self._rows[cid],) if isinstance(w, VehicleCard)
+        ]
+        print(f"[DEBUG] populate_vehicles: {len(self._rows)} row(s), "
+              f"{added} added, {removed} removed")
+        if self._search.text().strip():
+            self._apply_vehicle_filter()
 
     def _get_generator(self):
         """Walk up to main window and return the generator tab, or None."""
@@ -724,9 +782,9 @@ class Sidebar(QFrame):
         the user can still add remaining bodies even if one is present.
         """
         print(f"[DEBUG] _is_fully_in_project() called")
+        from gui.tabs.generator import _make_project_key
         variants = _get_vehicle_variants(carid)
         for suffix, _ in variants:
-            from gui.tabs.generator import _make_project_key
             if _make_project_key(carid, suffix) not in project_keys:
                 return False
         return True
@@ -763,29 +821,35 @@ class Sidebar(QFrame):
             if not any(c.carid == carid for c in self._vehicle_cards):
                 self._add_vehicle_card(carid, name, self._populate_callback)
 
+        # The restored widget is visible again — re-hide it if the search excludes it.
+        self._filter_hidden.discard(carid)
+        if self._search.text().strip():
+            self._apply_vehicle_filter()
+
     def _insert_sorted(self, widget: QWidget, display_name: str):
-        """Insert widget into _vehicle_list at the correct alphabetical position."""
-        target = display_name.lower()
-        count  = self._vehicle_list.count()
-        insert_at = count  # default: append
-        for i in range(count):
-            item = self._vehicle_list.itemAt(i)
-            if item is None:
-                continue
-            w = item.widget()
-            if w is None:
-                continue
-            # Get the display name from whatever widget type is at this slot
-            if hasattr(w, "display_name"):
-                existing = w.display_name.lower()
-            elif isinstance(w, VehicleVariantExpander):
-                existing = w.display_name.lower()
-            else:
-                continue
-            if target < existing:
-                insert_at = i
-                break
-        self._vehicle_list.insertWidget(insert_at, widget)
+        """Insert widget into _vehicle_list at its alphabetical position (binary search)."""
+        key = (display_name.lower(), widget.carid)
+        at  = bisect.bisect_left(self._order, key)
+        self._order.insert(at, key)
+        self._rows[widget.carid] = widget
+        self._vehicle_list.insertWidget(at, widget)
+
+    def _remove_row(self, carid: str):
+        """Remove carid's card or expander from the list and delete it."""
+        widget = self._rows.pop(carid, None)
+        if widget is None:
+            return
+        at = bisect.bisect_left(self._order, (widget.display_name.lower(), carid))
+        if at < len(self._order) and self._order[at][1] == carid:
+            del self._order[at]
+        self._vehicle_list.removeWidget(widget)
+        if isinstance(widget, VehicleVariantExpander):
+            self._variant_expanders.pop(carid, None)
+        elif widget in self._vehicle_cards:
+            self._vehicle_cards.remove(widget)
+        self._filter_hidden.discard(carid)
+        widget.hide()
+        widget.deleteLater()
 
     def _add_variant_expander(
         self,
@@ -816,6 +880,7 @@ class Sidebar(QFrame):
         """Add a plain VehicleCard for single-body vehicles."""
         is_custom = carid in state.added_vehicles
         card = VehicleCard(carid, name, parent=self, is_custom=is_custom)
+        card.is_custom = is_custom
         card.add_requested.connect(
             lambda c, d: self._on_add_vehicle(c, d, "", callback)
         )
@@ -831,15 +896,34 @@ class Sidebar(QFrame):
         mw = self.window()
         if mw is None or not hasattr(mw, "preview_manager"):
             return
-        img_name = f"{variant_suffix}.jpg" if variant_suffix else "default.jpg"
-        img_path = os.path.join("gui", "images", "vehicles", carid, img_name)
-        # Fall back to default.jpg if the variant image doesn't exist
-        if not os.path.exists(img_path):
-            img_path = os.path.join("gui", "images", "vehicles", carid, "default.jpg")
+        def _image_path(c=carid, stem=variant_suffix or "default"):
+            # Fall back to default.jpg if the variant image doesn't exist.
+            # Looked up on hover, not while the list is being built.
+            images = vehicle_images.get(c)
+            return images.preview(stem) or images.preview("default")
+
         mw.preview_manager.setup_robust_hover(
-            widget, carid, get_image_path=lambda p=img_path: p
+            widget, carid, get_image_path=_image_path,
+            neighbors=lambda c=carid: self._hover_neighbors(c),
         )
 
+    def _hover_neighbors(self, carid: str) -> List[str]:
+        """Default images of the visible rows around carid, nearest first."""
+        widget = self._rows.get(carid)
+        if widget is None:
+            return []
+        at = bisect.bisect_left(self._order, (widget.display_name.lower(), carid))
+        visible = lambda i: self._order[i][1] not in self._filter_hidden
+        below = [i for i in range(at + 1, len(self._order)) if visible(i)][:PREFETCH_NEIGHBORS]
+        above = [i for i in range(at - 1, -1, -1) if visible(i)][:PREFETCH_NEIGHBORS]
+        paths = []
+        for pair in zip(below + [None] * PREFETCH_NEIGHBORS, above + [None] * PREFETCH_NEIGHBORS):
+            for i in pair:
+                if i is not None:
+                    cid = self._order[i][1]
+                    paths.append(os.path.join("gui", "images", "vehicles", cid, "default.jpg"))
+        return paths
+
     def _on_add_vehicle(self, carid: str, name: str, variant: str, callback: Callable):
         """
         print(f"[DEBUG] _add_vehicle_card() called")
@@ -854,12 +938,7 @@ class Sidebar(QFrame):
             self._variant_expanders[carid].mark_variant_added(variant)
         else:
             # Plain single-variant card: remove it entirely.
-            for card in list(self._vehicle_cards):
-                if card.carid == carid:
-                    self._vehicle_list.removeWidget(card)
-                    card.deleteLater()
-                    self._vehicle_cards.remove(card)
-                    break
+            self._remove_row(carid)
 
         state.sidebar_vehicle_buttons = [
             item for item in state.sidebar_vehicle_buttons
@@ -874,22 +953,50 @@ class Sidebar(QFrame):
         for exp in list(self._variant_expanders.values()):
             exp.deleteLater()
         self._variant_expanders.clear()
+        self._filter_hidden.clear()
+        self._order.clear()
+        self._rows.clear()
         while self._vehicle_list.count():
             item = self._vehicle_list.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
 
     def _filter_vehicles(self, text: str):
+        # Debounced: a burst of keystrokes re-filters the list once.
+        self._filter_timer.start()
+
+    def _apply_vehicle_filter(self):
+        """
+        Hide the vehicles that don't match the search box.  Only widgets
+        whose match state changed since the last pass are touched, so a
+        narrowing query costs one setVisible per vehicle that drops out.
+        """
+        text = self._search.text().strip()
         print(f"[DEBUG] _filter_vehicles: query={text!r}")
-        term = text.lower()
+        index   = vehicle_index()
+        matches = index.matching(text)
+        term    = text.lower()
+
+        def hidden(carid: str, name: str) -> bool:
+            if carid in index:
+                return carid not in matches
+            return bool(term) and term not in name.lower() and term not in carid.lower()
+
+        changed = 0
         for card in self._vehicle_cards:
-            card.setVisible(
-                term in card.display_name.lower() or term in card.carid.lower()
-            )
+            hide = hidden(card.carid, card.display_name)
+            if hide != (card.carid in self._filter_hidden):
+                card.setVisible(not hide)
+                changed += 1
+                (self._filter_hidden.add if hide else self._filter_hidden.discard)(card.carid)
         for carid, exp in self._variant_expanders.items():
-            exp.setVisible(
-                term in exp.display_name.lower() or term in carid.lower()
-            )
+            hide = hidden(carid, exp.display_name)
+            if hide != (carid in self._filter_hidden):
+                # an expander with every variant in the project stays hidden
+                exp.setVisible(not hide and not exp.all_added)
+                changed += 1
+                (self._filter_hidden.add if hide else self._filter_hidden.discard)(carid)
+        print(f"[DEBUG] _filter_vehicles: {len(matches)} match(es), {changed} widget(s) updated")
 
 
     def _add_all_vehicles(self):
@@ -968,6 +1075,17 @@ class Sidebar(QFrame):
         except Exception:
             pass
 
+        # Keep the vehicle rows: the theme switch has already restyled them
+        # in place and they carry no translated text.  They are parked on
+        # the sidebar while the chrome around them is rebuilt.
+        search_text = self._search.text() if hasattr(self, "_search") else ""
+        kept = []
+        for _key, cid in self._order:
+            w = self._rows[cid]
+            kept.append((w, not w.isHidden()))
+            self._vehicle_list.removeWidget(w)
+            w.setParent(self)
+
         old = self.layout()
         if old is not None:
             while old.count():
@@ -980,9 +1098,14 @@ class Sidebar(QFrame):
             _tmp = QWidget()
             _tmp.setLayout(old)
 
-        self._vehicle_cards       = []
-        self._variant_expanders   = {}
         self._build()
+        for w, visible in kept:
+            self._vehicle_list.addWidget(w)
+            w.setVisible(visible)
+        if search_text:
+            self._search.blockSignals(True)
+            self._search.setText(search_text)
+            self._search.blockSignals(False)
         if self._populate_callback:
             self.populate_vehicles(self._populate_callback)
 
@@ -2,14 +2,15 @@ from __future__ import annotations
 import os
 from typing import Optional
 
-from PySide6.QtCore    import Qt, QTimer, QPoint, QSize
-from PySide6.QtGui     import QPixmap, QCursor
+from PySide6.QtCore    import Qt, QTimer, QPoint, QSize, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui     import QCursor, QImage, QImageReader
 from PySide6.QtWidgets import (
     QWidget, QFrame, QLabel, QVBoxLayout, QHBoxLayout, QApplication,
 )
 
 from gui.theme   import COLORS, font, drop_shadow, fade_in
 from gui.state   import state
+from gui.image_cache import image_cache
 
 try:
     from core.localization import t
@@ -17,8 +18,82 @@ except ImportError:
     def t(key, **kw): return key
 
 
+PREVIEW_SIZE       = (280, 200)
+PREFETCH_NEIGHBORS = 3          # rows either side of the hovered one
+
+
+def _read_scaled(path: str, w: int, h: int) -> Optional[QImage]:
+    """Decode path fitted into w × h.  QImage only — safe on worker threads."""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    src = reader.size()
+    if src.isValid() and (src.width() > w or src.height() > h):
+        # JPEG decodes straight at the reduced size
+        reader.setScaledSize(src.scaled(w, h, Qt.KeepAspectRatio))
+    image = reader.read()
+    return None if image.isNull() else image
+
+
+class _PrefetchTask(QRunnable):
+
+    def __init__(self, owner: "_Prefetcher", key, path: str):
+        super().__init__()
+        self._owner = owner
+        self._key   = key
+        self._path  = path
+
+    def run(self):
+        image = None
+        try:
+            image = _read_scaled(self._path, *PREVIEW_SIZE)
+        except Exception as e:
+            print(f"[DEBUG] hover prefetch failed for {self._path}: {e}")
+        try:
+            self._owner._loaded.emit(self._key, image)
+        except RuntimeError:        # owner destroyed meanwhile
+            pass
+
+
+class _Prefetcher(QObject):
+    """Decodes preview images into gui.image_cache on a background thread."""
+
+    _loaded = Signal(object, object)        # image-cache key, QImage | None
+
+    def __init__(self, parent: QObject):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pending: set = set()
+        self._loaded.connect(self._deliver)
+
+    def request(self, path: str) -> None:
+        key = image_cache.key(path, PREVIEW_SIZE)
+        if key is None or key in self._pending or image_cache.get(key) is not None:
+            return
+        self._pending.add(key)
+        self._pool.start(_PrefetchTask(self, key, path))
+
+    def drop_queued(self) -> None:
+        """Forget prefetches that haven't started — the mouse has moved on."""
+        self._pool.clear()
+        self._pending.clear()
+
+    def _deliver(self, key, image) -> None:
+        self._pending.discard(key)
+        if image is not None:
+            image_cache.put_image(key, image)
+
+
 class HoverPreviewManager:
-    """Manages a floating preview panel inside the main window."""
+    """
+    Manages a floating preview panel inside the main window.
+
+    The panel's widgets are built once; showing a preview only swaps the
+    header text and the pixmap.  Preview images come from gui.image_cache
+    at PREVIEW_SIZE.  When a hover starts, its image and those of the rows
+    around it (the caller's neighbors()) are decoded in the background,
+    so by the time the hover delay has passed the pixmap is usually ready.
+    """
 
     def __init__(self, app_widget: QWidget, preview_overlay: QFrame):
         print(f"[DEBUG] __init__() called")
@@ -26,30 +101,11 @@ class HoverPreviewManager:
         self.overlay         = preview_overlay
         self._timer: Optional[QTimer] = None
         self._current_carid: Optional[str] = None
+        self._prefetcher     = _Prefetcher(app_widget)
+        self._build_overlay()
 
-
-    def show_hover_preview(self, carid: str, image_path: Optional[str] = None) -> None:
-        print(f"[DEBUG] show_hover_preview: carid={carid!r} path={image_path!r}")
-        # Use the supplied path if valid; otherwise fall back to default → MissingTexture
-        if not image_path or not os.path.exists(image_path):
-            image_path = os.path.join("gui", "images", "vehicles", carid, "default.jpg")
-        if not os.path.exists(image_path):
-            fallback = os.path.join("gui", "images", "common",
-                                    "imagepreview", "MissingTexture.jpg")
-            if os.path.exists(fallback):
-                image_path = fallback
-            else:
-                return
-
-        # ── Tear down the old layout completely before building a new one ── #
-        # Creating a new QVBoxLayout(self.overlay) every call stacks layouts
-        # on top of each other.  Instead we delete all children directly.
-        self._clear_overlay()
-
-        # header strip — parented to overlay directly (no layout yet)
-        ow, oh = 300, 240
-        self.overlay.setFixedSize(ow, oh)
-
+    def _build_overlay(self) -> None:
+        self.overlay.setFixedSize(300, 240)
         inner = QVBoxLayout(self.overlay)
         inner.setContentsMargins(8, 8, 8, 8)
         inner.setSpacing(6)
@@ -64,25 +120,50 @@ class HoverPreviewManager:
         hdr_row = QHBoxLayout(hdr)
         hdr_row.setContentsMargins(8, 4, 8, 4)
 
-        vehicle_name = state.get_vehicle_name(carid)
-        hdr_lbl = QLabel(f"{vehicle_name}  |  {carid}")
-        hdr_lbl.setFont(font(12, "bold"))
-        hdr_lbl.setStyleSheet(
+        self._hdr_lbl = QLabel()
+        self._hdr_lbl.setFont(font(12, "bold"))
+        self._hdr_lbl.setStyleSheet(
             f"color:{COLORS['accent_text']};background:transparent;"
         )
-        hdr_row.addWidget(hdr_lbl)
+        hdr_row.addWidget(self._hdr_lbl)
         inner.addWidget(hdr)
 
-        # image
-        px = QPixmap(image_path).scaled(
-            280, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        img_lbl = QLabel()
-        img_lbl.setPixmap(px)
-        img_lbl.setAlignment(Qt.AlignCenter)
-        img_lbl.setStyleSheet("background:transparent;border:none;")
-        inner.addWidget(img_lbl)
+        self._img_lbl = QLabel()
+        self._img_lbl.setAlignment(Qt.AlignCenter)
+        self._img_lbl.setStyleSheet("background:transparent;border:none;")
+        inner.addWidget(self._img_lbl, 1)
+
+    @staticmethod
+    def _resolve_image(carid: str, image_path: Optional[str]) -> Optional[str]:
+        """The supplied path if valid; otherwise default.jpg → MissingTexture."""
+        if image_path and os.path.exists(image_path):
+            return image_path
+        image_path = os.path.join("gui", "images", "vehicles", carid, "default.jpg")
+        if os.path.exists(image_path):
+            return image_path
+        fallback = os.path.join("gui", "images", "common",
+                                "imagepreview", "MissingTexture.jpg")
+        return fallback if os.path.exists(fallback) else None
 
+    def show_hover_preview(self, carid: str, image_path: Optional[str] = None) -> None:
+        print(f"[DEBUG] show_hover_preview: carid={carid!r} path={image_path!r}")
+        image_path = self._resolve_image(carid, image_path)
+        if image_path is None:
+            return
+
+        key = image_cache.key(image_path, PREVIEW_SIZE)
+        px  = image_cache.get(key)
+        if px is None:
+            image = _read_scaled(image_path, *PREVIEW_SIZE)
+            if image is None:
+                return
+            px = image_cache.put_image(key, image)
+
+        vehicle_name = state.get_vehicle_name(carid)
+        self._hdr_lbl.setText(f"{vehicle_name}  |  {carid}")
+        self._img_lbl.setPixmap(px)
+
+        ow, oh = self.overlay.width(), self.overlay.height()
         try:
             cursor = self.app.mapFromGlobal(QCursor.pos())
         except Exception:
@@ -99,10 +180,11 @@ class HoverPreviewManager:
 
         self.overlay.move(x, y)
         self.overlay.raise_()
-        self.overlay.show()
-        # overlay already has drop_shadow (set at creation), so fade_in
-        # will skip the opacity animation — that's fine; it just appears.
-        fade_in(self.overlay, 150)
+        if not self.overlay.isVisible():
+            self.overlay.show()
+            # overlay already has drop_shadow (set at creation), so fade_in
+            # will skip the opacity animation — that's fine; it just appears.
+            fade_in(self.overlay, 150)
 
     def hide_hover_preview(self, force: bool = False) -> None:
         print(f"[DEBUG] hide_hover_preview: hiding preview overlay")
@@ -111,51 +193,24 @@ class HoverPreviewManager:
             self._timer = None
         self._current_carid = None
         self.overlay.hide()
-        self._clear_overlay()
-
-    def _clear_overlay(self) -> None:
-        """Remove all child widgets and detach the current layout.
-
-        Strategy
-        --------
-        1.  Walk the existing layout, hide + reparent each widget to None so
-            Qt drops the reference immediately (deleteLater is deferred and
-            can race with findChildren below).
-        2.  Transfer the now-empty layout to a throwaway QWidget so the
-            overlay's internal layout pointer is cleared.  The throwaway goes
-            out of scope and takes the layout with it.
-        3.  Sweep findChildren for anything that was not in the layout (e.g.
-            widgets parented directly to the overlay).  At this point step 1
-            has already hidden + reparented the layout-owned widgets, so
-            findChildren only returns genuine stragglers.
-        """
-        print(f"[DEBUG] _clear_overlay() called")
-        old_layout = self.overlay.layout()
-        if old_layout is not None:
-            while old_layout.count():
-                item = old_layout.takeAt(0)
-                w = item.widget()
-                if w:
-                    w.hide()
-                    w.setParent(None)   # immediate ref-drop; no deleteLater race
-            _tmp = QWidget()
-            _tmp.setLayout(old_layout)  # Qt reparents layout → overlay ptr cleared
-            # _tmp leaves scope here → layout + empty items collected
-
-        for child in list(self.overlay.findChildren(QWidget)):
-            child.hide()
-            child.setParent(None)
 
     def schedule_hover_preview(self, carid: str, widget: QWidget,
-                               get_image_path=None) -> None:
+                               get_image_path=None, neighbors=None) -> None:
+        """
+        Show carid's preview after the hover delay.  neighbors, if given, is
+        a zero-argument callable returning image paths of the rows around
+        widget; they are prefetched along with carid's own image.
+        """
         print(f"[DEBUG] schedule_hover_preview() called")
         if self._timer:
             self._timer.stop()
         self._current_carid = carid
 
+        img = get_image_path() if callable(get_image_path) else None
+        self._prefetch(carid, img, neighbors)
+
         def _show():
             if self._current_carid == carid:
-                img = get_image_path() if callable(get_image_path) else None
                 self.show_hover_preview(carid, img)
 
         self._timer = QTimer(self.app)
@@ -163,17 +218,32 @@ class HoverPreviewManager:
         self._timer.timeout.connect(_show)
         self._timer.start(500)
 
+    def _prefetch(self, carid: str, image_path: Optional[str], neighbors) -> None:
+        self._prefetcher.drop_queued()
+        own = self._resolve_image(carid, image_path)
+        if own is not None:
+            self._prefetcher.request(own)
+        if callable(neighbors):
+            try:
+                for path in neighbors():
+                    if path and os.path.exists(path):
+                        self._prefetcher.request(path)
+            except Exception as e:
+                print(f"[DEBUG] hover prefetch: neighbors failed: {e}")
+
     def setup_robust_hover(self, widget: QWidget, carid: str,
-                           get_image_path=None) -> None:
+                           get_image_path=None, neighbors=None) -> None:
         print(f"[DEBUG] setup_robust_hover() called")
         """Install enter/leave events recursively on widget and all children.
 
         ``get_image_path`` — optional zero-argument callable that returns the
         image path to show.  It is called at enter time so it always reflects
         whichever variant is currently displayed on the card.
+        ``neighbors`` — see schedule_hover_preview().
         """
         def _enter(event, w=widget, c=carid):
-            self.schedule_hover_preview(c, w, get_image_path=get_image_path)
+            self.schedule_hover_preview(c, w, get_image_path=get_image_path,
+                                        neighbors=neighbors)
 
         def _leave(event):
             self.hide_hover_preview()
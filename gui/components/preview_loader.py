@@ -0,0 +1,118 @@
+"""
+gui/components/preview_loader.py — Decode previews on a worker pool.
+
+Decoding a large DDS can take seconds, so previews are decoded on a
+QThreadPool and handed back to the GUI thread as QImages (QPixmap may only
+be touched on the GUI thread).
+
+Each request is tied to a target widget.  A new request for the same
+target supersedes the old one: if the old decode hasn't started it is
+skipped when its turn comes, and if it is already running its result is
+dropped when it arrives.  Requests for widgets that are on screen are queued with
+a higher priority than those for hidden or scrolled-away widgets.
+
+    loader = PreviewLoader(decode_fn, parent=self)
+    loader.request(label, path, 400, 200, on_ready)    # on_ready(QImage | None)
+"""
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui  import QImage
+from PySide6.QtWidgets import QWidget
+
+PRIORITY_VISIBLE = 10
+PRIORITY_HIDDEN  = 0
+
+DecodeFn = Callable[[str, int, int], Optional[QImage]]
+
+
+def is_on_screen(widget: QWidget) -> bool:
+    """True if some part of widget is currently visible to the user."""
+    try:
+        return widget.isVisible() and not widget.visibleRegion().isEmpty()
+    except RuntimeError:            # C++ object already deleted
+        return False
+
+
+class _PreviewTask(QRunnable):
+
+    # The pool owns and deletes the task; the loader only keeps the
+    # cancelled flag, never the runnable itself.
+
+    def __init__(self, loader: "PreviewLoader", target_id: int, ticket: int,
+                 path: str, max_w: int, max_h: int, cancelled: threading.Event):
+        super().__init__()
+        self._loader    = loader
+        self._target_id = target_id
+        self._ticket    = ticket
+        self._path      = path
+        self._size      = (max_w, max_h)
+        self._cancelled = cancelled
+
+    def run(self):
+        if self._cancelled.is_set():
+            return
+        image = None
+        try:
+            image = self._loader._decode(self._path, *self._size)
+        except Exception as e:
+            print(f"[ERROR] Preview decode failed for {self._path}: {e}")
+        if self._cancelled.is_set():
+            return
+        try:
+            self._loader._finished.emit(self._target_id, self._ticket, image)
+        except RuntimeError:        # loader destroyed while we were decoding
+            pass
+
+
+class PreviewLoader(QObject):
+
+    # target id, ticket, QImage | None — emitted from worker threads,
+    # delivered on the GUI thread (queued connection).
+    _finished = Signal(object, int, object)
+
+    def __init__(self, decode: DecodeFn, parent: Optional[QObject] = None, max_threads: int = 2):
+        super().__init__(parent)
+        self._decode = decode
+        self._pool   = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._tickets = 0
+        # target id → (ticket, cancelled flag, callback)
+        self._pending: Dict[int, Tuple[int, threading.Event, Callable]] = {}
+        self._finished.connect(self._deliver)
+
+    def request(self, target: QWidget, path: str, max_w: int, max_h: int,
+                on_ready: Callable[[Optional[QImage]], None]) -> None:
+        """Decode path for target; on_ready(image) runs on the GUI thread."""
+        self.cancel(target)
+        self._tickets += 1
+        target_id = id(target)
+        cancelled = threading.Event()
+        self._pending[target_id] = (self._tickets, cancelled, on_ready)
+        priority = PRIORITY_VISIBLE if is_on_screen(target) else PRIORITY_HIDDEN
+        self._pool.start(_PreviewTask(self, target_id, self._tickets, path, max_w, max_h, cancelled),
+                         priority)
+
+    def cancel(self, target: QWidget) -> None:
+        """Drop the outstanding request for target, if any."""
+        entry = self._pending.pop(id(target), None)
+        if entry is not None:
+            entry[1].set()
+
+    def cancel_all(self) -> None:
+        for _, cancelled, _ in self._pending.values():
+            cancelled.set()
+        self._pending.clear()
+
+    def _deliver(self, target_id: int, ticket: int, image) -> None:
+        entry = self._pending.get(target_id)
+        if entry is None or entry[0] != ticket:
+            return                  # superseded by a newer request
+        del self._pending[target_id]
+        try:
+            entry[2](image)
+        except RuntimeError:        # target widget was deleted meanwhile
+            pass
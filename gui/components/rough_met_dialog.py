@@ -0,0 +1,441 @@
+"""
+gui/components/rough_met_dialog.py — Build a rough_met.png inside the app.
+
+Two modes, both backed by core.rough_met:
+
+  Separate maps   roughness / metallic / clear coat, each either a
+                  greyscale map or a constant value
+  Material mask   an ID-colour mask plus values for each colour found in it
+
+Composing runs on a worker thread; on success `result_path` holds the
+written file and the dialog is accepted.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore    import Qt, QThread, Signal
+from PySide6.QtGui     import QColor
+from PySide6.QtWidgets import (
+    QDialog, QWidget, QLabel, QPushButton, QLineEdit, QDoubleSpinBox,
+    QVBoxLayout, QHBoxLayout, QGridLayout, QButtonGroup, QStackedWidget,
+    QScrollArea, QFileDialog,
+)
+
+from gui.theme import COLORS, font
+
+try:
+    from core.localization import t
+except ImportError:
+    def t(key, default=None, **kw): return default if default is not None else key
+
+try:
+    from core.rough_met import (
+        compose_rough_met, compose_rough_met_from_mask, mask_ids,
+        available as _rough_met_available, RoughMetError, DEFAULT_VALUES,
+    )
+    _ROUGH_MET_OK = True
+except ImportError as _rm_imp_exc:
+    print(f"[DEBUG] rough_met_dialog: core.rough_met not available: {_rm_imp_exc}")
+    _ROUGH_MET_OK = False
+    DEFAULT_VALUES = (0.7, 0.0, 0.0)
+    def _rough_met_available(): return False
+
+
+_MAX_MASK_IDS = 16
+
+
+def _spin(value: float) -> QDoubleSpinBox:
+    box = QDoubleSpinBox()
+    box.setRange(0.0, 1.0)
+    box.setSingleStep(0.05)
+    box.setDecimals(2)
+    box.setValue(value)
+    box.setFixedHeight(32)
+    box.setFixedWidth(80)
+    box.setFont(font(12))
+    box.setStyleSheet(f"""
+        QDoubleSpinBox {{
+            background:{COLORS['frame_bg']};
+            color:{COLORS['text']};
+            border:1px solid {COLORS['border']};
+            border-radius:6px;
+            padding:2px 6px;
+        }}
+        QDoubleSpinBox:focus {{ border-color:{COLORS['border_focus']}; }}
+    """)
+    return box
+
+
+def _text_label(text: str, secondary: bool = False, size: int = 12, weight: str = "normal") -> QLabel:
+    lbl = QLabel(text)
+    lbl.setFont(font(size, weight))
+    colour = COLORS["text_secondary"] if secondary else COLORS["text"]
+    lbl.setStyleSheet(f"color:{colour};background:transparent;border:none;")
+    return lbl
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Background compose worker
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _ComposeWorker(QThread):
+    """Runs one compose call off the GUI thread."""
+
+    succeeded = Signal(str, int, int)     # dest, width, height
+    failed    = Signal(str)
+
+    def __init__(self, fn, args: tuple, dest: str, parent=None):
+        super().__init__(parent)
+        self._fn   = fn
+        self._args = args
+        self._dest = dest
+
+    def run(self):
+        try:
+            w, h = self._fn(self._dest, *self._args)
+            self.succeeded.emit(self._dest, w, h)
+        except RoughMetError as e:
+            self.failed.emit(str(e))
+        except Exception as e:
+            print(f"[ERROR] rough_met compose failed: {e}")
+            self.failed.emit(str(e))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Dialog
+# ─────────────────────────────────────────────────────────────────────────────
+
+class RoughMetComposerDialog(QDialog):
+
+    def __init__(self, parent: QWidget = None, default_dest: str = ""):
+        super().__init__(parent, Qt.FramelessWindowHint | Qt.Dialog)
+        self.result_path: Optional[str] = None
+        self._default_dest = default_dest
+        self._worker: Optional[_ComposeWorker] = None
+
+        # channel → (path entry, constant spinbox, browse/clear button)
+        self._map_rows: Dict[str, Tuple[QLineEdit, QDoubleSpinBox, QPushButton]] = {}
+        # mask colour → (rough, metal, coat) spinboxes
+        self._mask_rows: List[Tuple[Tuple[int, int, int], Tuple[QDoubleSpinBox, ...]]] = []
+        self._mask_path = ""
+
+        self.setModal(True)
+        self.resize(620, 520)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background:{COLORS['app_bg']};
+                color:{COLORS['text']};
+                border: 1px solid {COLORS['border']};
+                border-radius: 14px;
+            }}
+        """)
+        self._setup_ui()
+
+    # ── UI ───────────────────────────────────────────────────────────────────
+
+    def _setup_ui(self):
+        root = QVBoxLayout(self)
+        root.setContentsMargins(24, 20, 24, 20)
+        root.setSpacing(12)
+
+        root.addWidget(_text_label(t("rough_met.title", default="Compose Reflectivity Map"), size=18, weight="bold"))
+        root.addWidget(_text_label(
+            t("rough_met.subtitle", default="Packs clear coat (R), roughness (G) and "
+                                            "metallic (B) into one rough_met.png."),
+            secondary=True,
+        ))
+
+        mode_row = QHBoxLayout()
+        self._mode_group = QButtonGroup(self)
+        self._mode_group.setExclusive(True)
+        modes = (t("rough_met.mode_maps", default="Separate maps"),
+                 t("rough_met.mode_mask", default="Material mask"))
+        for idx, text in enumerate(modes):
+            btn = QPushButton(text)
+            btn.setCheckable(True)
+            btn.setFont(font(12, "bold"))
+            btn.setFixedHeight(32)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.setStyleSheet(self._toggle_style())
+            self._mode_group.addButton(btn, idx)
+            mode_row.addWidget(btn)
+        mode_row.addStretch()
+        root.addLayout(mode_row)
+
+        self._pages = QStackedWidget()
+        self._pages.addWidget(self._build_maps_page())
+        self._pages.addWidget(self._build_mask_page())
+        root.addWidget(self._pages, 1)
+        self._mode_group.idClicked.connect(self._pages.setCurrentIndex)
+        self._mode_group.button(0).setChecked(True)
+
+        self._status = _text_label("", secondary=True)
+        self._status.setWordWrap(True)
+        if not _ROUGH_MET_OK or not _rough_met_available():
+            self._status.setText(t("rough_met.missing_deps",
+                                   default="Composing needs numpy and Pillow, which are not installed."))
+        root.addWidget(self._status)
+
+        btn_row = QHBoxLayout()
+        btn_row.addStretch()
+        cancel_btn = self._button(t("common.cancel", default="Cancel"), primary=False)
+        cancel_btn.clicked.connect(self.reject)
+        btn_row.addWidget(cancel_btn)
+        self._compose_btn = self._button(t("rough_met.compose", default="Compose…"), primary=True)
+        self._compose_btn.clicked.connect(self._compose)
+        self._compose_btn.setEnabled(_ROUGH_MET_OK and _rough_met_available())
+        btn_row.addWidget(self._compose_btn)
+        root.addLayout(btn_row)
+
+    def _build_maps_page(self) -> QWidget:
+        page = QWidget()
+        page.setStyleSheet("background:transparent;")
+        grid = QGridLayout(page)
+        grid.setContentsMargins(0, 8, 0, 0)
+        grid.setHorizontalSpacing(8)
+        grid.setVerticalSpacing(10)
+        grid.addWidget(_text_label(t("rough_met.map_optional", default="Map (optional)"),
+                                   secondary=True), 0, 1)
+        grid.addWidget(_text_label(t("rough_met.or_value", default="or value"), secondary=True), 0, 3)
+
+        rows = (("roughness", DEFAULT_VALUES[0]),
+                ("metallic",  DEFAULT_VALUES[1]),
+                ("clearcoat", DEFAULT_VALUES[2]))
+        for r, (key, value) in enumerate(rows, start=1):
+            title = self._channel_title(key)
+            grid.addWidget(_text_label(title, weight="bold"), r, 0)
+            entry = QLineEdit()
+            entry.setReadOnly(True)
+            entry.setPlaceholderText(t("rough_met.constant_value", default="Constant value"))
+            entry.setFixedHeight(32)
+            entry.setFont(font(12))
+            entry.setStyleSheet(self._entry_style())
+            grid.addWidget(entry, r, 1)
+            browse = self._button("…", primary=False, width=36)
+            browse.clicked.connect(lambda _=False, k=key: self._browse_map(k))
+            grid.addWidget(browse, r, 2)
+            spin = _spin(value)
+            grid.addWidget(spin, r, 3)
+            self._map_rows[key] = (entry, spin, browse)
+        grid.setColumnStretch(1, 1)
+        grid.setRowStretch(len(rows) + 1, 1)
+        return page
+
+    def _build_mask_page(self) -> QWidget:
+        page = QWidget()
+        page.setStyleSheet("background:transparent;")
+        col = QVBoxLayout(page)
+        col.setContentsMargins(0, 8, 0, 0)
+        col.setSpacing(8)
+
+        row = QHBoxLayout()
+        self._mask_entry = QLineEdit()
+        self._mask_entry.setReadOnly(True)
+        self._mask_entry.setPlaceholderText(t("rough_met.mask_placeholder", default="Material ID mask"))
+        self._mask_entry.setFixedHeight(32)
+        self._mask_entry.setFont(font(12))
+        self._mask_entry.setStyleSheet(self._entry_style())
+        row.addWidget(self._mask_entry, 1)
+        browse = self._button(t("common.browse", default="Browse"), primary=False)
+        browse.clicked.connect(self._browse_mask)
+        row.addWidget(browse)
+        col.addLayout(row)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll.setStyleSheet("""
+            QScrollArea { background:transparent; border:none; }
+            QScrollArea > QWidget > QWidget { background:transparent; }
+        """)
+        self._mask_table = QWidget()
+        self._mask_grid  = QGridLayout(self._mask_table)
+        self._mask_grid.setContentsMargins(0, 0, 0, 0)
+        self._mask_grid.setVerticalSpacing(6)
+        scroll.setWidget(self._mask_table)
+        col.addWidget(scroll, 1)
+
+        default_row = QHBoxLayout()
+        default_row.addWidget(_text_label(t("rough_met.other_colors", default="Other colours"), secondary=True))
+        default_row.addStretch()
+        self._mask_default = tuple(_spin(v) for v in DEFAULT_VALUES)
+        for box in self._mask_default:
+            default_row.addWidget(box)
+        col.addLayout(default_row)
+        return page
+
+    # ── Inputs ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _channel_title(key: str) -> str:
+        defaults = {"roughness": "Roughness", "metallic": "Metallic", "clearcoat": "Clear coat"}
+        return t(f"rough_met.{key}", default=defaults[key])
+
+    @staticmethod
+    def _image_filter() -> str:
+        return t("rough_met.image_filter",
+                 default="Images (*.png *.jpg *.jpeg *.tga *.tif *.tiff);;All files (*.*)")
+
+    def _browse_map(self, key: str):
+        entry, spin, browse = self._map_rows[key]
+        if entry.text():                # second click clears back to a constant
+            entry.clear()
+            spin.setEnabled(True)
+            browse.setText("…")
+            return
+        channel = self._channel_title(key).lower()
+        title = t("rough_met.select_map_title", default=f"Select {channel} map", channel=channel)
+        path, _ = QFileDialog.getOpenFileName(self, title, "", self._image_filter())
+        if path:
+            entry.setText(path)
+            spin.setEnabled(False)
+            browse.setText("✕")
+
+    def _browse_mask(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, t("rough_met.select_mask_title", default="Select material ID mask"), "",
+            self._image_filter(),
+        )
+        if not path:
+            return
+        try:
+            found = mask_ids(path, limit=_MAX_MASK_IDS)
+        except Exception as e:
+            print(f"[ERROR] rough_met_dialog: reading mask {path!r} failed: {e}")
+            self._status.setText(t("rough_met.mask_read_failed",
+                                   default=f"Could not read mask: {e}", error=e))
+            return
+        self._mask_path = path
+        self._mask_entry.setText(path)
+        self._fill_mask_table(found)
+
+    def _fill_mask_table(self, found):
+        while self._mask_grid.count():
+            item = self._mask_grid.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self._mask_rows.clear()
+
+        headers = (t("rough_met.col_color", default="Colour"),
+                   t("rough_met.col_share", default="Share"),
+                   t("rough_met.col_rough", default="Rough"),
+                   t("rough_met.col_metal", default="Metal"),
+                   t("rough_met.col_coat",  default="Coat"))
+        for c, title in enumerate(headers):
+            self._mask_grid.addWidget(_text_label(title, secondary=True), 0, c)
+        for r, (rgb, share) in enumerate(found, start=1):
+            swatch = QLabel()
+            swatch.setFixedSize(28, 20)
+            swatch.setStyleSheet(
+                f"background:{QColor(*rgb).name()};border:1px solid {COLORS['border']};border-radius:4px;"
+            )
+            self._mask_grid.addWidget(swatch, r, 0)
+            self._mask_grid.addWidget(_text_label(f"{share * 100:.1f}%", secondary=True), r, 1)
+            boxes = tuple(_spin(v) for v in DEFAULT_VALUES)
+            for c, box in enumerate(boxes, start=2):
+                self._mask_grid.addWidget(box, r, c)
+            self._mask_rows.append((rgb, boxes))
+        self._mask_grid.setRowStretch(len(found) + 1, 1)
+        self._status.setText(t("rough_met.colors_found", default=f"{len(found)} material colour(s) found.",
+                               count=len(found)))
+
+    # ── Compose ──────────────────────────────────────────────────────────────
+
+    def _compose(self):
+        if self._pages.currentIndex() == 0:
+            sources = {}
+            for key, (entry, spin, _) in self._map_rows.items():
+                sources[key] = entry.text() or spin.value()
+            if not any(isinstance(v, str) for v in sources.values()):
+                self._status.setText(t("rough_met.need_map",
+                                       default="Pick at least one map to set the output size."))
+                return
+            fn   = compose_rough_met
+            args = (sources["roughness"], sources["metallic"], sources["clearcoat"])
+        else:
+            if not self._mask_path:
+                self._status.setText(t("rough_met.need_mask", default="Pick a material ID mask first."))
+                return
+            values = {rgb: tuple(b.value() for b in boxes) for rgb, boxes in self._mask_rows}
+            fn   = compose_rough_met_from_mask
+            args = (self._mask_path, values, tuple(b.value() for b in self._mask_default))
+
+        dest, _ = QFileDialog.getSaveFileName(
+            self, t("rough_met.save_title", default="Save Reflectivity Map"),
+            self._default_dest or "rough_met.png",
+            t("rough_met.png_filter", default="PNG files (*.png)"),
+        )
+        if not dest:
+            return
+        if not dest.lower().endswith(".png"):
+            dest += ".png"
+
+        self._compose_btn.setEnabled(False)
+        self._status.setText(t("rough_met.composing", default="Composing…"))
+        self._worker = _ComposeWorker(fn, args, dest, parent=self)
+        self._worker.succeeded.connect(self._on_composed)
+        self._worker.failed.connect(self._on_failed)
+        self._worker.start()
+
+    def _on_composed(self, dest: str, w: int, h: int):
+        print(f"[DEBUG] RoughMetComposerDialog: wrote {w}x{h} {dest!r}")
+        self.result_path = dest
+        self.accept()
+
+    def _on_failed(self, message: str):
+        self._status.setText(t("rough_met.failed", default=f"Compose failed: {message}", error=message))
+        self._compose_btn.setEnabled(True)
+
+    def reject(self):
+        if self._worker is not None and self._worker.isRunning():
+            return                      # let the write finish; it's atomic but not cancellable
+        super().reject()
+
+    # ── Styles ───────────────────────────────────────────────────────────────
+
+    def _button(self, text: str, primary: bool, width: int = 0) -> QPushButton:
+        btn = QPushButton(text)
+        btn.setFont(font(12, "bold"))
+        btn.setFixedHeight(32)
+        if width:
+            btn.setFixedWidth(width)
+        btn.setCursor(Qt.PointingHandCursor)
+        if primary:
+            bg, hover, fg = COLORS["accent"], COLORS["accent_hover"], COLORS["accent_text"]
+        else:
+            bg, hover, fg = COLORS["card_bg"], COLORS["card_hover"], COLORS["text"]
+        btn.setStyleSheet(f"""
+            QPushButton {{
+                background:{bg};color:{fg};
+                border-radius:8px;border:none;
+                padding:4px 14px;
+            }}
+            QPushButton:hover {{ background:{hover}; }}
+            QPushButton:disabled {{ background:{COLORS['border']};color:{COLORS['text_secondary']}; }}
+        """)
+        return btn
+
+    def _toggle_style(self) -> str:
+        return f"""
+            QPushButton {{
+                background:{COLORS['card_bg']};color:{COLORS['text']};
+                border:1px solid {COLORS['border']};border-radius:8px;
+                padding:4px 14px;
+            }}
+            QPushButton:checked {{
+                background:{COLORS['accent']};color:{COLORS['accent_text']};
+                border-color:{COLORS['accent']};
+            }}
+        """
+
+    def _entry_style(self) -> str:
+        return f"""
+            QLineEdit {{
+                background:{COLORS['card_bg']};
+                color:{COLORS['text']};
+                border:1px solid {COLORS['border']};
+                border-radius:8px;
+                padding:4px 10px;
+            }}
+        """
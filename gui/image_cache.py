@@ -0,0 +1,171 @@
+"""
+gui/image_cache.py — Process-wide in-memory cache of scaled pixmaps.
+
+The car list cards, the hover preview and the generator previews all show
+the same handful of images at a few fixed sizes.  Instead of each of them
+loading and scaling the source file again on every resize or hover, they
+ask this cache for (path, target size, transform) and get back a ready
+QPixmap.
+
+Entries are keyed by the file's path and mtime, so an edited image is
+picked up automatically.  The cache holds at most `budget` bytes of pixel
+data (data/app_settings.json → "image_cache_mb", default 96 MB) and drops
+the least recently used pixmaps beyond that.
+
+GUI thread only — QPixmap must not be created elsewhere.  Worker threads
+produce QImages and hand them to put_image() once back on the GUI thread.
+
+    from gui.image_cache import image_cache
+    px = image_cache.pixmap(path, (280, 200))                     # scaled to fit
+    px = image_cache.pixmap(path, (w, h), "card", make_card)      # custom transform
+"""
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui  import QImage, QPixmap
+
+DEFAULT_BUDGET_MB = 96
+
+FIT   = "fit"      # scale to fit inside size, keep aspect ratio
+COVER = "cover"    # scale to fill size, keep aspect ratio, centre-crop
+
+Size = Optional[Tuple[int, int]]
+Key  = Tuple[str, int, int, int, str]
+
+
+def _budget_from_settings() -> int:
+    try:
+        from core.settings import app_settings
+        mb = int(app_settings.get("image_cache_mb", DEFAULT_BUDGET_MB))
+    except Exception:
+        mb = DEFAULT_BUDGET_MB
+    return max(8, mb) * 1024 * 1024
+
+
+def _pixmap_bytes(px: QPixmap) -> int:
+    return px.width() * px.height() * max(px.depth(), 8) // 8
+
+
+def _apply(src: QPixmap, size: Size, transform: str) -> QPixmap:
+    if size is None:
+        return src
+    w, h = size
+    if transform == COVER:
+        scaled = src.scaled(w, h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        return scaled.copy(max(0, (scaled.width() - w) // 2),
+                           max(0, (scaled.height() - h) // 2), w, h)
+    return src.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+class ImageCache:
+
+    def __init__(self, budget: Optional[int] = None):
+        self._budget = budget
+        self._entries: "OrderedDict[Key, QPixmap]" = OrderedDict()   # oldest first
+        self._bytes  = 0
+        self.hits    = 0
+        self.misses  = 0
+
+    # ── Keys ─────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def key(path: str, size: Size = None, transform: str = FIT) -> Optional[Key]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        w, h = size if size is not None else (0, 0)
+        return os.path.normcase(os.path.abspath(path)), mtime, w, h, transform
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    def get(self, key: Optional[Key]) -> Optional[QPixmap]:
+        if key is None:
+            return None
+        px = self._entries.get(key)
+        if px is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return px
+
+    def pixmap(self, path: str, size: Size = None, transform: str = FIT,
+               make: Optional[Callable[[QPixmap], QPixmap]] = None) -> QPixmap:
+        """
+        path loaded and transformed, from the cache when possible.
+
+        transform : FIT, COVER, or the name of a custom transform; for a
+                    custom one pass make(source) -> QPixmap, and keep the
+                    name unique to what make() does (including parameters
+                    such as a corner radius).
+        Returns a null QPixmap if the file can't be read; failures are not
+        cached.
+        """
+        key = self.key(path, size, transform)
+        px  = self.get(key)
+        if px is not None:
+            return px
+        src = QPixmap(path)
+        if src.isNull():
+            return src
+        px = make(src) if make is not None else _apply(src, size, transform)
+        self.put(key, px)
+        return px
+
+    # ── Stores ───────────────────────────────────────────────────────────────
+
+    def put(self, key: Optional[Key], px: QPixmap) -> None:
+        if key is None or px is None or px.isNull():
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= _pixmap_bytes(old)
+        self._entries[key] = px
+        self._bytes += _pixmap_bytes(px)
+        self._evict()
+
+    def put_image(self, key: Optional[Key], image: QImage) -> QPixmap:
+        """Convert a worker-thread QImage and store it; returns the pixmap."""
+        px = QPixmap.fromImage(image)
+        self.put(key, px)
+        return px
+
+    # ── Budget ───────────────────────────────────────────────────────────────
+
+    @property
+    def budget(self) -> int:
+        if self._budget is None:
+            self._budget = _budget_from_settings()
+        return self._budget
+
+    def set_budget(self, budget: int) -> None:
+        self._budget = budget
+        self._evict()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _evict(self) -> None:
+        budget = self.budget
+        while self._bytes > budget and len(self._entries) > 1:
+            _, px = self._entries.popitem(last=False)
+            self._bytes -= _pixmap_bytes(px)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget every size/transform of path, or everything."""
+        if path is None:
+            self._entries.clear()
+            self._bytes = 0
+            return
+        norm = os.path.normcase(os.path.abspath(path))
+        for key in [k for k in self._entries if k[0] == norm]:
+            self._bytes -= _pixmap_bytes(self._entries.pop(key))
+
+
+image_cache = ImageCache()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import os
-from typing import Dict, Optional
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 from PySide6.QtCore    import Qt, QTimer, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui     import QPixmap, QIcon, QColor
@@ -80,10 +81,14 @@ class BeamSkinStudioApp(QMainWindow):
         self._root_layout.setContentsMargins(0, 0, 0, 0)
         self._root_layout.setSpacing(0)
 
-        self.tabs: Dict[str, QWidget] = {}
+        self.tabs: Dict[str, QWidget] = {}       # tabs built so far
+        self._tab_factories: Dict[str, Callable[[], Tuple[type, dict]]] = {}
         self.current_tab = "generator"
 
+        self._started = time.perf_counter()
         self._setup_ui()
+        print(f"[DEBUG] startup: UI built in "
+              f"{(time.perf_counter() - self._started) * 1000:.0f} ms")
         self.show()
         self._post_init()
 
@@ -122,74 +127,101 @@ class BeamSkinStudioApp(QMainWindow):
         self._build_tabs()
 
     def _build_tabs(self):
-        print(f"[DEBUG] _build_tabs: building all tab widgets")
-        from gui.tabs.generator    import GeneratorTab
-        from gui.tabs.howto        import HowToTab
-        from gui.tabs.car_list     import CarListTab
-        from gui.tabs.add_vehicles import AddVehiclesTab
-        from gui.tabs.settings     import SettingsTab
-        from gui.tabs.about        import AboutTab
-
+        """
+        Register every tab, but only build the one shown at launch.  The
+        others are built by switch_view() the first time they are opened;
+        until then they are absent from self.tabs.
+        """
+        print(f"[DEBUG] _build_tabs: registering tab factories")
         try:
             from gui.tabs.online_tab import OnlineTab as _OnlineTab
-            _online_cls    = _OnlineTab
-            _online_kwargs = {"notification_callback": self.show_notification}
+            _online = lambda: (_OnlineTab, {"notification_callback": self.show_notification})
         except Exception as e:
             print(f"[WARN] Could not import OnlineTab: {e}")
-            _online_cls    = OnlineUnavailableTab
-            _online_kwargs = {}
-
-        tab_classes = {
-            "generator":    (GeneratorTab,   {"preview_manager": self.preview_manager,
-                                               "notification_callback": self.show_notification}),
-            "howto":        (HowToTab,       {}),
-            "carlist":      (CarListTab,     {}),
-            "add_vehicles": (AddVehiclesTab, {"notification_callback": self.show_notification,
-                                               "refresh_vehicle_list_callback": self._refresh_vehicle_list}),
-            "settings":     (SettingsTab,    {"notification_callback": self.show_notification}),
-            "about":        (AboutTab,       {}),
-            "online_tab":   (_online_cls,    _online_kwargs),
+            _online = lambda: (OnlineUnavailableTab, {})
+
+        def _generator():
+            from gui.tabs.generator import GeneratorTab
+            return GeneratorTab, {"preview_manager": self.preview_manager,
+                                  "notification_callback": self.show_notification}
+
+        def _howto():
+            from gui.tabs.howto import HowToTab
+            return HowToTab, {}
+
+        def _carlist():
+            from gui.tabs.car_list import CarListTab
+            return CarListTab, {}
+
+        def _add_vehicles():
+            from gui.tabs.add_vehicles import AddVehiclesTab
+            return AddVehiclesTab, {"notification_callback": self.show_notification,
+                                    "refresh_vehicle_list_callback": self._refresh_vehicle_list}
+
+        def _settings():
+            from gui.tabs.settings import SettingsTab
+            return SettingsTab, {"notification_callback": self.show_notification}
+
+        def _about():
+            from gui.tabs.about import AboutTab
+            return AboutTab, {}
+
+        self._tab_factories = {
+            "generator":    _generator,
+            "howto":        _howto,
+            "carlist":      _carlist,
+            "add_vehicles": _add_vehicles,
+            "settings":     _settings,
+            "about":        _about,
+            "online_tab":   _online,
         }
+        self.switch_view("generator")
+
+    def _ensure_tab(self, name: str) -> Optional[QWidget]:
+        """Return tab name, building it on first use."""
+        tab = self.tabs.get(name)
+        if tab is not None or name not in self._tab_factories:
+            return tab
 
-        for name, (cls, kwargs) in tab_classes.items():
+        started = time.perf_counter()
+        try:
+            cls, kwargs = self._tab_factories[name]()
             try:
                 tab = cls(self, **kwargs)
             except TypeError:
-                try:
-                    tab = cls(self)
-                except Exception as e:
-                    print(f"[ERROR] Could not create tab '{name}': {e}")
-                    tab = OnlineUnavailableTab(self)
-            except Exception as e:
-                print(f"[ERROR] Could not create tab '{name}': {e}")
-                import traceback; traceback.print_exc()
-                tab = OnlineUnavailableTab(self)
-
-            self.tabs[name] = tab
-            self._stack.addWidget(tab)
-
-        gen = self.tabs.get("generator")
-        if gen and hasattr(gen, "add_car_to_project"):
-            self.sidebar.populate_vehicles(self._add_vehicle_from_sidebar)
-        self.switch_view("generator")
-
-        if gen and hasattr(gen, "set_sidebar_references"):
-            gen.set_sidebar_references(
-                self.sidebar._mod_entry,
-                self.sidebar._author_entry,
-            )
+                tab = cls(self)
+        except Exception as e:
+            print(f"[ERROR] Could not create tab '{name}': {e}")
+            import traceback; traceback.print_exc()
+            tab = OnlineUnavailableTab(self)
+
+        self.tabs[name] = tab
+        self._stack.addWidget(tab)
+
+        if name == "generator":
+            if hasattr(tab, "add_car_to_project"):
+                self.sidebar.populate_vehicles(self._add_vehicle_from_sidebar)
+            if hasattr(tab, "set_sidebar_references"):
+                tab.set_sidebar_references(
+                    self.sidebar._mod_entry,
+                    self.sidebar._author_entry,
+                )
+        print(f"[DEBUG] startup: built tab {name!r} in "
+              f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return tab
 
 
     def switch_view(self, view_name: str):
         print(f"[DEBUG] switch_view: switching to {view_name!r}")
-        if view_name not in self.tabs:
+        tab = self._ensure_tab(view_name)
+        if tab is None:
             print(f"[DEBUG] Tab '{view_name}' not found")
             return
 
         self.topbar.set_active(view_name)
         self.sidebar.setVisible(view_name == "generator")
 
-        idx = self._stack.indexOf(self.tabs[view_name])
+        idx = self._stack.indexOf(tab)
         self._stack.setCurrentIndex(idx)
         self.current_tab = view_name
 
@@ -290,8 +322,20 @@ class BeamSkinStudioApp(QMainWindow):
 
     def _post_init(self):
         print(f"[DEBUG] _post_init() called")
+        QTimer.singleShot(0, self._report_first_paint)
         QTimer.singleShot(150, self._apply_startup_language)
 
+    def _report_first_paint(self):
+        print(f"[DEBUG] startup: window shown after "
+              f"{(time.perf_counter() - self._started) * 1000:.0f} ms")
+        # The car list isn't built yet, but the sidebar's hover previews
+        # read the vehicle image index too.
+        try:
+            from utils.vehicle_images import vehicle_images
+            vehicle_images.warm()
+        except ImportError:
+            pass
+
     def _apply_startup_language(self):
         try:
             from core.localization import set_language
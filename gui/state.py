@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Dict, List, Tuple, Optional, Any
 
+from PySide6.QtCore import QObject, Qt, Signal, Slot
+
 from gui.theme import COLORS, ThemeManager
 
 try:
@@ -20,6 +22,33 @@ try:
 except ImportError:
     CURRENT_VERSION = "1.0.0"
 
+try:
+    from utils.vehicle_catalog import catalog as _vehicle_catalog
+except ImportError:
+    _vehicle_catalog = None  # type: ignore
+
+
+class _CatalogEvents(QObject):
+    """
+    Carries VehicleCatalog change events onto the Qt main thread.
+    Catalog listeners run on whichever thread made the change (often an
+    import worker); _incoming is queued so changed always fires on the
+    GUI thread, after state.added_vehicles has been updated.
+    """
+
+    _incoming = Signal(object)
+    changed   = Signal(object)   # utils.vehicle_catalog.CatalogChange
+
+    def __init__(self, apply_fn):
+        super().__init__()
+        self._apply = apply_fn
+        self._incoming.connect(self._deliver, Qt.QueuedConnection)
+
+    @Slot(object)
+    def _deliver(self, change):
+        self._apply(change)
+        self.changed.emit(change)
+
 
 class StateManager:
     """Singleton application state."""
@@ -55,6 +84,12 @@ class StateManager:
             if not hasattr(self._settings_module, "added_vehicles"):
                 self._settings_module.added_vehicles = self._local_added_vehicles
 
+        # Connect to catalog_events.changed to react to vehicles / variants
+        # being added or removed without re-reading added_vehicles.json.
+        self.catalog_events = _CatalogEvents(self._apply_catalog_change)
+        if _vehicle_catalog is not None:
+            _vehicle_catalog.subscribe(self.catalog_events._incoming.emit)
+
         # project
         self.project_data: Dict[str, Any] = {
             "mod_name":        "My Mod",
@@ -216,26 +251,34 @@ class StateManager:
 
 
     def reload_added_vehicles(self) -> bool:
-        import json, os
-        # Resolve relative to this file rather than the process working
-        # directory, which varies depending on how the app is launched.
-        _base = os.path.dirname(os.path.abspath(__file__))
-        path  = os.path.join(_base, "vehicles", "added_vehicles.json")
-        if not os.path.exists(path):
+        """Re-read added_vehicles.json through the catalog (e.g. after an
+        external edit).  Listeners of catalog_events are notified."""
+        if _vehicle_catalog is None:
             return False
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-            self.added_vehicles.clear()
-            self.added_vehicles.update(loaded)
-            for cid, name in loaded.items():
-                if cid not in self.vehicle_ids:
-                    self.vehicle_ids[cid] = name
+            _vehicle_catalog.reload()
+            self._apply_catalog_change(None)
             return True
         except Exception as e:
             print(f"[ERROR] reload_added_vehicles: {e}")
             return False
 
+    def _apply_catalog_change(self, change) -> None:
+        """Mirror a catalog change into added_vehicles; None means resync all."""
+        added = self.added_vehicles
+        if change is None or change.reloaded:
+            added.clear()
+            added.update(_vehicle_catalog.vehicles())
+            changed = added
+        else:
+            for cid in change.removed_vehicles:
+                added.pop(cid, None)
+            added.update(change.added_vehicles)
+            changed = change.added_vehicles
+        for cid, name in changed.items():
+            if cid not in self.vehicle_ids:
+                self.vehicle_ids[cid] = name
+
 
     def get_vehicle_name(self, carid: str) -> str:
         if carid in self.added_vehicles:
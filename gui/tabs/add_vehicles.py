@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import shutil
 from typing import Optional, List
 
 from PySide6.QtCore    import Qt, Signal, QTimer, QThread
@@ -26,18 +25,23 @@ try:
         delete_custom_vehicle,
         process_custom_variant,
         delete_custom_variant,
+        process_multiple_vehicles,
     )
     from utils.file_ops import (
         load_added_vehicles_json,
         load_added_variants_json,
     )
+    from utils.vehicle_catalog import catalog as vehicle_catalog
+    from utils.vehicle_images import vehicle_images
     _BACKEND_OK = True
 except ImportError as _e:
     print(f"[WARNING] add_vehicles tab: backend import failed: {_e}")
     _BACKEND_OK = False
 
 try:
-    from core.mod_scanner import scan_mod, DiscoveredVehicle, DiscoveredVariant
+    from core.mod_scanner import (
+        iter_scan_mod, open_mod_source, mod_source_batch, DiscoveredVehicle, DiscoveredVariant,
+    )
     _SCANNER_OK = True
 except ImportError:
     _SCANNER_OK = False
@@ -68,10 +72,8 @@ def _carid_exists(carid: str) -> bool:
     if carid in builtin:
         return True
     # 2. Custom vehicles the user has already imported
-    if _BACKEND_OK:
-        added = load_added_vehicles_json()
-        if carid in added:
-            return True
+    if _BACKEND_OK and vehicle_catalog.has_vehicle(carid):
+        return True
     return False
 
 
@@ -79,7 +81,8 @@ def _carid_exists(carid: str) -> bool:
 # UV-map copy helper (used by smart import)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _copy_uv_maps_to_images(carid: str, uv_map_paths: list) -> None:
+def _copy_uv_maps_to_images(carid: str, uv_map_paths: list,
+                            archive_path: Optional[str] = None) -> None:
     """
     Copy UV-layout images found during mod scanning into the vehicle's local
     image folder (``gui/images/vehicles/{carid}/``) so that CarListTab can
@@ -87,7 +90,12 @@ def _copy_uv_maps_to_images(carid: str, uv_map_paths: list) -> None:
     BeamNG to be installed.
 
     Files are only written if they do not already exist at the destination,
-    so repeated imports are safe.
+    so repeated imports are safe.  When archive_path is set the paths are
+    members of that mod zip and are streamed straight out of it.
+
+    The import has already committed the vehicle to the catalog (which
+    rescanned its images) by the time this runs, so the image index is
+    refreshed again once new files land.
     """
     if not uv_map_paths:
         return
@@ -96,14 +104,20 @@ def _copy_uv_maps_to_images(carid: str, uv_map_paths: list) -> None:
     _gui_dir  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     dest_dir  = os.path.join(_gui_dir, "images", "vehicles", carid)
     os.makedirs(dest_dir, exist_ok=True)
-    for src in uv_map_paths:
-        try:
-            dest = os.path.join(dest_dir, os.path.basename(src))
-            if not os.path.exists(dest):
-                shutil.copy2(src, dest)
-                print(f"[add_vehicles] Copied UV map: {os.path.basename(src)} → {dest_dir}")
-        except Exception as e:
-            print(f"[WARNING] _copy_uv_maps_to_images: could not copy {src}: {e}")
+    copied = 0
+    with open_mod_source(archive_path) as fs:
+        for src in uv_map_paths:
+            try:
+                name = fs.basename(src)
+                dest = os.path.join(dest_dir, name)
+                if not os.path.exists(dest):
+                    fs.copy_to(src, dest)
+                    copied += 1
+                    print(f"[add_vehicles] Copied UV map: {name} → {dest_dir}")
+            except Exception as e:
+                print(f"[WARNING] _copy_uv_maps_to_images: could not copy {src}: {e}")
+    if copied:
+        vehicle_images.refresh(carid)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -249,6 +263,8 @@ class _DiscoveredVehicleRow(QFrame):
             }}
         """)
         self.setFixedHeight(52)
+        if vehicle.origin:
+            self.setToolTip(f"From: {vehicle.origin}")
 
         row = QHBoxLayout(self)
         row.setContentsMargins(10, 6, 10, 6)
@@ -355,6 +371,8 @@ class _DiscoveredVariantRow(QFrame):
             }}
         """)
         self.setFixedHeight(52)
+        if variant.origin:
+            self.setToolTip(f"From: {variant.origin}")
 
         row = QHBoxLayout(self)
         row.setContentsMargins(10, 6, 10, 6)
@@ -456,10 +474,15 @@ class _DiscoveredVariantRow(QFrame):
 # ─────────────────────────────────────────────────────────────────────────────
 
 class _ScanWorker(QThread):
-    """Runs scan_mod on a background thread so the UI stays responsive."""
+    """
+    Runs iter_scan_mod on a background thread so the UI stays responsive.
+    Each discovered item is forwarded through item_found as soon as it is
+    resolved; finished fires once the whole source has been walked.
+    """
 
-    finished = Signal(list, list, object)   # vehicles, variants, temp_dir
-    failed   = Signal(str, str)             # error message, path
+    item_found = Signal(object)               # DiscoveredVehicle | DiscoveredVariant
+    finished   = Signal(list, list)           # vehicles, variants
+    failed     = Signal(str, str)             # error message, path
 
     def __init__(self, path: str, known_carids, parent=None):
         super().__init__(parent)
@@ -467,9 +490,14 @@ class _ScanWorker(QThread):
         self._known       = known_carids
 
     def run(self):
+        vehicles: list = []
+        variants: list = []
         try:
-            vehicles, variants, tmp = scan_mod(self._path, known_carids=self._known)
-            self.finished.emit(vehicles, variants, tmp)
+            # Deep mode: mod packs yield every bundled mod, not just the first.
+            for item in iter_scan_mod(self._path, known_carids=self._known, deep=True):
+                (variants if isinstance(item, DiscoveredVariant) else vehicles).append(item)
+                self.item_found.emit(item)
+            self.finished.emit(vehicles, variants)
         except Exception as e:
             self.failed.emit(str(e), self._path)
 
@@ -477,8 +505,11 @@ class _ScanWorker(QThread):
 
 class _ImportWorker(QThread):
     """
-    Runs process_custom_vehicle / process_custom_variant for each checked row
-    on a background thread so the UI stays responsive during bulk imports.
+    Imports the checked rows on a background thread so the UI stays
+    responsive.  The rows are handed to process_multiple_vehicles as one
+    batch: templates are built in parallel and added_vehicles.json is
+    written once.  item_done fires as each row finishes staging, and again
+    after the commit for any row whose outcome changed (a failed commit).
     """
 
     # (row_index, ok)
@@ -495,50 +526,73 @@ class _ImportWorker(QThread):
         self._mode  = mode
 
     def run(self):
+        # Templates and UV maps of a mod pack's items read the same nested
+        # archives — keep each one decompressed for the whole batch.
+        with mod_source_batch():
+            self._import()
+
+    def _import(self):
         added = skipped = 0
+        rows:       list = []
+        items:      list = []
+        selections: list = []
+
+        existing = load_added_variants_json() if self._mode == "variants" else {}
         for idx, item, display_name in self._tasks:
-            ok = self._process(item, display_name)
-            self.item_done.emit(idx, ok)
+            if self._mode == "vehicles":
+                exists = _carid_exists(item.carid)
+            else:
+                exists = f"{item.carid}__{item.suffix.lower()}" in existing
+            if exists:
+                self.item_done.emit(idx, False)
+                skipped += 1
+                continue
+            rows.append(idx)
+            items.append(item)
+            selections.append(self._selection(item, display_name))
+
+        # Rows are reported as each one finishes staging; after the commit
+        # only rows whose final result differs are reported again.
+        staged = [False] * len(selections)
+
+        def _on_staged(i: int, ok: bool):
+            staged[i] = ok
+            self.item_done.emit(rows[i], ok)
+
+        results: list = []
+        if selections:
+            try:
+                results = process_multiple_vehicles(selections, on_item_staged=_on_staged)["results"]
+            except Exception as e:
+                import traceback
+                print(f"[ERROR] _ImportWorker batch failed: {e}")
+                traceback.print_exc()
+                results = [False] * len(selections)
+
+        for i, (idx, item, ok) in enumerate(zip(rows, items, results)):
             if ok:
+                _copy_uv_maps_to_images(item.carid, getattr(item, "uv_map_paths", []),
+                                        item.archive_path)
                 added += 1
             else:
                 skipped += 1
+            if ok != staged[i]:
+                self.item_done.emit(idx, ok)
         self.all_finished.emit(added, skipped)
 
-    def _process(self, item, display_name: str) -> bool:
-        try:
-            if self._mode == "vehicles":
-                if _carid_exists(item.carid):
-                    return False
-                ok = process_custom_vehicle(
-                    carid      = item.carid,
-                    carname    = display_name,
-                    json_path  = item.json_path,
-                    jbeam_path = item.jbeam_path,
-                    image_path = item.image_path,
-                )
-                if ok:
-                    _copy_uv_maps_to_images(item.carid, getattr(item, "uv_map_paths", []))
-                return ok
-            else:
-                existing = load_added_variants_json() if _BACKEND_OK else {}
-                if f"{item.carid}__{item.suffix.lower()}" in existing:
-                    return False
-                ok = process_custom_variant(
-                    carid          = item.carid,
-                    variant_suffix = item.suffix,
-                    json_path      = item.json_path,
-                    jbeam_path     = item.jbeam_path,
-                    image_path     = item.image_path,
-                )
-                if ok:
-                    _copy_uv_maps_to_images(item.carid, getattr(item, "uv_map_paths", []))
-                return ok
-        except Exception as e:
-            import traceback
-            print(f"[ERROR] _ImportWorker._process failed: {e}")
-            traceback.print_exc()
-            return False
+    def _selection(self, item, display_name: str) -> dict:
+        sel = {
+            "carid":        item.carid,
+            "json_path":    item.json_path,
+            "jbeam_path":   item.jbeam_path,
+            "image_path":   item.image_path,
+            "archive_path": item.archive_path,
+        }
+        if self._mode == "vehicles":
+            sel.update(type="vehicle", carname=display_name)
+        else:
+            sel.update(type="variant", suffix=item.suffix)
+        return sel
 
 
 class _SmartImportCard(QFrame):
@@ -558,10 +612,11 @@ class _SmartImportCard(QFrame):
         super().__init__(parent)
         self._notify    = notify_fn
         self._mode      = mode          # "vehicles" or "variants"
-        self._temp_dirs: List[str] = []  # one entry per scanned source
         self._rows:      list = []       # _DiscoveredVehicleRow | _DiscoveredVariantRow
         self._worker:    Optional[_ScanWorker] = None
         self._pending_paths: List[str] = []   # queue for sequential multi-scan
+        self._scan_found:    int = 0          # items of this mode in the current source
+        self._scan_skipped:  int = 0          # of those, hidden as already existing
         self._import_worker: Optional[_ImportWorker] = None
 
         # Animated dots timer for the "Scanning…" label
@@ -879,9 +934,12 @@ class _SmartImportCard(QFrame):
             self._set_queue_chip(self._queue_rows[path], "scanning")
 
         # ── Launch background worker ──────────────────────────────────────────
+        self._scan_found   = 0
+        self._scan_skipped = 0
         self._worker = _ScanWorker(path, known, parent=self)
+        self._worker.item_found.connect(lambda item, p=path: self._on_scan_item(item, p))
         self._worker.finished.connect(
-            lambda veh, var, tmp, p=path: self._on_scan_finished(veh, var, tmp, p)
+            lambda veh, var, p=path: self._on_scan_finished(veh, var, p)
         )
         self._worker.failed.connect(lambda err, pth, p=path: self._on_scan_failed(err, p))
         # Auto-cleanup: disconnect signals and schedule deletion once the
@@ -894,6 +952,10 @@ class _SmartImportCard(QFrame):
         """Enable/disable browse buttons and drive the animated dots."""
         self._btn_folder.setEnabled(not active)
         self._btn_zip.setEnabled(not active)
+        # Rows stream in while scanning — only allow importing once the
+        # current source has been fully walked.
+        self._add_btn.setEnabled(not active)
+        self._select_all_btn.setEnabled(not active)
         if active:
             self._dot_count = 0
             self._active_scan_dots.setText(".")
@@ -906,14 +968,55 @@ class _SmartImportCard(QFrame):
         self._dot_count = (self._dot_count + 1) % 4
         self._active_scan_dots.setText("." * max(1, self._dot_count))
 
-    def _on_scan_finished(self, vehicles, variants, tmp, path: str):
+    def _on_scan_item(self, item, path: str):
+        """Append a row for one streamed scan result as soon as it arrives."""
+        is_variant = isinstance(item, DiscoveredVariant)
+        if is_variant != (self._mode == "variants"):
+            return
+        self._scan_found += 1
+
+        # Skip any item whose carid already exists as a built-in or
+        # previously-imported vehicle so duplicates never appear in the list.
+        if self._mode == "vehicles" and _carid_exists(item.carid):
+            self._scan_skipped += 1
+            print(f"[add_vehicles] Skipping already-existing vehicle: {item.carid}")
+            return
+
+        if self._mode == "vehicles":
+            row = _DiscoveredVehicleRow(item, self._list_frame)
+        else:
+            row = _DiscoveredVariantRow(item, self._list_frame)
+        self._list_col.addWidget(row)
+        self._rows.append(row)
+        fade_in(row, 120)
+
+        self._active_scan_name.setText(
+            f"Scanning  {os.path.basename(path)}  —  {self._scan_found} item(s) so far"
+        )
+        self._update_results_summary()
+
+    def _update_results_summary(self):
+        """Refresh the status label and action buttons from the current rows."""
+        total = len(self._rows)
+        ready = sum(1 for r in self._rows if self._row_item(r).ready)
+        self._status_lbl.setText(
+            t("add_vehicles.found_items", count=total, ready=ready,
+              default=f"Found {total} item(s) — {ready} ready to import.")
+        )
+        self._status_lbl.setVisible(True)
+        self._list_frame.setVisible(True)
+        self._add_btn.setVisible(True)
+        self._select_all_btn.setVisible(total > 1)
+        self._add_btn.setText(
+            t("add_vehicles.add_checked_count_btn", count=ready,
+              default=f"Add Checked ({ready})")
+        )
+
+    def _on_scan_finished(self, vehicles, variants, path: str):
         self._set_scanning(False)
-        if tmp:
-            self._temp_dirs.append(tmp)
 
-        items     = vehicles if self._mode == "vehicles" else variants
         mod_label = os.path.basename(path)
-        found     = len(items)
+        found     = self._scan_found
 
         # Mark finished row as "done" in the queue panel (keep it visible)
         if path in self._queue_rows:
@@ -927,7 +1030,7 @@ class _SmartImportCard(QFrame):
         else:
             self._active_scan_name.setText(f"—  {mod_label}  —  nothing found")
 
-        if not items:
+        if not found:
             if not self._rows:
                 self._status_lbl.setText(
                     t("add_vehicles.no_vehicles_found", mod=mod_label,
@@ -940,19 +1043,7 @@ class _SmartImportCard(QFrame):
             self._run_next_scan()
             return
 
-        # ── Filter out already-existing vehicles ──────────────────────────────
-        # Skip any item whose carid already exists as a built-in or
-        # previously-imported vehicle so duplicates never appear in the list.
-        new_items: list = []
-        skipped_existing: int = 0
-        for item in items:
-            if self._mode == "vehicles" and _carid_exists(item.carid):
-                skipped_existing += 1
-                print(f"[add_vehicles] Skipping already-existing vehicle: {item.carid}")
-            else:
-                new_items.append(item)
-
-        if skipped_existing and not new_items:
+        if self._scan_skipped == found:
             # Everything was filtered — silently move on
             print(f"[add_vehicles] All vehicles in \"{mod_label}\" already exist, skipping.")
             if not self._pending_paths:
@@ -961,38 +1052,14 @@ class _SmartImportCard(QFrame):
             self._run_next_scan()
             return
 
-        # ── Append rows ───────────────────────────────────────────────────────
-        for item in new_items:
-            if self._mode == "vehicles":
-                row = _DiscoveredVehicleRow(item, self._list_frame)
-            else:
-                row = _DiscoveredVariantRow(item, self._list_frame)
-            self._list_col.addWidget(row)
-            self._rows.append(row)
-            fade_in(row, 120)
-
-        total = len(self._rows)
-        ready = sum(1 for r in self._rows if self._row_item(r).ready)
-
         # Hide active scan and queue panels once the whole queue is exhausted
         if not self._pending_paths:
             self._active_scan_frame.setVisible(False)
             self._queue_frame.setVisible(False)
 
-        if skipped_existing:
-            print(f"[add_vehicles] {skipped_existing} already-existing vehicle(s) hidden from results.")
-        self._status_lbl.setText(
-            t("add_vehicles.found_items", count=total, ready=ready,
-              default=f"Found {total} item(s) — {ready} ready to import.")
-        )
-        self._status_lbl.setVisible(True)
-        self._list_frame.setVisible(True)
-        self._add_btn.setVisible(True)
-        self._select_all_btn.setVisible(total > 1)
-        self._add_btn.setText(
-            t("add_vehicles.add_checked_count_btn", count=ready,
-              default=f"Add Checked ({ready})")
-        )
+        if self._scan_skipped:
+            print(f"[add_vehicles] {self._scan_skipped} already-existing vehicle(s) hidden from results.")
+        self._update_results_summary()
 
         self._run_next_scan()
 
@@ -1061,11 +1128,16 @@ class _SmartImportCard(QFrame):
 
     def _on_item_imported(self, row_index: int, ok: bool):
         """Called on the main thread after each item finishes importing."""
-        if ok and row_index < len(self._rows):
-            row = self._rows[row_index]
+        if row_index >= len(self._rows):
+            return
+        row = self._rows[row_index]
+        if ok:
             # Grey the row out visually so it's clear it's done
             row.setEnabled(False)
             row.setStyleSheet(row.styleSheet() + " opacity: 0.4;")
+        elif not row.isEnabled():
+            # staged fine, but the batch commit failed
+            row.setEnabled(True)
 
     def _on_import_finished(self, added: int, skipped: int):
         """Called on the main thread once all items have been processed."""
@@ -1117,19 +1189,6 @@ class _SmartImportCard(QFrame):
                 item.widget().deleteLater()
         self._queue_frame.setVisible(False)
         self._pending_paths.clear()
-        self._cleanup_temp()
-
-    def _cleanup_temp(self):
-        for td in self._temp_dirs:
-            if td and os.path.isdir(td):
-                try:
-                    shutil.rmtree(td, ignore_errors=True)
-                except Exception:
-                    pass
-        self._temp_dirs.clear()
-
-    def __del__(self):
-        self._cleanup_temp()
 
     # ── Translations ─────────────────────────────────────────────────────────
 
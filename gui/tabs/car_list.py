@@ -3,18 +3,27 @@ import json
 import os
 import re
 import zipfile
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtCore    import Qt, QTimer
-from PySide6.QtGui     import QPixmap, QColor, QPainter, QPen
+from PySide6.QtCore    import (
+    Qt, QTimer, QThread, QAbstractListModel, QModelIndex, QPoint, QRect, QRectF, QSize, Signal,
+)
+from PySide6.QtGui     import QPixmap, QColor, QPainter, QPainterPath, QPen, QFontMetrics, QCursor
 from PySide6.QtWidgets import (
     QWidget, QFrame, QLabel, QPushButton, QLineEdit, QCheckBox,
-    QVBoxLayout, QHBoxLayout, QGridLayout, QScrollArea, QFileDialog, QDialog,
-    QApplication, QSizePolicy,
+    QVBoxLayout, QHBoxLayout, QScrollArea, QFileDialog, QDialog,
+    QApplication, QListView, QAbstractItemView, QStyledItemDelegate, QProgressBar,
 )
 
 from gui.theme import COLORS, font
 from gui.state import state
+from gui.image_cache import image_cache
+from gui.components.card_thumbs import CardThumbnails
+from gui.components.preview import PREFETCH_NEIGHBORS
+from gui.vehicle_search import vehicle_index
+from utils.archive_index import archive_index
+from utils.archive_extract import ExtractJob, extract as extract_files
+from utils.vehicle_images import vehicle_images
 
 try:
     from core.localization import t
@@ -37,94 +46,34 @@ _SETTINGS   = os.path.join(_APP_DIR, "data", "app_settings.json")
 CARD_IMG_H  = 160
 CARD_W      = 280
 CARD_SPACING = 12
+FILTER_DELAY_MS = 80
 GLOW_PAD    = 7       # transparent outer ring — glow and grow effect live here        
 
 
 # VARIANT IMAGE HELPER
-
-_UV_KEYWORDS = ("uv", "uvmap", "uv_map", "uv_layout", "uv1_layout")
-_UV_EXTS     = (".dds", ".png", ".jpg", ".jpeg", ".pdn")
-# Same qualifier list as mod_scanner — catches double-extension typed textures
-# like name.color.dds / name.data.dds that happen to contain "uv" in the stem.
-_UV_TYPE_QUALIFIERS = (
-    ".color", ".colour", ".data", ".normal", ".nrm",
-    ".metallic", ".roughness", ".alpha", ".ao",
-)
-_UV_MAX_UNDERSCORES = 3
-
-# vehicles/ folder root — mirrors VEHICLE_FOLDER in utils/file_ops.py
-_VEHICLES_DIR = os.path.join(_APP_DIR, "vehicles")
-
-
-def _is_uv_map_file(fn: str) -> bool:
-    """Return True when *fn* looks like a UV layout template, not a livery texture."""
-    lower = fn.lower()
-    if not any(lower.endswith(ext) for ext in _UV_EXTS):
-        return False
-    stem = os.path.splitext(lower)[0]
-    if not any(kw in stem for kw in _UV_KEYWORDS):
-        return False
-    if any(stem.endswith(q) or (q + ".") in stem for q in _UV_TYPE_QUALIFIERS):
-        return False
-    if stem.count("_") > _UV_MAX_UNDERSCORES:
-        return False
-    return True
-
+# Both are served from utils.vehicle_images, which walks the image and
+# template folders once and follows catalog changes.
 
 def _get_local_uv_map_paths(carid: str) -> List[str]:
     """Return UV-layout image paths for a developer-added vehicle.
 
-    Searches two locations so that UV maps are found regardless of whether
+    Covers two locations so that UV maps are found regardless of whether
     they were pre-copied to the images cache:
 
     1. ``gui/images/vehicles/{carid}/``  -- the images cache folder.
     2. ``vehicles/{carid}/``             -- the actual mod folder tree
        (walked recursively, same rules as mod_scanner._find_uv_maps).
     """
-    seen: set = set()
-    results: List[str] = []
-
-    def _scan_tree(root: str) -> None:
-        for dirpath, _dirs, filenames in os.walk(root):
-            for fn in sorted(filenames):
-                if _is_uv_map_file(fn):
-                    full = os.path.join(dirpath, fn)
-                    if full not in seen:
-                        seen.add(full)
-                        results.append(full)
-
-    images_dir = os.path.join(_IMAGES_DIR, carid)
-    if os.path.isdir(images_dir):
-        _scan_tree(images_dir)
-
-    vehicles_dir = os.path.join(_VEHICLES_DIR, carid)
-    if os.path.isdir(vehicles_dir):
-        _scan_tree(vehicles_dir)
-
-    return results
+    return vehicle_images.uv_maps(carid)
 
 
 def _get_variant_images(carid: str) -> List[Tuple[str, str]]:
     """Return [(label, abs_path), …] for every image in a vehicle's folder.
 
-    Files are sorted so that ``default.*`` always comes first, then
-    alphabetically.  Only .jpg / .jpeg / .png files are returned.
+    ``default.*`` always comes first, then alphabetically.  Only .jpg /
+    .jpeg / .png files that aren't UV maps are returned.
     """
-    vehicle_dir = os.path.join(_IMAGES_DIR, carid)
-    if not os.path.isdir(vehicle_dir):
-        return []
-    entries: List[Tuple[str, str]] = []
-    for fn in sorted(os.listdir(vehicle_dir)):
-        if not fn.lower().endswith((".jpg", ".jpeg", ".png")):
-            continue
-        if _is_uv_map_file(fn):
-            continue
-        stem = os.path.splitext(fn)[0]
-        label = "Default" if stem.lower() == "default" else stem.replace("_", " ").title()
-        entries.append((label, os.path.join(vehicle_dir, fn)))
-    # Ensure 'Default' is first
-    entries.sort(key=lambda x: (x[0] != "Default", x[0].lower()))
-    return entries
+    return vehicle_images.previews(carid)
 
 
 # BUILT-IN VEHICLE LIST
@@ -269,6 +218,38 @@ class _UVSelectDialog(QDialog):
             self.accept()
 
 
+# UV-MAP EXTRACTION WORKER
+
+class _UVExtractWorker(QThread):
+    """
+    Builds the job list with plan() and runs it through
+    utils.archive_extract on a background thread.  plan runs here too, so
+    finding every UV map of every vehicle never blocks the UI.
+    """
+
+    progress = Signal(int, int)        # done, total
+    finished = Signal(int, int, bool)  # ok, total, cancelled
+
+    def __init__(self, plan: Callable[[], List[ExtractJob]], parent=None):
+        super().__init__(parent)
+        self._plan = plan
+
+    def run(self):
+        try:
+            jobs = self._plan()
+            self.progress.emit(0, len(jobs))
+            result = extract_files(
+                jobs,
+                progress=lambda done, total: self.progress.emit(done, total),
+                cancelled=self.isInterruptionRequested,
+            )
+            self.finished.emit(result.ok, result.total, result.cancelled)
+        except Exception as e:
+            print(f"[ERROR] UV map extraction failed: {e}")
+            import traceback; traceback.print_exc()
+            self.finished.emit(0, 0, False)
+
+
 # ANIMATED MODERN CARD
 
 def _hex_to_rgb(h: str):
@@ -285,90 +266,591 @@ def _lerp_color(c1: str, c2: str, t: float) -> QColor:
     )
 
 
-class AnimatedCard(QFrame):
-    """
-    Modern vehicle card with hover animation drawn entirely in paintEvent.
-    No QGraphicsEffect — avoids QPainter reentrancy crashes inside QScrollArea.
+# VEHICLE GRID — model / delegate / view
+#
+# A single QListView paints every card through VehicleCardDelegate, so only
+# the cards on screen cost anything: no per-vehicle widgets, timers or
+# stylesheets.  Classic mode is one column of rows; modern mode wraps
+# fixed-size cards into as many columns as fit the viewport.
+
+CarIdRole      = Qt.UserRole + 1
+DevAddedRole   = Qt.UserRole + 2
+VariantsRole   = Qt.UserRole + 3
+VariantIdxRole = Qt.UserRole + 4
+ImagePathRole  = Qt.UserRole + 5
+HasUvRole      = Qt.UserRole + 6
+
+Vehicle = Tuple[str, str, bool]     # carid, name, developer_added
 
-    At rest  : card background + 1px border at full GLOW_PAD inset
-    On hover : card expands into the GLOW_PAD ring (grow) + layered glow rings
+
+class VehicleListModel(QAbstractListModel):
+    """
+    All vehicles of the car list, narrowed and ranked by the shared vehicle
+    search index (gui.vehicle_search).  Variant images and, for
+    developer-added cars, whether a local UV map exists come from the
+    in-memory utils.vehicle_images index, so painting a card never
+    touches the disk.
     """
 
-    def __init__(self, parent: QWidget | None = None):
-        print(f"[DEBUG] __init__() called")
+    def __init__(self, parent=None):
         super().__init__(parent)
-        # Let our paintEvent own the background entirely
-        self.setAttribute(Qt.WA_OpaquePaintEvent, False)
-        self.setStyleSheet("AnimatedCard { background: transparent; border: none; }")
-        self._t = 0.0
-        self._hovered = False
-        self._tick = QTimer(self)
-        self._tick.setInterval(16)
-        self._tick.timeout.connect(self._step)
-
-    def _step(self):
-        print(f"[DEBUG] _step() called")
-        target = 1.0 if self._hovered else 0.0
-        self._t += (target - self._t) * 0.20
-        self.update()
-        if abs(self._t - target) < 0.008:
-            self._t = target
-            self._tick.stop()
-            self.update()
+        self._all:  List[Vehicle] = []
+        self._rows: List[Vehicle] = []
+        self._row_of: Dict[str, int] = {}
+        self._query = ""
+        self._variant_idx: Dict[str, int] = {}
+
+    @property
+    def total(self) -> int:
+        return len(self._all)
+
+    def vehicles(self) -> List[Vehicle]:
+        """Every vehicle, ignoring the filter."""
+        return list(self._all)
+
+    def set_vehicles(self, vehicles: List[Vehicle]) -> None:
+        self.beginResetModel()
+        self._all = list(vehicles)
+        known = {carid for carid, _, _ in self._all}
+        self._variant_idx = {c: i for c, i in self._variant_idx.items() if c in known}
+        self._apply_filter()
+        self.endResetModel()
+
+    def set_filter(self, text: str) -> None:
+        query = text.strip().lower()
+        if query == self._query:
+            return
+        self.beginResetModel()
+        self._query = query
+        self._apply_filter()
+        self.endResetModel()
 
-    def enterEvent(self, event):
-        print(f"[DEBUG] enterEvent() called")
-        super().enterEvent(event)
-        self._hovered = True
-        if not self._tick.isActive():
-            self._tick.start()
+    def _apply_filter(self) -> None:
+        q = self._query
+        if not q:
+            self._rows = list(self._all)
+        else:
+            # Best matches first; rows the shared index doesn't know fall back
+            # to a plain substring check after them.
+            index = vehicle_index()
+            by_id = {v[0]: v for v in self._all}
+            self._rows = [by_id[k] for k, _ in index.search(q) if k in by_id]
+            self._rows += [v for v in self._all
+                           if v[0] not in index and (q in v[0].lower() or q in v[1].lower())]
+        self._row_of = {carid: i for i, (carid, _, _) in enumerate(self._rows)}
+
+    def index_of(self, carid: str) -> QModelIndex:
+        row = self._row_of.get(carid)
+        return self.index(row, 0) if row is not None else QModelIndex()
+
+    def around(self, carid: str, count: int) -> List[str]:
+        """Carids of up to count rows either side of carid, nearest first."""
+        row = self._row_of.get(carid)
+        if row is None:
+            return []
+        out = []
+        for d in range(1, count + 1):
+            for r in (row + d, row - d):
+                if 0 <= r < len(self._rows):
+                    out.append(self._rows[r][0])
+        return out
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        carid, name, dev_added = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == CarIdRole:
+            return carid
+        if role == DevAddedRole:
+            return dev_added
+        if role == VariantsRole:
+            return self._variants_for(carid)
+        if role == VariantIdxRole:
+            variants = self._variants_for(carid)
+            return self._variant_idx.get(carid, 0) % max(1, len(variants))
+        if role == ImagePathRole:
+            variants = self._variants_for(carid)
+            return variants[self._variant_idx.get(carid, 0) % len(variants)][1] if variants else ""
+        if role == HasUvRole:
+            # Built-in cars are searched in the game's content zip on demand;
+            # developer-added ones only get the button when a map was copied in.
+            if not dev_added:
+                return True
+            return bool(vehicle_images.get(carid).uv_maps)
+        return None
+
+    def _variants_for(self, carid: str) -> Tuple[Tuple[str, str], ...]:
+        return vehicle_images.get(carid).previews
+
+    def step_variant(self, index: QModelIndex, delta: int) -> None:
+        carid = index.data(CarIdRole)
+        variants = self._variants_for(carid)
+        if len(variants) < 2:
+            return
+        self._variant_idx[carid] = (self._variant_idx.get(carid, 0) + delta) % len(variants)
+        self.dataChanged.emit(index, index, [VariantIdxRole, ImagePathRole])
 
-    def leaveEvent(self, event):
-        print(f"[DEBUG] leaveEvent() called")
-        super().leaveEvent(event)
-        self._hovered = False
-        if not self._tick.isActive():
-            self._tick.start()
 
-    def paintEvent(self, _event):
-        print(f"[DEBUG] paintEvent() called")
-        t  = self._t
-        w, h = self.width(), self.height()
+_NAV_W, _NAV_H = 26, 38
+_DOT_SIZE, _DOT_GAP = 6, 4
 
-        # Card rect shrinks into GLOW_PAD at rest; grows outward as t→1
-        grow  = int(t * 3)                    # expand up to 3px into the ring
-        inset = max(0, GLOW_PAD - grow)
-        radius = 12
 
-        accent_rgb = _hex_to_rgb(COLORS["accent"])
-        ar, ag, ab = accent_rgb
+class VehicleCardDelegate(QStyledItemDelegate):
+    """
+    Paints classic rows and modern cards.  parts() is the single source of
+    geometry, used both for painting and for hit-testing clicks.
 
-        p = QPainter(self)
+    Modern cards keep the old AnimatedCard look: at rest the card sits
+    GLOW_PAD inside its cell, on hover it grows into that ring and gets
+    layered accent glow (progress comes from the view).
+    """
+
+    def __init__(self, view: "VehicleGridView"):
+        super().__init__(view)
+        self._view = view
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Re-read fonts and button labels (theme or language change)."""
+        self._uv_text   = t("car_list.get_uv_map")
+        self._copy_text = t("car_list.copy_id")
+        self._f_classic_name = font(14, "bold")
+        self._f_classic_id   = font(12)
+        self._f_modern_name  = font(13, "bold")
+        self._f_modern_id    = font(11)
+        self._f_button       = font(12, "bold")
+        self._f_icon         = font(20)
+        self._f_placeholder  = font(38)
+        self._f_badge        = font(9, "bold")
+        self._f_nav          = font(18, "bold")
+
+    # ── Geometry ─────────────────────────────────────────────────────────────
+
+    def classic_height(self) -> int:
+        text_h = (QFontMetrics(self._f_classic_name).height() + 1
+                  + QFontMetrics(self._f_classic_id).height())
+        return max(36, text_h) + 20
+
+    def modern_height(self) -> int:
+        return (GLOW_PAD + CARD_IMG_H + 8
+                + QFontMetrics(self._f_modern_name).height() + 3
+                + QFontMetrics(self._f_modern_id).height() + 8
+                + 32 + GLOW_PAD + 5)
+
+    def sizeHint(self, option, index) -> QSize:
+        return self._view.card_size()
+
+    def _button_width(self, text: str) -> int:
+        return max(100, QFontMetrics(self._f_button).horizontalAdvance(text) + 30)
+
+    def parts(self, rect: QRect, index: QModelIndex) -> Dict[str, QRect]:
+        has_uv = bool(index.data(HasUvRole))
+        if self._view.mode == "modern":
+            return self._modern_parts(rect, index, has_uv)
+        return self._classic_parts(rect, has_uv)
+
+    def _classic_parts(self, rect: QRect, has_uv: bool) -> Dict[str, QRect]:
+        inner = rect.adjusted(12, 10, -12, -10)
+        cy    = inner.center().y()
+        parts = {"card": rect}
+        right = inner.right() + 1
+        copy_w = self._button_width(self._copy_text)
+        parts["copy"] = QRect(right - copy_w, cy - 18, copy_w, 36)
+        right -= copy_w + 6
+        if has_uv:
+            uv_w = self._button_width(self._uv_text)
+            parts["uv"] = QRect(right - uv_w, cy - 18, uv_w, 36)
+            right -= uv_w + 6
+
+        icon_w = QFontMetrics(self._f_icon).horizontalAdvance("🚗") + 4
+        parts["icon"] = QRect(inner.left(), inner.top(), icon_w, inner.height())
+        left   = inner.left() + icon_w + 10
+        name_h = QFontMetrics(self._f_classic_name).height()
+        id_h   = QFontMetrics(self._f_classic_id).height()
+        top    = cy - (name_h + 1 + id_h) // 2
+        text_w = max(0, right - 4 - left)
+        parts["name"] = QRect(left, top, text_w, name_h)
+        parts["id"]   = QRect(left, top + name_h + 1, text_w, id_h)
+        return parts
+
+    def _modern_parts(self, rect: QRect, index: QModelIndex, has_uv: bool) -> Dict[str, QRect]:
+        inner = rect.adjusted(GLOW_PAD, GLOW_PAD, -GLOW_PAD, -(GLOW_PAD + 5))
+        image = QRect(inner.left(), inner.top(), inner.width(), CARD_IMG_H)
+        name_h = QFontMetrics(self._f_modern_name).height()
+        id_h   = QFontMetrics(self._f_modern_id).height()
+        parts = {"card": rect, "image": image}
+        parts["name"] = QRect(inner.left() + 10, image.bottom() + 1 + 8, inner.width() - 20, name_h)
+        parts["id"]   = QRect(inner.left() + 10, parts["name"].bottom() + 1 + 3, inner.width() - 20, id_h)
+
+        btn_y  = parts["id"].bottom() + 1 + 8
+        keys   = ["uv", "copy"] if has_uv else ["copy"]
+        span   = inner.width() - 16
+        btn_w  = (span - 6 * (len(keys) - 1)) // len(keys)
+        for i, key in enumerate(keys):
+            parts[key] = QRect(inner.left() + 8 + i * (btn_w + 6), btn_y, btn_w, 32)
+
+        if len(index.data(VariantsRole) or []) > 1:
+            ny = image.top() + (image.height() - _NAV_H) // 2
+            parts["prev"] = QRect(image.left() + 4, ny, _NAV_W, _NAV_H)
+            parts["next"] = QRect(image.right() + 1 - 4 - _NAV_W, ny, _NAV_W, _NAV_H)
+        return parts
+
+    def hit(self, rect: QRect, index: QModelIndex, pos: QPoint) -> Optional[str]:
+        """Which clickable part of the card at rect is under pos, if any."""
+        for key, r in self.parts(rect, index).items():
+            if key in ("uv", "copy", "prev", "next") and r.contains(pos):
+                return key
+        return None
+
+    # ── Painting ─────────────────────────────────────────────────────────────
+
+    def paint(self, p: QPainter, option, index):
+        p.save()
         p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.TextAntialiasing)
+        parts = self.parts(option.rect, index)
+        if self._view.mode == "modern":
+            self._paint_modern(p, parts, index)
+        else:
+            self._paint_classic(p, parts, index)
+        p.restore()
+
+    def _paint_classic(self, p: QPainter, parts: Dict[str, QRect], index: QModelIndex):
+        hovered = self._view.is_hovered(index)
+        card = QRectF(parts["card"]).adjusted(0.5, 0.5, -0.5, -0.5)
+        p.setPen(QPen(QColor(COLORS["accent"] if hovered else COLORS["border"]), 1))
+        p.setBrush(QColor(COLORS.get("card_hover", COLORS["card_bg"]) if hovered else COLORS["card_bg"]))
+        p.drawRoundedRect(card, 12, 12)
+
+        p.setFont(self._f_icon)
+        p.drawText(parts["icon"], Qt.AlignCenter, "🚗")
+        self._paint_text(p, parts["name"], index.data(Qt.DisplayRole),
+                         self._f_classic_name, COLORS["text"])
+        self._paint_text(p, parts["id"], index.data(CarIdRole),
+                         self._f_classic_id, COLORS["text_secondary"])
+        self._paint_buttons(p, parts, index, radius=10)
+
+    def _paint_modern(self, p: QPainter, parts: Dict[str, QRect], index: QModelIndex):
+        rect = parts["card"]
+        t_   = self._view.hover_progress(index)
+        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+        grow   = int(t_ * 3)                # card grows up to 3px into the glow ring
+        inset  = max(0, GLOW_PAD - grow)
+        radius = 12
 
-        # ── glow layers (drawn outward → inward so inner overwrites outer) ──
-        if t > 0.01:
+        if t_ > 0.01:
+            ar, ag, ab = _hex_to_rgb(COLORS["accent"])
+            p.setPen(Qt.NoPen)
             num_layers = 7
             for i in range(num_layers, 0, -1):
                 layer_inset = max(0, inset - i)
-                alpha = int(t * 28 * (i / num_layers))
-                p.setPen(Qt.NoPen)
-                p.setBrush(QColor(ar, ag, ab, alpha))
+                p.setBrush(QColor(ar, ag, ab, int(t_ * 28 * (i / num_layers))))
                 r = radius + (GLOW_PAD - layer_inset)
-                p.drawRoundedRect(layer_inset, layer_inset,
-                                  w - 2 * layer_inset, h - 2 * layer_inset,
-                                  r, r)
+                p.drawRoundedRect(x + layer_inset, y + layer_inset,
+                                  w - 2 * layer_inset, h - 2 * layer_inset, r, r)
+
+        p.setBrush(_lerp_color(COLORS["card_bg"], COLORS.get("card_hover", COLORS["card_bg"]), t_))
+        p.setPen(QPen(_lerp_color(COLORS["border"], COLORS["accent"], t_), 1.0 + t_ * 0.6))
+        p.drawRoundedRect(x + inset, y + inset, w - 2 * inset, h - 2 * inset, radius, radius)
+
+        self._paint_image(p, parts, index)
+        self._paint_text(p, parts["name"], index.data(Qt.DisplayRole),
+                         self._f_modern_name, COLORS["text"])
+        self._paint_text(p, parts["id"], index.data(CarIdRole),
+                         self._f_modern_id, COLORS["text_secondary"])
+        self._paint_buttons(p, parts, index, radius=10)
+
+    def _paint_image(self, p: QPainter, parts: Dict[str, QRect], index: QModelIndex):
+        image = parts["image"]
+        p.save()
+        p.setClipPath(_rounded_top_path(image, 11))
+        p.fillRect(image, QColor(COLORS.get("frame_bg", COLORS["card_bg"])))
+        path = index.data(ImagePathRole)
+        if path:
+            base = self._view.thumbs.base(path, image.width())
+            if base is not None:            # otherwise still rendering; repainted on arrival
+                p.drawPixmap(image.topLeft(),
+                             CarListTab._card_pixmap(path, base, image.width(), image.height()))
+        else:
+            p.setPen(QColor(COLORS["text"]))
+            p.setFont(self._f_placeholder)
+            p.drawText(image, Qt.AlignCenter, "🚗")
+        p.restore()
+
+        variants = index.data(VariantsRole) or []
+        if len(variants) < 2:
+            return
+        current = index.data(VariantIdxRole) or 0
+        mouse   = self._view.mouse_pos()
+
+        p.setFont(self._f_nav)
+        for key, glyph in (("prev", "‹"), ("next", "›")):
+            r = parts[key]
+            p.setPen(Qt.NoPen)
+            p.setBrush(QColor(0, 0, 0, 210 if r.contains(mouse) else 110))
+            p.drawRoundedRect(r, 6, 6)
+            p.setPen(QColor("white"))
+            p.drawText(r, Qt.AlignCenter, glyph)
+
+        # variant name badge, bottom-left
+        label = variants[current][0]
+        fm    = QFontMetrics(self._f_badge)
+        badge = QRect(0, 0, fm.horizontalAdvance(label) + 12, fm.height() + 4)
+        badge.moveBottomLeft(QPoint(image.left() + 6, image.bottom() - 6))
+        p.setPen(Qt.NoPen)
+        p.setBrush(QColor(0, 0, 0, 145))
+        p.drawRoundedRect(badge, 4, 4)
+        p.setPen(QColor("white"))
+        p.setFont(self._f_badge)
+        p.drawText(badge, Qt.AlignCenter, label)
+
+        # dot indicators, bottom-centre
+        n      = len(variants)
+        dots_w = n * _DOT_SIZE + (n - 1) * _DOT_GAP
+        dx     = image.left() + (image.width() - dots_w) // 2
+        dy     = image.bottom() + 1 - _DOT_SIZE - 4
+        p.setPen(Qt.NoPen)
+        for i in range(n):
+            p.setBrush(QColor(255, 255, 255, 255 if i == current else 90))
+            p.drawEllipse(dx + i * (_DOT_SIZE + _DOT_GAP), dy, _DOT_SIZE, _DOT_SIZE)
+
+    def _paint_text(self, p: QPainter, rect: QRect, text: str, f, colour: str):
+        p.setFont(f)
+        p.setPen(QColor(colour))
+        elided = QFontMetrics(f).elidedText(text or "", Qt.ElideRight, rect.width())
+        p.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, elided)
+
+    def _paint_buttons(self, p: QPainter, parts: Dict[str, QRect], index: QModelIndex, radius: int):
+        mouse = self._view.mouse_pos()
+        p.setFont(self._f_button)
+        for key, text, primary in (("uv", self._uv_text, True), ("copy", self._copy_text, False)):
+            r = parts.get(key)
+            if r is None:
+                continue
+            hover = r.contains(mouse)
+            if primary:
+                p.setPen(Qt.NoPen)
+                p.setBrush(QColor(COLORS["accent_hover"] if hover else COLORS["accent"]))
+                fg = COLORS["accent_text"]
+            else:
+                p.setPen(QPen(QColor(COLORS["border"]), 1))
+                p.setBrush(QColor(COLORS["card_hover"] if hover else COLORS["frame_bg"]))
+                fg = COLORS["text"]
+            p.drawRoundedRect(QRectF(r).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+            p.setPen(QColor(fg))
+            elided = QFontMetrics(self._f_button).elidedText(text, Qt.ElideRight, r.width() - 8)
+            p.drawText(r, Qt.AlignCenter, elided)
+
+
+def _rounded_top_path(rect: QRect, radius: int) -> QPainterPath:
+    path = QPainterPath()
+    path.setFillRule(Qt.WindingFill)
+    path.addRoundedRect(QRectF(rect), radius, radius)
+    path.addRect(QRectF(rect.x(), rect.y() + radius, rect.width(), rect.height() - radius))
+    return path.simplified()
+
+
+class VehicleGridView(QListView):
+    """
+    List view for VehicleListModel.  Tracks the hovered card (for the glow
+    animation, button hover and the classic hover preview) and turns clicks
+    on painted buttons into signals.
+    """
+
+    uv_requested   = Signal(str, bool)     # carid, developer_added
+    copy_requested = Signal(str)
+    hovered        = Signal(str)           # carid, "" when the mouse leaves the cards
+
+    def __init__(self, model: VehicleListModel, mode: str = "classic", parent=None):
+        super().__init__(parent)
+        self.mode = mode
+        self._card_size = QSize(CARD_W, 0)
+        self._hover_carid = ""
+        self._glow: Dict[str, float] = {}        # carid → hover progress 0..1
+        self._mouse = QPoint(-1, -1)
+        self._pressed: Optional[Tuple[str, str]] = None
+
+        self.setModel(model)
+        self.thumbs = CardThumbnails(CARD_IMG_H, parent=self)
+        self.thumbs.ready.connect(lambda _path: self.viewport().update())
+        self._delegate = VehicleCardDelegate(self)
+        self.setItemDelegate(self._delegate)
+
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(24)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setResizeMode(QListView.Adjust)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setStyleSheet("QListView{background:transparent;border:none;}")
+        self.viewport().setAutoFillBackground(False)
+
+        self._tick = QTimer(self)
+        self._tick.setInterval(16)
+        self._tick.timeout.connect(self._step_glow)
 
-        # ── card background ──
-        bg     = _lerp_color(COLORS["card_bg"], COLORS.get("card_hover", COLORS["card_bg"]), t)
-        border = _lerp_color(COLORS["border"],  COLORS["accent"], t)
-        bw = 1.0 + t * 0.6
+        self.set_mode(mode)
+
+    # ── Mode / geometry ──────────────────────────────────────────────────────
+
+    def set_mode(self, mode: str) -> None:
+        self.mode = mode
+        self._glow.clear()
+        if mode == "modern":
+            self.setFlow(QListView.LeftToRight)
+            self.setWrapping(True)
+            self.setSpacing(CARD_SPACING // 2)
+        else:
+            self.setFlow(QListView.TopToBottom)
+            self.setWrapping(False)
+            self.setSpacing(3)
+        self._update_card_size(force=True)
+
+    def card_size(self) -> QSize:
+        return self._card_size
+
+    def _update_card_size(self, force: bool = False) -> None:
+        vw = self.viewport().width()
+        if self.mode == "modern":
+            cols = _cols_for_width(vw)
+            size = QSize(_card_width_for(vw, cols), self._delegate.modern_height())
+        else:
+            size = QSize(max(200, vw - 2 * self.spacing()), self._delegate.classic_height())
+        if force or size != self._card_size:
+            self._card_size = size
+            self.doItemsLayout()          # uniform item size is cached per layout pass
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_card_size()
 
-        p.setBrush(bg)
-        p.setPen(QPen(border, bw))
-        p.drawRoundedRect(inset, inset, w - 2 * inset, h - 2 * inset, radius, radius)
+    def updateGeometries(self):
+        super().updateGeometries()
+        # the scrollbar showing up narrows the viewport without a resizeEvent
+        self._update_card_size()
 
-        p.end()
+    def refresh(self) -> None:
+        """Re-read fonts/texts (language or theme change) and repaint."""
+        self._delegate.refresh()
+        self._update_card_size(force=True)
+        self.viewport().update()
+
+    # ── Hover ────────────────────────────────────────────────────────────────
+
+    def mouse_pos(self) -> QPoint:
+        return self._mouse
+
+    def is_hovered(self, index: QModelIndex) -> bool:
+        return bool(self._hover_carid) and index.data(CarIdRole) == self._hover_carid
+
+    def hover_progress(self, index: QModelIndex) -> float:
+        return self._glow.get(index.data(CarIdRole), 0.0)
+
+    def _set_hover(self, carid: str) -> None:
+        if carid == self._hover_carid:
+            return
+        old, self._hover_carid = self._hover_carid, carid
+        for c in (old, carid):
+            if c:
+                self._glow.setdefault(c, 0.0)
+                self._update_card(c)
+        if self.mode == "modern" and not self._tick.isActive():
+            self._tick.start()
+        self.hovered.emit(carid)
+
+    def _step_glow(self) -> None:
+        for carid, value in list(self._glow.items()):
+            target = 1.0 if carid == self._hover_carid else 0.0
+            value += (target - value) * 0.20
+            if abs(value - target) < 0.008:
+                value = target
+            if value == 0.0 and target == 0.0:
+                del self._glow[carid]
+            else:
+                self._glow[carid] = value
+            self._update_card(carid)
+        if all(v == (1.0 if c == self._hover_carid else 0.0) for c, v in self._glow.items()):
+            self._tick.stop()
+
+    def _update_card(self, carid: str) -> None:
+        index = self.model().index_of(carid)
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        old_pos, self._mouse = self._mouse, event.position().toPoint()
+        index = self.indexAt(self._mouse)
+        self._set_hover(index.data(CarIdRole) if index.isValid() else "")
+        part = self._delegate.hit(self.visualRect(index), index, self._mouse) if index.isValid() else None
+        self.viewport().setCursor(Qt.PointingHandCursor if part else Qt.ArrowCursor)
+        # buttons repaint their hover state
+        for pos in (old_pos, self._mouse):
+            i = self.indexAt(pos)
+            if i.isValid():
+                self.viewport().update(self.visualRect(i))
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._mouse = QPoint(-1, -1)
+        self._set_hover("")
+        self.viewport().unsetCursor()
+
+    def wheelEvent(self, event):
+        super().wheelEvent(event)
+        # content moved under a still cursor
+        self._mouse = self.viewport().mapFromGlobal(QCursor.pos())
+        index = self.indexAt(self._mouse)
+        self._set_hover(index.data(CarIdRole) if index.isValid() else "")
+
+    # ── Clicks ───────────────────────────────────────────────────────────────
+
+    def _part_at(self, pos: QPoint) -> Optional[Tuple[QModelIndex, str]]:
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        part = self._delegate.hit(self.visualRect(index), index, pos)
+        return (index, part) if part else None
+
+    def mousePressEvent(self, event):
+        hit = self._part_at(event.position().toPoint()) if event.button() == Qt.LeftButton else None
+        self._pressed = (hit[0].data(CarIdRole), hit[1]) if hit else None
+        if hit is None:
+            super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        pressed, self._pressed = self._pressed, None
+        hit = self._part_at(event.position().toPoint())
+        if pressed is None or hit is None or (hit[0].data(CarIdRole), hit[1]) != pressed:
+            super().mouseReleaseEvent(event)
+            return
+        index, part = hit
+        carid = index.data(CarIdRole)
+        if part == "uv":
+            self.uv_requested.emit(carid, bool(index.data(DevAddedRole)))
+        elif part == "copy":
+            self.copy_requested.emit(carid)
+        elif part in ("prev", "next"):
+            self.model().step_variant(index, -1 if part == "prev" else 1)
+
+
+def _cols_for_width(viewport_width: int) -> int:
+    available = max(viewport_width - 8, CARD_W)
+    return max(1, available // (CARD_W + CARD_SPACING))
+
+
+def _card_width_for(viewport_width: int, cols: int) -> int:
+    # QListView spacing puts CARD_SPACING / 2 around every card
+    return max(CARD_W, (viewport_width - 1) // cols - CARD_SPACING)
 
 
 # CAR LIST TAB
@@ -379,14 +861,28 @@ class CarListTab(QWidget):
         super().__init__(parent)
         self.setStyleSheet(f"background:{COLORS['app_bg']};")
 
-        self._items: List[Tuple[QWidget, str, str]] = []
-        self._modern_row = 0
-        self._modern_col = 0
-        self._modern_cols_current = 0   
         self._view_mode: str = self._load_view_mode()
 
         self._setup_ui()
         self._populate()
+        self._warm_archive_index()
+        vehicle_images.warm()
+
+    def _warm_archive_index(self):
+        """Index BeamNG's vehicle archives in the background so Get UV Map is a lookup."""
+        try:
+            from core.settings import get_beamng_install_path
+            install = get_beamng_install_path()
+        except Exception:
+            return
+        if not install:
+            return
+        folder = os.path.join(install, "content", "vehicles")
+        try:
+            zips = [os.path.join(folder, f) for f in os.listdir(folder) if f.lower().endswith(".zip")]
+        except OSError:
+            return
+        archive_index.warm(zips)
 
     def _load_view_mode(self) -> str:
         print(f"[DEBUG] _load_view_mode() called")
@@ -440,6 +936,11 @@ class CarListTab(QWidget):
         self._search.textChanged.connect(self._filter)
         top_bar.addWidget(self._search, 1)
 
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
         self._btn_classic = QPushButton(t("car_list.view_classic"))
         self._btn_modern  = QPushButton(t("car_list.view_modern"))
         for btn, mode in ((self._btn_classic, "classic"), (self._btn_modern, "modern")):
@@ -448,54 +949,45 @@ class CarListTab(QWidget):
             btn.setCursor(Qt.PointingHandCursor)
         self._btn_classic.clicked.connect(lambda: self._set_view("classic"))
         self._btn_modern.clicked.connect(lambda: self._set_view("modern"))
-        self._update_toggle_style()
 
         top_bar.addWidget(self._btn_classic)
         top_bar.addWidget(self._btn_modern)
 
-        root.addLayout(top_bar)
+        self._btn_extract_all = QPushButton(t("car_list.uv_extract_all"))
+        self._btn_extract_all.setFixedHeight(36)
+        self._btn_extract_all.setFont(font(12, "bold"))
+        self._btn_extract_all.setCursor(Qt.PointingHandCursor)
+        self._btn_extract_all.setToolTip(t("car_list.uv_extract_all_tip"))
+        self._btn_extract_all.clicked.connect(self._extract_all_uv_maps)
+        top_bar.addWidget(self._btn_extract_all)
+        self._update_toggle_style()
 
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea{background:transparent;border:none;}"
-            "QScrollArea>QWidget>QWidget{background:transparent;}"
-        )
-        self._rebuild_inner()
-        root.addWidget(self._scroll, 1)
-
-    def _rebuild_inner(self):
-        print(f"[DEBUG] _rebuild_inner() called")
-        outer = QWidget()
-        outer.setStyleSheet("background:transparent;")
-        outer_vbox = QVBoxLayout(outer)
-        outer_vbox.setContentsMargins(0, 0, 0, 0)
-        outer_vbox.setSpacing(0)
-
-        content = QWidget()
-        content.setStyleSheet("background:transparent;")
-
-        if self._view_mode == "modern":
-            layout = QGridLayout(content)
-            layout.setContentsMargins(4, 4, 4, 4)
-            layout.setSpacing(CARD_SPACING)
-            layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
-        else:
-            layout = QVBoxLayout(content)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setSpacing(6)
-            layout.addStretch()
+        root.addLayout(top_bar)
 
-        outer_vbox.addWidget(content)
-        outer_vbox.addStretch()
+        self._extract_worker: Optional[_UVExtractWorker] = None
+        self._extract_progress = QProgressBar()
+        self._extract_progress.setFixedHeight(6)
+        self._extract_progress.setTextVisible(False)
+        self._extract_progress.setStyleSheet(f"""
+            QProgressBar {{
+                background:{COLORS['frame_bg']};
+                border-radius:3px;
+                border:none;
+            }}
+            QProgressBar::chunk {{
+                background:{COLORS['accent']};
+                border-radius:3px;
+            }}
+        """)
+        self._extract_progress.setVisible(False)
+        root.addWidget(self._extract_progress)
 
-        self._scroll.setWidget(outer)
-        self._list_widget  = content
-        self._list_layout  = layout
-        self._modern_row   = 0
-        self._modern_col   = 0
-        self._modern_cols_current = 0
+        self._model = VehicleListModel(self)
+        self._grid  = VehicleGridView(self._model, self._view_mode)
+        self._grid.uv_requested.connect(self._on_uv_requested)
+        self._grid.copy_requested.connect(self._copy_carid)
+        self._grid.hovered.connect(self._on_card_hovered)
+        root.addWidget(self._grid, 1)
 
     def _update_toggle_style(self):
         print(f"[DEBUG] _update_toggle_style() called")
@@ -513,6 +1005,7 @@ class CarListTab(QWidget):
             """
         self._btn_classic.setStyleSheet(_style(self._view_mode == "classic"))
         self._btn_modern.setStyleSheet(_style(self._view_mode == "modern"))
+        self._btn_extract_all.setStyleSheet(_style(False))
 
     def _set_view(self, mode: str):
         if mode == self._view_mode:
@@ -520,7 +1013,8 @@ class CarListTab(QWidget):
         self._view_mode = mode
         self._save_view_mode()
         self._update_toggle_style()
-        self.refresh_ui()
+        self._on_card_hovered("")
+        self._grid.set_mode(mode)
 
     def _populate(self):
         print(f"[DEBUG] _populate() called")
@@ -528,48 +1022,49 @@ class CarListTab(QWidget):
         state.added_vehicles.clear()
         state.added_vehicles.update(added)
 
-        all_vehicles: List[Tuple[str, str, bool]] = []
+        all_vehicles: List[Vehicle] = []
         for carid, name in _BUILTIN_VEHICLES:
             all_vehicles.append((carid, name, False))
         for carid, name in state.added_vehicles.items():
             all_vehicles.append((carid, name, True))
         all_vehicles.sort(key=lambda x: x[1].lower())
 
-        for carid, name, dev_added in all_vehicles:
-            self._add_card(carid, name, developer_added=dev_added)
+        self._model.set_vehicles(all_vehicles)
 
-    def _add_card(self, carid: str, name: str, developer_added: bool):
-        print(f"[DEBUG] _add_card() called")
-        if self._view_mode == "modern":
-            card = self._build_modern_card(carid, name, developer_added)
-            self._items.append((card, carid, name))
-            self._list_layout.addWidget(card)
+    def _on_uv_requested(self, carid: str, developer_added: bool):
+        if developer_added:
+            self._get_local_uv_map(carid)
         else:
-            insert_pos = len(self._items)
-            for i, (_, _, existing_name) in enumerate(self._items):
-                if existing_name.lower() > name.lower():
-                    insert_pos = i
-                    break
-
-            card = self._build_card(carid, name, developer_added)
-            self._items.insert(insert_pos, (card, carid, name))
-
-            while self._list_layout.count() > 1:
-                self._list_layout.takeAt(0)
-            for i, (w, _, _) in enumerate(self._items):
-                self._list_layout.insertWidget(i, w)
-
-            # Classic mode: attach the floating hover-preview popup
-            self._attach_hover_preview(card, carid)
-
-    def _attach_hover_preview(self, widget: QWidget, carid: str,
-                              get_image_path=None) -> None:
-        """Wire enter/leave preview hooks for both Classic and Modern modes."""
+            self._get_uv_map(carid)
+
+    def _on_card_hovered(self, carid: str):
+        """Classic mode shows the floating hover preview for the row under the mouse."""
         mw = self.window()
-        if mw is not None and hasattr(mw, "preview_manager"):
-            mw.preview_manager.setup_robust_hover(
-                widget, carid, get_image_path=get_image_path
+        manager = getattr(mw, "preview_manager", None) if mw is not None else None
+        if manager is None:
+            return
+        if carid and self._view_mode == "classic":
+            manager.schedule_hover_preview(
+                carid, self._grid,
+                neighbors=lambda: [os.path.join(_IMAGES_DIR, c, "default.jpg")
+                                   for c in self._model.around(carid, PREFETCH_NEIGHBORS)],
             )
+        else:
+            manager.hide_hover_preview()
+
+    @staticmethod
+    def _card_pixmap(path: str, base: QPixmap, w: int, h: int, radius: int = 11) -> QPixmap:
+        """
+        Card image for path at w × h, cut from its pre-rendered base
+        thumbnail (see gui.components.card_thumbs) — only a crop and a
+        clip, so it is cheap to redo at every width while resizing.
+        """
+        key = image_cache.key(path, (w, h), f"rounded_top:{radius}:{base.cacheKey()}")
+        px  = image_cache.get(key)
+        if px is None:
+            px = CarListTab._rounded_top_pixmap(base, w, h, radius=radius)
+            image_cache.put(key, px)
+        return px
 
     @staticmethod
     def _rounded_top_pixmap(src: QPixmap, w: int, h: int, radius: int = 12) -> QPixmap:
@@ -597,376 +1092,6 @@ class CarListTab(QWidget):
         painter.end()
         return result
 
-    def _cols_for_width(self, viewport_width: int) -> int:
-        print(f"[DEBUG] _cols_for_width() called")
-        available = max(viewport_width - 8, CARD_W)   
-        return max(1, available // (CARD_W + CARD_SPACING))
-
-    def _card_width_for(self, viewport_width: int, cols: int) -> int:
-        print(f"[DEBUG] _card_width_for() called")
-        margins = 8   
-        spacing = CARD_SPACING * (cols - 1)
-        return max(CARD_W, (viewport_width - margins - spacing) // cols) - 2
-
-    def _reflow_modern_grid(self):
-        print(f"[DEBUG] _reflow_modern_grid() called")
-        if self._view_mode != "modern" or not self._items:
-            return
-        vw = self._scroll.viewport().width()
-        cols = self._cols_for_width(vw)
-        card_w = self._card_width_for(vw, cols)
-
-        if cols == self._modern_cols_current and card_w == getattr(self, "_modern_card_w", 0):
-            return
-        self._modern_cols_current = cols
-        self._modern_card_w = card_w
-
-        for card, _, _ in self._items:
-            self._list_layout.removeWidget(card)
-
-        for idx, (card, _, _) in enumerate(self._items):
-            r, c = divmod(idx, cols)
-            self._list_layout.addWidget(card, r, c)
-            card.setFixedWidth(card_w)
-
-            img_lbl = card.findChild(QLabel, "vehicle_img")
-            if img_lbl is not None:
-                inner_w = card_w - 2 * GLOW_PAD
-                img_lbl.setGeometry(0, 0, inner_w, CARD_IMG_H)
-                img_path = card.property("img_path")
-                if img_path:
-                    img_lbl.setPixmap(self._rounded_top_pixmap(QPixmap(img_path), inner_w, CARD_IMG_H, radius=11))
-                else:
-                    img_lbl.resize(inner_w, CARD_IMG_H)
-
-    def showEvent(self, event):
-        print(f"[DEBUG] showEvent() called")
-        super().showEvent(event)
-        self._modern_cols_current = 0
-        self._modern_card_w = 0
-        self._reflow_modern_grid()
-
-    def resizeEvent(self, event):
-        print(f"[DEBUG] resizeEvent() called")
-        super().resizeEvent(event)
-        self._reflow_modern_grid()
-
-    def _build_card(self, carid: str, name: str, developer_added: bool) -> QFrame:
-        print(f"[DEBUG] _build_card() called")
-        card = QFrame()
-        card.setObjectName("vehicle_card")
-        card.setStyleSheet(f"""
-            #vehicle_card {{
-                background:{COLORS['card_bg']};
-                border-radius:12px;
-                border:1px solid {COLORS['border']};
-            }}
-            #vehicle_card:hover {{
-                border:1px solid {COLORS['accent']};
-                background:{COLORS.get('card_hover', COLORS['card_bg'])};
-            }}
-        """)
-
-        row = QHBoxLayout(card)
-        row.setContentsMargins(12, 10, 12, 10)
-        row.setSpacing(10)
-
-        icon = QLabel("🚗")
-        icon.setFont(font(20))
-        icon.setStyleSheet("background:transparent;border:none;")
-        icon.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
-        row.addWidget(icon)
-
-        text_col = QVBoxLayout()
-        text_col.setSpacing(1)
-        text_col.setContentsMargins(0, 0, 0, 0)
-
-        name_lbl = QLabel(name)
-        name_lbl.setFont(font(14, "bold"))
-        name_lbl.setStyleSheet(
-            f"color:{COLORS['text']};background:transparent;border:none;"
-        )
-        text_col.addWidget(name_lbl)
-
-        id_lbl = QLabel(carid)
-        id_lbl.setFont(font(12))
-        id_lbl.setStyleSheet(
-            f"color:{COLORS['text_secondary']};background:transparent;border:none;"
-        )
-        text_col.addWidget(id_lbl)
-
-        row.addLayout(text_col, 1)
-
-        btn_row = QHBoxLayout()
-        btn_row.setSpacing(6)
-
-        if not developer_added:
-            uv_btn = self._mk_btn(
-                t("car_list.get_uv_map"),
-                lambda _, c=carid: self._get_uv_map(c),
-                "primary",
-            )
-            btn_row.addWidget(uv_btn)
-        else:
-            # For custom-added vehicles show UV button only when a local UV
-            # map was copied in during import.
-            local_uvs = _get_local_uv_map_paths(carid)
-            if local_uvs:
-                uv_btn = self._mk_btn(
-                    t("car_list.get_uv_map"),
-                    lambda _, c=carid: self._get_local_uv_map(c),
-                    "primary",
-                )
-                btn_row.addWidget(uv_btn)
-
-        copy_btn = self._mk_btn(
-            t("car_list.copy_id"),
-            lambda _, c=carid: self._copy_carid(c),
-            "secondary",
-        )
-        btn_row.addWidget(copy_btn)
-
-        row.addLayout(btn_row)
-        return card
-
-    def _build_modern_card(self, carid: str, name: str, developer_added: bool) -> AnimatedCard:
-        print(f"[DEBUG] _build_modern_card() called")
-        card = AnimatedCard()
-        card.setObjectName("vehicle_card")
-        card.setFixedWidth(CARD_W)
-
-        variants = _get_variant_images(carid)
-        card._variants    = variants
-        card._variant_idx = 0
-
-        # GLOW_PAD on all sides — glow + grow effect lives in this outer ring
-        inner_w = CARD_W - 2 * GLOW_PAD
-        col = QVBoxLayout(card)
-        col.setContentsMargins(GLOW_PAD, GLOW_PAD, GLOW_PAD, GLOW_PAD + 5)
-        col.setSpacing(8)
-
-        img_container = QFrame()
-        img_container.setObjectName("vehicle_img_container")
-        img_container.setFixedHeight(CARD_IMG_H)
-        img_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        img_container.setStyleSheet(
-            f"QFrame {{ background:{COLORS.get('frame_bg', COLORS['card_bg'])};"
-            f"border:none;"
-            f"border-top-left-radius:11px; border-top-right-radius:11px; }}"
-        )
-
-        img_lbl = QLabel(img_container)
-        img_lbl.setObjectName("vehicle_img")
-        img_lbl.setAlignment(Qt.AlignCenter)
-        img_lbl.setStyleSheet("background:transparent;border:none;")
-        img_lbl.setGeometry(0, 0, inner_w, CARD_IMG_H)
-
-        if variants:
-            first_label, first_path = variants[0]
-            card.setProperty("img_path", first_path)
-            img_lbl.setPixmap(
-                self._rounded_top_pixmap(QPixmap(first_path), inner_w, CARD_IMG_H, radius=11)
-            )
-        else:
-            card.setProperty("img_path", "")
-            img_lbl.setText("🚗")
-            img_lbl.setFont(font(38))
-
-        if len(variants) > 1:
-            _NAV_BTN = """
-                QPushButton {{
-                    background: rgba(0,0,0,110);
-                    color: white;
-                    border-radius: {r}px;
-                    border: none;
-                    font-size: 18px;
-                    font-weight: bold;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{ background: rgba(0,0,0,210); }}
-            """
-
-            # Left arrow
-            prev_btn = QPushButton("‹", img_container)
-            prev_btn.setFixedSize(26, 38)
-            prev_btn.setStyleSheet(_NAV_BTN.format(r=6))
-            prev_btn.setCursor(Qt.PointingHandCursor)
-            prev_btn.raise_()
-
-            # Right arrow
-            next_btn = QPushButton("›", img_container)
-            next_btn.setFixedSize(26, 38)
-            next_btn.setStyleSheet(_NAV_BTN.format(r=6))
-            next_btn.setCursor(Qt.PointingHandCursor)
-            next_btn.raise_()
-
-            # Variant label badge — bottom-left of image
-            var_lbl = QLabel(variants[0][0], img_container)
-            var_lbl.setObjectName("variant_label")
-            var_lbl.setFont(font(9, "bold"))
-            var_lbl.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    background: rgba(0,0,0,145);
-                    border-radius: 4px;
-                    padding: 2px 6px;
-                    border: none;
-                }
-            """)
-            var_lbl.adjustSize()
-            var_lbl.raise_()
-
-            # Dot indicators
-            dot_size   = 6
-            dot_gap    = 4
-            dot_widgets: List[QLabel] = []
-            for di in range(len(variants)):
-                d = QLabel(img_container)
-                d.setFixedSize(dot_size, dot_size)
-                d.setStyleSheet(
-                    "background:white;border-radius:3px;border:none;"
-                    if di == 0 else
-                    "background:rgba(255,255,255,90);border-radius:3px;border:none;"
-                )
-                d.raise_()
-                dot_widgets.append(d)
-
-            def _reposition(w, h,
-                            pb=prev_btn, nb=next_btn,
-                            vl=var_lbl, dws=dot_widgets,
-                            il=img_lbl, ds=dot_size, dg=dot_gap):
-                """Reposition all overlay widgets to match the container size."""
-                il.setGeometry(0, 0, w, h)
-                pb.move(4, (h - pb.height()) // 2)
-                nb.move(w - nb.width() - 4, (h - nb.height()) // 2)
-                vl.move(6, h - vl.height() - 6)
-                dots_w = len(dws) * ds + (len(dws) - 1) * dg
-                dx = (w - dots_w) // 2
-                dy = h - ds - 4
-                for di, dw in enumerate(dws):
-                    dw.move(dx + di * (ds + dg), dy)
-
-            # Initial placement
-            _reposition(img_container.width() or inner_w, CARD_IMG_H)
-
-            # Keep positions correct whenever the container is resized
-            img_container.resizeEvent = lambda ev, rp=_reposition: rp(
-                ev.size().width(), ev.size().height()
-            )
-
-            def _switch(delta, c=card, lbl=img_lbl, vl=var_lbl, dws=dot_widgets):
-                c._variant_idx = (c._variant_idx + delta) % len(c._variants)
-                v_label, v_path = c._variants[c._variant_idx]
-                c.setProperty("img_path", v_path)
-                vl.setText(v_label)
-                vl.adjustSize()
-                vl.move(6, img_container.height() - vl.height() - 6)
-                iw = img_container.width() or inner_w
-                ih = img_container.height() or CARD_IMG_H
-                lbl.setPixmap(
-                    CarListTab._rounded_top_pixmap(QPixmap(v_path), iw, ih, radius=11)
-                )
-                for di, dw in enumerate(dws):
-                    dw.setStyleSheet(
-                        "background:white;border-radius:3px;border:none;"
-                        if di == c._variant_idx else
-                        "background:rgba(255,255,255,90);border-radius:3px;border:none;"
-                    )
-
-            prev_btn.clicked.connect(lambda _=False: _switch(-1))
-            next_btn.clicked.connect(lambda _=False: _switch(1))
-
-        col.addWidget(img_container)
-
-        info = QWidget()
-        info.setStyleSheet("background:transparent;border:none;")
-        info_col = QVBoxLayout(info)
-        info_col.setContentsMargins(10, 0, 10, 0)
-        info_col.setSpacing(3)
-
-        name_lbl = QLabel(name)
-        name_lbl.setFont(font(13, "bold"))
-        name_lbl.setWordWrap(True)
-        name_lbl.setStyleSheet(
-            f"color:{COLORS['text']};background:transparent;border:none;"
-        )
-        info_col.addWidget(name_lbl)
-
-        id_lbl = QLabel(carid)
-        id_lbl.setFont(font(11))
-        id_lbl.setStyleSheet(
-            f"color:{COLORS['text_secondary']};background:transparent;border:none;"
-        )
-        info_col.addWidget(id_lbl)
-
-        col.addWidget(info)
-
-        btn_container = QWidget()
-        btn_container.setStyleSheet("background:transparent;border:none;")
-        btn_row = QHBoxLayout(btn_container)
-        btn_row.setContentsMargins(8, 0, 8, 0)
-        btn_row.setSpacing(6)
-
-        if not developer_added:
-            uv_btn = self._mk_btn(
-                t("car_list.get_uv_map"),
-                lambda _, c=carid: self._get_uv_map(c),
-                "primary",
-                compact=True,
-            )
-            btn_row.addWidget(uv_btn)
-        else:
-            local_uvs = _get_local_uv_map_paths(carid)
-            if local_uvs:
-                uv_btn = self._mk_btn(
-                    t("car_list.get_uv_map"),
-                    lambda _, c=carid: self._get_local_uv_map(c),
-                    "primary",
-                    compact=True,
-                )
-                btn_row.addWidget(uv_btn)
-
-        copy_btn = self._mk_btn(
-            t("car_list.copy_id"),
-            lambda _, c=carid: self._copy_carid(c),
-            "secondary",
-            compact=True,
-        )
-        btn_row.addWidget(copy_btn)
-
-        col.addWidget(btn_container)
-
-        return card
-
-    def _mk_btn(self, text: str, cmd, style: str = "primary", compact: bool = False) -> QPushButton:
-        btn = QPushButton(text)
-        btn.setFont(font(12, "bold"))
-        btn.setFixedHeight(32 if compact else 36)
-        if not compact:
-            btn.setMinimumWidth(100)
-        btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        btn.setCursor(Qt.PointingHandCursor)
-        if style == "primary":
-            bg  = COLORS["accent"]
-            bgh = COLORS["accent_hover"]
-            tc  = COLORS["accent_text"]
-            border = "none"
-        else:
-            bg  = COLORS["frame_bg"]
-            bgh = COLORS["card_hover"]
-            tc  = COLORS["text"]
-            border = f"1px solid {COLORS['border']}"
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background:{bg};color:{tc};
-                border-radius:10px;border:{border};
-                padding:4px {"4px" if compact else "14px"};
-            }}
-            QPushButton:hover {{ background:{bgh}; }}
-        """)
-        btn.clicked.connect(cmd)
-        return btn
-
     def _notify(self, msg: str, kind: str = "info", duration: int = 3000):
         print(f"[DEBUG] _notify() called")
         try:
@@ -979,68 +1104,32 @@ class CarListTab(QWidget):
         print(f"[{kind.upper()}] {msg}")
 
     def _filter(self, text: str):
+        # Debounced: a burst of keystrokes re-filters the list once.
+        self._filter_timer.start()
+
+    def _apply_filter(self):
+        text = self._search.text()
         print(f"[DEBUG] _filter: query={text!r}")
-        q = text.lower()
-        if not q:
-            for card, _, _ in self._items:
-                card.setVisible(True)
-            self._relayout_all()
-        else:
-            matches    = [(card, cid, nm) for card, cid, nm in self._items
-                          if q in cid.lower() or q in nm.lower()]
-            non_matches = [(card, cid, nm) for card, cid, nm in self._items
-                           if not (q in cid.lower() or q in nm.lower())]
-            for card, _, _ in non_matches:
-                card.setVisible(False)
-            for card, _, _ in matches:
-                card.setVisible(True)
-            self._relayout_order(matches)
-        self._scroll.verticalScrollBar().setValue(0)
-
-    def _relayout_all(self):
-        print(f"[DEBUG] _relayout_all() called")
-        if self._view_mode == "modern":
-            for card, _, _ in self._items:
-                self._list_layout.removeWidget(card)
-            for idx, (card, _, _) in enumerate(self._items):
-                r, c = divmod(idx, self._modern_cols_current or 1)
-                self._list_layout.addWidget(card, r, c)
-        else:
-            while self._list_layout.count() > 1:
-                self._list_layout.takeAt(0)
-            for i, (w, _, _) in enumerate(self._items):
-                self._list_layout.insertWidget(i, w)
-
-    def _relayout_order(self, ordered: list):
-        print(f"[DEBUG] _relayout_order() called")
-        if self._view_mode == "modern":
-            for card, _, _ in self._items:
-                self._list_layout.removeWidget(card)
-            for idx, (card, _, _) in enumerate(ordered):
-                r, c = divmod(idx, self._modern_cols_current or 1)
-                self._list_layout.addWidget(card, r, c)
-        else:
-            while self._list_layout.count() > 1:
-                self._list_layout.takeAt(0)
-            for i, (w, _, _) in enumerate(ordered):
-                self._list_layout.insertWidget(i, w)
+        self._model.set_filter(text)
+        self._grid.scrollToTop()
 
     def refresh_ui(self):
         print(f"[DEBUG] refresh_ui() called")
         self._search.setPlaceholderText(t("car_list.search_placeholder"))
         self._btn_classic.setText(t("car_list.view_classic"))
         self._btn_modern.setText(t("car_list.view_modern"))
-        self._items.clear()
+        self._btn_extract_all.setText(t("car_list.uv_extract_cancel" if self._extract_worker
+                                        else "car_list.uv_extract_all"))
+        self._btn_extract_all.setToolTip(t("car_list.uv_extract_all_tip"))
         if hasattr(state, "carlist_items"):
             state.carlist_items.clear()
-        self._rebuild_inner()
         self._populate()
-        self._reflow_modern_grid()
+        self._grid.refresh()
 
     def refresh_vehicle_list(self):
         print(f"[DEBUG] refresh_vehicle_list: refreshing car list UI")
         self.refresh_ui()
-        print(f"[DEBUG] CarListTab: Vehicle list refreshed with {len(self._items)} vehicles")
+        print(f"[DEBUG] CarListTab: Vehicle list refreshed with {self._model.total} vehicles")
 
     def _copy_carid(self, carid: str):
         print(f"[DEBUG] _copy_carid: copying {carid!r} to clipboard")
@@ -1071,41 +1160,7 @@ class CarListTab(QWidget):
 
     def _save_uv_files_local(self, selected: List[Tuple[str, str]]):
         """Save locally-stored UV maps to a user-chosen location."""
-        if len(selected) == 1:
-            src_path, _ = selected[0]
-            ext  = os.path.splitext(src_path)[1]
-            dest, _ = QFileDialog.getSaveFileName(
-                self,
-                t("car_list.save_uv_dialog"),
-                os.path.basename(src_path),
-                f"Image Files (*{ext});;All Files (*.*)",
-            )
-            if not dest:
-                return
-            try:
-                import shutil as _shutil
-                _shutil.copy2(src_path, dest)
-                self._notify(t("car_list.uv_extracted"), "success", 3000)
-            except Exception as e:
-                self._notify(t("car_list.failed_save_uv", error=e), "error", 4000)
-        else:
-            dest_folder = QFileDialog.getExistingDirectory(
-                self, t("car_list.save_uv_folder")
-            )
-            if not dest_folder:
-                return
-            import shutil as _shutil
-            ok = 0
-            for src_path, _ in selected:
-                try:
-                    _shutil.copy2(src_path, os.path.join(dest_folder, os.path.basename(src_path)))
-                    ok += 1
-                except Exception as e:
-                    print(f"[DEBUG] Failed to copy {os.path.basename(src_path)}: {e}")
-            self._notify(
-                t("car_list.uv_extracted_count", ok=ok, total=len(selected)),
-                "success", 3000,
-            )
+        self._save_uv_files([(src_path, "") for src_path, _ in selected])
 
     def _get_uv_map(self, carid: str):
         try:
@@ -1166,32 +1221,23 @@ class CarListTab(QWidget):
         zip_file_path: str,
         beamng_path: str,
     ) -> List[Tuple[str, str]]:
+        # Member lists come from the persistent archive index, so this
+        # never re-reads a central directory the app has seen before.
         found: List[Tuple[str, str]] = []
-        search_common = False
-        common_search_dirs: List[str] = []
-
-        with zipfile.ZipFile(zip_file_path, "r") as z:
-            for fp in z.namelist():
-                if "ambulance" in os.path.basename(fp).lower():
-                    search_common = True
-                    common_search_dirs.append("vehicles/common/pickup/")
-                    break
-
-        with zipfile.ZipFile(zip_file_path, "r") as z:
-            target_dir = f"vehicles/{carid}/"
-            for fp in z.namelist():
-                if fp.startswith(target_dir) and self._is_uv_file(fp):
-                    found.append((fp, zip_file_path))
+        names = archive_index.names(zip_file_path)
+        search_common = any("ambulance" in os.path.basename(fp).lower() for fp in names)
+
+        for fp in archive_index.under(zip_file_path, f"vehicles/{carid}/"):
+            if self._is_uv_file(fp):
+                found.append((fp, zip_file_path))
 
         if search_common:
             common_zip = os.path.join(beamng_path, "common.zip")
             if os.path.exists(common_zip):
                 print("[DEBUG] Also searching in common.zip for ambulance UV maps…")
-                with zipfile.ZipFile(common_zip, "r") as z:
-                    for search_dir in common_search_dirs:
-                        for fp in z.namelist():
-                            if fp.startswith(search_dir) and self._is_uv_file(fp):
-                                found.append((fp, common_zip))
+                for fp in archive_index.under(common_zip, "vehicles/common/pickup/"):
+                    if self._is_uv_file(fp):
+                        found.append((fp, common_zip))
 
         return found
 
@@ -1215,9 +1261,10 @@ class CarListTab(QWidget):
         return True
 
     def _save_uv_files(self, selected: List[Tuple[str, str]]):
+        """selected: (member, source zip) pairs; an empty zip means member is a plain file."""
         print(f"[DEBUG] _save_uv_files: saving {len(selected)} UV file(s)")
         if len(selected) == 1:
-            file_path, source_zip = selected[0]
+            file_path, _ = selected[0]
             ext = os.path.splitext(file_path)[1]
             dest, _ = QFileDialog.getSaveFileName(
                 self,
@@ -1227,34 +1274,95 @@ class CarListTab(QWidget):
             )
             if not dest:
                 return
-            try:
-                with zipfile.ZipFile(source_zip, "r") as z:
-                    with z.open(file_path) as src, open(dest, "wb") as dst:
-                        dst.write(src.read())
-                self._notify(t("car_list.uv_extracted"), "success", 3000)
-                print(f"[DEBUG] UV Map extracted: {file_path} → {dest}")
-            except Exception as e:
-                self._notify(t("car_list.failed_save_uv", error=e), "error", 4000)
+            targets = [dest]
         else:
             dest_folder = QFileDialog.getExistingDirectory(
                 self, t("car_list.save_uv_folder")
             )
             if not dest_folder:
                 return
-            ok = 0
-            for file_path, source_zip in selected:
-                filename = os.path.basename(file_path)
-                dest = os.path.join(dest_folder, filename)
+            targets = [os.path.join(dest_folder, os.path.basename(fp)) for fp, _ in selected]
+
+        jobs = [
+            ExtractJob(source_zip, file_path, dest) if source_zip else ExtractJob(file_path, "", dest)
+            for (file_path, source_zip), dest in zip(selected, targets)
+        ]
+        self._start_extraction(lambda: jobs)
+
+    def _extract_all_uv_maps(self):
+        """Toolbar button: extract every UV map of every vehicle, or cancel a running job."""
+        if self._extract_worker is not None:
+            self._extract_worker.requestInterruption()
+            return
+        dest_folder = QFileDialog.getExistingDirectory(self, t("car_list.save_uv_folder"))
+        if not dest_folder:
+            return
+
+        beamng_path = ""
+        try:
+            from core.settings import get_beamng_install_path
+            install = get_beamng_install_path()
+            if install:
+                beamng_path = os.path.join(install, "content", "vehicles")
+        except ImportError:
+            pass
+        vehicles = self._model.vehicles()
+
+        def plan() -> List[ExtractJob]:
+            jobs: List[ExtractJob] = []
+            for carid, _name, developer_added in vehicles:
+                folder = os.path.join(dest_folder, carid)
+                if developer_added:
+                    for path in _get_local_uv_map_paths(carid):
+                        jobs.append(ExtractJob(path, "", os.path.join(folder, os.path.basename(path))))
+                    continue
+                zip_path = os.path.join(beamng_path, f"{carid}.zip") if beamng_path else ""
+                if not zip_path or not os.path.exists(zip_path):
+                    continue
                 try:
-                    with zipfile.ZipFile(source_zip, "r") as z:
-                        with z.open(file_path) as src, open(dest, "wb") as dst:
-                            dst.write(src.read())
-                    ok += 1
-                    print(f"[DEBUG] UV Map extracted: {filename} → {dest}")
+                    for member, source in self._find_uv_files(carid, zip_path, beamng_path):
+                        jobs.append(ExtractJob(source, member, os.path.join(folder, os.path.basename(member))))
                 except Exception as e:
-                    print(f"[DEBUG] Failed to extract {filename}: {e}")
+                    print(f"[DEBUG] Skipping UV maps of {carid}: {e}")
+            return jobs
+
+        self._start_extraction(plan)
+
+    def _start_extraction(self, plan: Callable[[], List[ExtractJob]]):
+        if self._extract_worker is not None:
+            self._notify(t("car_list.uv_extract_busy"), "warning", 3000)
+            return
+        worker = _UVExtractWorker(plan, parent=self)
+        worker.progress.connect(self._on_extract_progress)
+        worker.finished.connect(self._on_extract_finished)
+        self._extract_worker = worker
+        self._extract_progress.setRange(0, 0)          # busy until the plan is known
+        self._extract_progress.setVisible(True)
+        self._btn_extract_all.setText(t("car_list.uv_extract_cancel"))
+        worker.start()
+
+    def _on_extract_progress(self, done: int, total: int):
+        self._extract_progress.setRange(0, max(1, total))
+        self._extract_progress.setValue(done)
+
+    def _on_extract_finished(self, ok: int, total: int, cancelled: bool):
+        worker, self._extract_worker = self._extract_worker, None
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        self._extract_progress.setVisible(False)
+        self._btn_extract_all.setText(t("car_list.uv_extract_all"))
+        if total == 0:
+            self._notify(t("car_list.uv_extract_none"), "warning", 4000)
+        elif total == 1:
+            if ok:
+                self._notify(t("car_list.uv_extracted"), "success", 3000)
+            else:
+                self._notify(t("car_list.failed_save_uv", error=t("car_list.uv_extract_see_log")),
+                             "error", 4000)
+        else:
             self._notify(
-                t("car_list.uv_extracted_count", ok=ok, total=len(selected)),
-                "success", 3000,
+                t("car_list.uv_extracted_count", ok=ok, total=total),
+                "warning" if cancelled or ok < total else "success", 3000,
             )
 
@@ -3,7 +3,7 @@ import os, json, threading
 from typing import Dict, List, Optional, Any, Callable
 
 from PySide6.QtCore    import Qt, QTimer, Signal, QPropertyAnimation, QEasingCurve, QRect
-from PySide6.QtGui     import QPixmap, QPainter, QBrush, QColor
+from PySide6.QtGui     import QPixmap, QImage, QPainter, QBrush, QColor
 from PySide6.QtWidgets import (
     QWidget, QFrame, QLabel, QPushButton, QLineEdit, QCheckBox, QComboBox,
     QProgressBar, QScrollArea, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -13,6 +13,8 @@ from PySide6.QtWidgets import (
 from gui.theme   import COLORS, font, drop_shadow, fade_in
 from gui.widgets import AnimButton, GhostButton, SectionHeader, HSeparator, ToggleSwitch
 from gui.state   import state
+from gui.components.preview_loader import PreviewLoader
+from gui.image_cache import image_cache
 
 try:
     from core.localization import t
@@ -47,6 +49,21 @@ except Exception as e:
     print(f"[DEBUG] PIL not available: {e}")
     _PIL_OK = False
 
+try:
+    from utils.dds_reader import decode_preview as _dds_decode_preview
+except ImportError:
+    _dds_decode_preview = None
+
+try:
+    from utils.texture_info import inspect as _texture_info
+except ImportError:
+    _texture_info = None
+
+try:
+    from utils.thumb_cache import thumb_cache as _thumb_cache
+except ImportError:
+    _thumb_cache = None
+
 try:
     from core.project_registry import add_or_update_entry as _reg_add
     print("[DEBUG] generator: project_registry imported OK")
@@ -61,37 +78,109 @@ except ImportError as _pb_imp_exc:
     print(f"[DEBUG] generator: ProjectBrowserDialog not available: {_pb_imp_exc} — will fall back to file dialog")
     ProjectBrowserDialog = None
 
+try:
+    from gui.components.rough_met_dialog import RoughMetComposerDialog
+except ImportError as _rm_imp_exc:
+    print(f"[DEBUG] generator: rough_met composer not available: {_rm_imp_exc}")
+    RoughMetComposerDialog = None
+
 print("[DEBUG] Loading class: GeneratorTab")
 
 
 
-def _load_pixmap_robust(path: str, max_w: int = 400, max_h: int = 200) -> Optional[QPixmap]:
-    from PySide6.QtGui import QImageReader
+def _cached_image(path: str, max_w: int = 400, max_h: int = 200) -> Optional[QImage]:
+    """The preview from the thumbnail cache, or None on a miss (no decoding)."""
+    key = _thumb_cache.key(path, max_w, max_h) if _thumb_cache else None
+    hit = _thumb_cache.get(key) if key else None
+    if hit:
+        qi = QImage(hit)
+        if not qi.isNull():
+            return qi
+    return None
+
 
+def _load_image_robust(path: str, max_w: int = 400, max_h: int = 200) -> Optional[QImage]:
+    """
+    Preview of path scaled to fit max_w × max_h.  Successful decodes are
+    kept in the on-disk thumbnail cache, so a texture is only decoded again
+    after it changes.  Undecodable DDS files get a painted placeholder.
+    Only uses QImage, so it is safe to call from worker threads.
+    """
+    key = _thumb_cache.key(path, max_w, max_h) if _thumb_cache else None
+    if key:
+        hit = _thumb_cache.get(key)
+        if hit:
+            qi = QImage(hit)
+            if not qi.isNull():
+                return qi
+
+    qi = _decode_image(path, max_w, max_h)
+    if qi is not None and not qi.isNull():
+        if key:
+            _store_thumb(key, qi)
+        return qi
+    if os.path.splitext(path)[1].lower() == ".dds":
+        return _dds_placeholder(path, max_w)
+    return qi
+
+
+def _store_thumb(key: str, qi: QImage) -> None:
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    data = QByteArray()
+    buf  = QBuffer(data)
+    buf.open(QIODevice.OpenModeFlag.WriteOnly)
+    ok = qi.save(buf, "PNG")
+    buf.close()
+    if ok:
+        _thumb_cache.put(key, bytes(data.data()))
+
+
+def _dds_placeholder(path: str, max_w: int) -> QImage:
+    from PySide6.QtGui import QFont as _QFont
+    placeholder = QImage(max_w, 80, QImage.Format.Format_RGBA8888)
+    placeholder.fill(QColor("#2a2a3a"))
+    painter = QPainter(placeholder)
+    painter.setPen(QColor("#a0a0c0"))
+    f = _QFont(); f.setPointSize(10); f.setBold(True)
+    painter.setFont(f)
+    painter.drawText(
+        placeholder.rect(), Qt.AlignCenter,
+        f"🖼  DDS — {os.path.basename(path)}\n(preview not available)"
+    )
+    painter.end()
+    return placeholder
+
+
+def _decode_image(path: str, max_w: int, max_h: int) -> Optional[QImage]:
     ext = os.path.splitext(path)[1].lower()
 
-    def _scale(px: QPixmap) -> QPixmap:
-        if px.isNull():
-            return px
-        return px.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # A texture whose header doesn't even parse won't decode either; don't
+    # run it through every loader below just to find that out.
+    if _texture_info is not None and ext in (".dds", ".png", ".jpg", ".jpeg") \
+            and _texture_info(path) is None:
+        print(f"[DEBUG] Unreadable texture header, not decoding: {os.path.basename(path)}")
+        return None
 
-    def _qt_load() -> Optional[QPixmap]:
-        px = QPixmap(path)
-        return _scale(px) if not px.isNull() else None
+    def _scale(qi: QImage) -> QImage:
+        if qi.isNull():
+            return qi
+        return qi.scaled(max_w, max_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
-    def _pil_load() -> Optional[QPixmap]:
+    def _qt_load() -> Optional[QImage]:
+        qi = QImage(path)
+        return _scale(qi) if not qi.isNull() else None
+
+    def _pil_load() -> Optional[QImage]:
         if not _PIL_OK:
             return None
         try:
-            from PySide6.QtGui import QImage
             _PILImage.MAX_IMAGE_PIXELS = None  # allow large game textures (e.g. 16384×16384 BC7)
             img = _PILImage.open(path)
             img.thumbnail((max_w * 2, max_h * 2), _PILImage.Resampling.LANCZOS)
             img = img.convert("RGBA")
             data = img.tobytes("raw", "RGBA")
-            qi = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888)
-            px = QPixmap.fromImage(qi)
-            return _scale(px) if not px.isNull() else None
+            qi = QImage(data, img.width, img.height, QImage.Format.Format_RGBA8888).copy()
+            return _scale(qi) if not qi.isNull() else None
         except Exception as e:
             print(f"[DEBUG] PIL load failed for {os.path.basename(path)}: {e}")
             return None
@@ -122,13 +211,26 @@ def _load_pixmap_robust(path: str, max_w: int = 400, max_h: int = 200) -> Option
             _st.pack_into("<I", p, 128, remapped)
             return bytes(p)
 
-        def _imageio_load() -> Optional[QPixmap]:
+        def _native_load() -> Optional[QImage]:
+            if _dds_decode_preview is None:
+                return None
+            try:
+                hit = _dds_decode_preview(path, max_w, max_h)
+                if hit is None:
+                    return None
+                w, h, rgba = hit
+                qi = QImage(rgba, w, h, w * 4, QImage.Format.Format_RGBA8888).copy()
+                return _scale(qi) if not qi.isNull() else None
+            except Exception as e:
+                print(f"[DEBUG] native DDS load failed for {os.path.basename(path)}: {e}")
+                return None
+
+        def _imageio_load() -> Optional[QImage]:
             try:
                 import io as _io
                 import imageio.v2 as _iio
                 import numpy as _np
                 from PIL import Image as _PilImg
-                from PySide6.QtGui import QImage
                 _PilImg.MAX_IMAGE_PIXELS = None  # allow large game textures (e.g. 16384×16384 BC7)
                 with open(path, "rb") as _fh:
                     raw = _fh.read()
@@ -147,17 +249,14 @@ def _load_pixmap_robust(path: str, max_w: int = 400, max_h: int = 200) -> Option
                 qi = qi.copy()
                 if qi.isNull():
                     return None
-                px = QPixmap.fromImage(qi)
-                return _scale(px) if not px.isNull() else None
+                return _scale(qi)
             except Exception as e:
                 print(f"[DEBUG] imageio load failed for {os.path.basename(path)}: {e}")
                 return None
 
-        def _wand_load() -> Optional[QPixmap]:
+        def _wand_load() -> Optional[QImage]:
             try:
-                import io as _io
                 from wand.image import Image as WandImage
-                from PySide6.QtGui import QImage
                 from PySide6.QtCore import QByteArray
                 with open(path, "rb") as _fh:
                     raw = _fh.read()
@@ -167,12 +266,14 @@ def _load_pixmap_robust(path: str, max_w: int = 400, max_h: int = 200) -> Option
                 qi.loadFromData(QByteArray(blob))
                 if qi.isNull():
                     return None
-                px = QPixmap.fromImage(qi)
-                return _scale(px) if not px.isNull() else None
+                return _scale(qi)
             except Exception as e:
                 print(f"[DEBUG] Wand load failed for {os.path.basename(path)}: {e}")
                 return None
 
+        result = _native_load()
+        if result:
+            return result
         result = _imageio_load()
         if result:
             return result
@@ -182,22 +283,7 @@ def _load_pixmap_robust(path: str, max_w: int = 400, max_h: int = 200) -> Option
         result = _pil_load()
         if result:
             return result
-        result = _qt_load()
-        if result:
-            return result
-        from PySide6.QtGui import QImage, QPainter, QColor, QFont as _QFont
-        placeholder = QImage(max_w, 80, QImage.Format.Format_RGBA8888)
-        placeholder.fill(QColor("#2a2a3a"))
-        painter = QPainter(placeholder)
-        painter.setPen(QColor("#a0a0c0"))
-        f = _QFont(); f.setPointSize(10); f.setBold(True)
-        painter.setFont(f)
-        painter.drawText(
-            placeholder.rect(), Qt.AlignCenter,
-            f"🖼  DDS — {os.path.basename(path)}\n(preview not available)"
-        )
-        painter.end()
-        return QPixmap.fromImage(placeholder)
+        return _qt_load()
 
     else:
         result = _pil_load()
@@ -234,6 +320,7 @@ def _split_project_key(key: str):
 
 
 _ILLEGAL_NAME_CHARS = set('\\/:*?"<>|')
+MATERIAL_SLICE = 6      # material sections built per idle tick
 
 def _find_illegal_chars(name: str):
     """Return a sorted list of illegal filename characters found in *name*."""
@@ -261,6 +348,7 @@ class GeneratorTab(QWidget):
         print("[DEBUG] GeneratorTab.__init__ called")
 
         self.show_notification = notification_callback or self._fallback_notification
+        self._previews = PreviewLoader(_load_image_robust, parent=self)
 
         self.mod_name_entry_sidebar: Optional[QLineEdit] = None
         self.author_entry_sidebar:   Optional[QLineEdit] = None
@@ -291,6 +379,13 @@ class GeneratorTab(QWidget):
         self._current_project_path: Optional[str] = None   # set on load/save; None = unsaved new project
 
         self.material_properties_entries: Dict[str, Dict[str, QLineEdit]] = {}
+        # Material sections still to be built; filled in MATERIAL_SLICE at a time
+        # when the event loop is idle so a car with many materials doesn't freeze the UI.
+        self._mat_pending: List = []
+        self._mat_timer = QTimer(self)
+        self._mat_timer.setSingleShot(True)
+        self._mat_timer.setInterval(0)
+        self._mat_timer.timeout.connect(self._build_material_slice)
         self.car_id_list: List = self._build_car_id_list()
 
         self._setup_ui()
@@ -892,6 +987,12 @@ class GeneratorTab(QWidget):
             "primary", width=100, height=36, font_size=11
         )
         rfl_input_row.addWidget(self._rfl_browse)
+        if RoughMetComposerDialog is not None:
+            self._rfl_compose = self._mk_btn(
+                t("project.compose_reflectivity", default="Compose…"), self._compose_rough_met,
+                "secondary", width=100, height=36, font_size=11
+            )
+            rfl_input_row.addWidget(self._rfl_compose)
         rfl_col.addLayout(rfl_input_row)
 
         # Variant body reflectivity map — only shown for variant cars
@@ -920,6 +1021,12 @@ class GeneratorTab(QWidget):
             "primary", width=100, height=36, font_size=11
         )
         rfl_input_row_2.addWidget(self._rfl_browse_2)
+        if RoughMetComposerDialog is not None:
+            self._rfl_compose_2 = self._mk_btn(
+                t("project.compose_reflectivity", default="Compose…"), self._compose_rough_met_2,
+                "secondary", width=100, height=36, font_size=11
+            )
+            rfl_input_row_2.addWidget(self._rfl_compose_2)
         rfl_sec2_col.addLayout(rfl_input_row_2)
         rfl_col.addWidget(self._rfl_section_2)
 
@@ -1297,10 +1404,8 @@ class GeneratorTab(QWidget):
 
         # Show/hide body-2 preview labels
         if not is_var:
-            self._dds_preview_2.setVisible(False)
-            self._dds_preview_2.clear()
-            self._color_map_preview_2.setVisible(False)
-            self._color_map_preview_2.clear()
+            self._clear_preview(self._dds_preview_2)
+            self._clear_preview(self._color_map_preview_2)
 
         # Update banner text when colorable changes
         if is_var and self._variant_banner.isVisible():
@@ -1744,23 +1849,19 @@ class GeneratorTab(QWidget):
         self._rough_met_path_2= ""
 
         try:
-            self._dds_preview.setVisible(False)
-            self._dds_preview.clear()
+            self._clear_preview(self._dds_preview)
         except Exception:
             pass
         try:
-            self._color_map_preview.setVisible(False)
-            self._color_map_preview.clear()
+            self._clear_preview(self._color_map_preview)
         except Exception:
             pass
         try:
-            self._dds_preview_2.setVisible(False)
-            self._dds_preview_2.clear()
+            self._clear_preview(self._dds_preview_2)
         except Exception:
             pass
         try:
-            self._color_map_preview_2.setVisible(False)
-            self._color_map_preview_2.clear()
+            self._clear_preview(self._color_map_preview_2)
         except Exception:
             pass
 
@@ -1777,6 +1878,8 @@ class GeneratorTab(QWidget):
         self._toggle_material_properties()
         self._update_variant_ui()
 
+        self._mat_timer.stop()
+        self._mat_pending = []
         while self._mat_props_layout.count():
             item = self._mat_props_layout.takeAt(0)
             if item.widget():
@@ -1937,8 +2040,28 @@ class GeneratorTab(QWidget):
             self._rough_met_path_2 = path
             self.rfl_entry_2.setText(os.path.basename(path))
 
+    def _compose_rough_met(self):
+        path = self._run_rough_met_composer(self._rough_met_path)
+        if path:
+            self._rough_met_path = path
+            self.rfl_entry.setText(os.path.basename(path))
+
+    def _compose_rough_met_2(self):
+        path = self._run_rough_met_composer(self._rough_met_path_2)
+        if path:
+            self._rough_met_path_2 = path
+            self.rfl_entry_2.setText(os.path.basename(path))
+
+    def _run_rough_met_composer(self, current: str) -> str:
+        print(f"[DEBUG] _run_rough_met_composer() called, current={current!r}")
+        dlg = RoughMetComposerDialog(self, default_dest=current)
+        if dlg.exec() and dlg.result_path:
+            return dlg.result_path
+        return ""
+
     def _load_preview(self, path: str, label: QLabel):
         print(f"[DEBUG] _load_preview: loading {path!r}")
+        self._previews.cancel(label)
         label.setVisible(False)
         label.clear()
         if not path:
@@ -1954,28 +2077,55 @@ class GeneratorTab(QWidget):
             return
         # Respect the "Texture Previews" setting from Settings tab
         if not getattr(state, 'texture_previews_enabled', True):
-            label.setText(f"📄  {os.path.basename(path)}")
-            label.setStyleSheet(
-                f"color:{COLORS['text_secondary']};"
-                "background:transparent;border:none;"
-            )
-            label.setAlignment(Qt.AlignCenter)
-            label.setVisible(True)
+            self._show_preview_text(label, f"📄  {os.path.basename(path)}")
             return
-        px = _load_pixmap_robust(path)
-        if px and not px.isNull():
-            label.setPixmap(px)
-            label.setStyleSheet("background:transparent;border:none;")
-            label.setToolTip(path)
-        else:
-            label.setText(f"📄  {os.path.basename(path)}")
-            label.setStyleSheet(
-                f"color:{COLORS['text_secondary']};"
-                "background:transparent;border:none;"
-            )
-            label.setAlignment(Qt.AlignCenter)
+
+        # Previews already in memory or in the thumbnail cache are cheap
+        # enough to show straight away.
+        key = image_cache.key(path, (400, 200), "texture_preview")
+        px  = image_cache.get(key)
+        if px is not None:
+            self._show_preview_pixmap(label, path, px)
+            return
+        cached = _cached_image(path)
+        if cached is not None:
+            self._show_preview_pixmap(label, path, image_cache.put_image(key, cached))
+            return
+
+        self._show_preview_text(label, f"⏳  Loading preview…\n{os.path.basename(path)}")
+        self._previews.request(
+            label, path, 400, 200,
+            lambda image, label=label, path=path, key=key:
+                self._show_preview_image(label, path, image, key),
+        )
+
+    def _show_preview_text(self, label: QLabel, text: str):
+        label.setText(text)
+        label.setStyleSheet(
+            f"color:{COLORS['text_secondary']};"
+            "background:transparent;border:none;"
+        )
+        label.setAlignment(Qt.AlignCenter)
         label.setVisible(True)
 
+    def _show_preview_image(self, label: QLabel, path: str, image: Optional[QImage], key=None):
+        if image is None or image.isNull():
+            self._show_preview_text(label, f"📄  {os.path.basename(path)}")
+            return
+        self._show_preview_pixmap(label, path, image_cache.put_image(key, image))
+
+    def _show_preview_pixmap(self, label: QLabel, path: str, px: QPixmap):
+        label.setPixmap(px)
+        label.setStyleSheet("background:transparent;border:none;")
+        info = _texture_info(path) if _texture_info is not None else None
+        label.setToolTip(f"{path}\n{info.describe()}" if info else path)
+        label.setVisible(True)
+
+    def _clear_preview(self, label: QLabel):
+        self._previews.cancel(label)
+        label.setVisible(False)
+        label.clear()
+
 
     def _toggle_config_data(self):
         print(f"[DEBUG] _toggle_config_data() called")
@@ -1993,8 +2143,7 @@ class GeneratorTab(QWidget):
         self._dds_widget.setVisible(not on)
         self._colorable_widget.setVisible(on)
         if not on:
-            self._color_map_preview.setVisible(False)
-            self._color_map_preview.clear()
+            self._clear_preview(self._color_map_preview)
         self._update_variant_ui()
 
     def _toggle_reflectivity_map(self):
@@ -2033,6 +2182,8 @@ class GeneratorTab(QWidget):
 
     def _populate_material_properties_ui(self, materials: Dict):
         print(f"[DEBUG] _populate_material_properties_ui() called")
+        self._mat_timer.stop()
+        self._mat_pending = []
         while self._mat_props_layout.count():
             item = self._mat_props_layout.takeAt(0)
             if item.widget():
@@ -2051,76 +2202,96 @@ class GeneratorTab(QWidget):
         )
         self._mat_props_layout.addWidget(info)
 
-        for mat_name, mat_info in materials.items():
-            part  = mat_info["part_name"]
-            props = mat_info["properties"]
-
-            sect = QFrame()
-            sect.setStyleSheet(
-                f"QFrame{{background:{COLORS.get('sidebar_bg',COLORS['frame_bg'])};"
-                "border-radius:6px;}}"
-            )
-            sc = QVBoxLayout(sect)
-            sc.setContentsMargins(10, 8, 10, 8)
-            sc.setSpacing(4)
-
-            hl = QLabel(f"📦 {part}")
-            hl.setFont(font(15, "bold"))
-            hl.setStyleSheet(f"color:{COLORS['text']};background:transparent;border:none;")
-            sc.addWidget(hl)
-
-            tl = QLabel(f"({mat_name})")
-            tl.setFont(font(11))
-            tl.setStyleSheet(
-                f"color:{COLORS['text_secondary']};background:transparent;border:none;"
-            )
-            sc.addWidget(tl)
+        self._mat_pending = list(materials.items())
+        self._build_material_slice()
+
+    def _build_material_slice(self):
+        """Build the next MATERIAL_SLICE material sections; reschedule if any remain."""
+        batch = self._mat_pending[:MATERIAL_SLICE]
+        del self._mat_pending[:MATERIAL_SLICE]
+        for mat_name, mat_info in batch:
+            self._add_material_section(mat_name, mat_info)
+        if self._mat_pending:
+            self._mat_timer.start()
+
+    def _finish_material_sections(self):
+        """Build whatever is still pending — before entries are read or filled."""
+        self._mat_timer.stop()
+        batch, self._mat_pending = self._mat_pending, []
+        for mat_name, mat_info in batch:
+            self._add_material_section(mat_name, mat_info)
+
+    def _add_material_section(self, mat_name: str, mat_info: Dict):
+        part  = mat_info["part_name"]
+        props = mat_info["properties"]
+
+        sect = QFrame()
+        sect.setStyleSheet(
+            f"QFrame{{background:{COLORS.get('sidebar_bg',COLORS['frame_bg'])};"
+            "border-radius:6px;}}"
+        )
+        sc = QVBoxLayout(sect)
+        sc.setContentsMargins(10, 8, 10, 8)
+        sc.setSpacing(4)
+
+        hl = QLabel(f"📦 {part}")
+        hl.setFont(font(15, "bold"))
+        hl.setStyleSheet(f"color:{COLORS['text']};background:transparent;border:none;")
+        sc.addWidget(hl)
+
+        tl = QLabel(f"({mat_name})")
+        tl.setFont(font(11))
+        tl.setStyleSheet(
+            f"color:{COLORS['text_secondary']};background:transparent;border:none;"
+        )
+        sc.addWidget(tl)
 
-            self.material_properties_entries[mat_name] = {}
+        self.material_properties_entries[mat_name] = {}
 
-            for stage_key, stage_props in props.items():
-                if len(props) > 1:
-                    sl = QLabel(f"Stage {stage_key.split('_')[1]}")
-                    sl.setFont(font(10, "bold"))
-                    sl.setStyleSheet(
-                        f"color:{COLORS['text_secondary']};background:transparent;border:none;"
-                    )
-                    sc.addWidget(sl)
-
-                for prop_name, prop_value in stage_props.items():
-                    pr = QHBoxLayout()
-                    label_text = (prop_name.replace("Factor", "")
-                                  .replace("clearCoat", "Clear Coat ")
-                                  .replace("metallic", "Metallic")
-                                  .replace("roughness", "Roughness"))
-                    pl = QLabel(f"{label_text}:")
-                    pl.setFont(font(12, "bold"))
-                    pl.setFixedWidth(140)
-                    pl.setStyleSheet(f"color:{COLORS['text']};background:transparent;border:none;")
-                    pr.addWidget(pl)
-
-                    pe = QLineEdit()
-                    pe.setPlaceholderText(t("project.material_value_placeholder"))
-                    pe.setFixedWidth(100)
-                    pe.setFixedHeight(28)
-                    pe.setFont(font(11))
-                    pe.setStyleSheet(self._entry_style())
-                    pe.setText("null" if prop_value is None else str(prop_value))
-                    pr.addWidget(pe)
-                    pr.addStretch()
-
-                    w = QWidget()
-                    w.setStyleSheet("background:transparent;")
-                    w.setLayout(pr)
-                    sc.addWidget(w)
-
-                    entry_key = f"{stage_key}_{prop_name}"
-                    self.material_properties_entries[mat_name][entry_key] = pe
-
-            self._mat_props_layout.addWidget(sect)
+        for stage_key, stage_props in props.items():
+            if len(props) > 1:
+                sl = QLabel(f"Stage {stage_key.split('_')[1]}")
+                sl.setFont(font(10, "bold"))
+                sl.setStyleSheet(
+                    f"color:{COLORS['text_secondary']};background:transparent;border:none;"
+                )
+                sc.addWidget(sl)
+
+            for prop_name, prop_value in stage_props.items():
+                pr = QHBoxLayout()
+                label_text = (prop_name.replace("Factor", "")
+                              .replace("clearCoat", "Clear Coat ")
+                              .replace("metallic", "Metallic")
+                              .replace("roughness", "Roughness"))
+                pl = QLabel(f"{label_text}:")
+                pl.setFont(font(12, "bold"))
+                pl.setFixedWidth(140)
+                pl.setStyleSheet(f"color:{COLORS['text']};background:transparent;border:none;")
+                pr.addWidget(pl)
+
+                pe = QLineEdit()
+                pe.setPlaceholderText(t("project.material_value_placeholder"))
+                pe.setFixedWidth(100)
+                pe.setFixedHeight(28)
+                pe.setFont(font(11))
+                pe.setStyleSheet(self._entry_style())
+                pe.setText("null" if prop_value is None else str(prop_value))
+                pr.addWidget(pe)
+                pr.addStretch()
+
+                w = QWidget()
+                w.setStyleSheet("background:transparent;")
+                w.setLayout(pr)
+                sc.addWidget(w)
+
+                entry_key = f"{stage_key}_{prop_name}"
+                self.material_properties_entries[mat_name][entry_key] = pe
+
+        self._mat_props_layout.addWidget(sect)
 
     def _collect_material_properties(self) -> Dict:
         print(f"[DEBUG] _collect_material_properties() called")
+        self._finish_material_sections()
         result = {}
         for mat_name, entries in self.material_properties_entries.items():
             stages: Dict[str, Dict] = {}
@@ -2148,6 +2319,7 @@ class GeneratorTab(QWidget):
 
     def _load_material_properties_into_ui(self, mat_props: Dict):
         print(f"[DEBUG] _load_material_properties_into_ui() called")
+        self._finish_material_sections()
         for mat_name, stages in mat_props.items():
             if mat_name not in self.material_properties_entries:
                 continue
@@ -2161,7 +2333,7 @@ class GeneratorTab(QWidget):
 
     def _load_material_structure(self, car_id: str, variant_suffix: str = "") -> Dict:
         print(f"[DEBUG] _load_material_structure() called")
-        import re
+        from utils import lenient_json
 
         def _folder_matches_variant(folder_name: str, suffix: str) -> bool:
             """
@@ -2204,9 +2376,7 @@ class GeneratorTab(QWidget):
                     continue
                 fp = os.path.join(sp, fn)
                 try:
-                    with open(fp, encoding="utf-8") as f:
-                        content = re.sub(r",(\s*[}\]])", r"\1", f.read())
-                    data = json.loads(content)
+                    data = lenient_json.load(fp)
                 except Exception:
                     continue
 
@@ -2785,6 +2955,9 @@ class GeneratorTab(QWidget):
         self._rfl_body2_lbl.setText(t("project.variant_body"))
         self.rfl_entry_2.setPlaceholderText(t("common.nofile_selected"))
         self._rfl_browse_2.setText(t("common.browse"))
+        if RoughMetComposerDialog is not None:
+            self._rfl_compose.setText(t("project.compose_reflectivity", default="Compose…"))
+            self._rfl_compose_2.setText(t("project.compose_reflectivity", default="Compose…"))
 
         # variant banner — always re-render in new language when a car is selected,
         # regardless of current visibility (banner may be shown later with stale text)
@@ -0,0 +1,93 @@
+"""
+gui/vehicle_search.py — The vehicle search index shared by the sidebar and the car list.
+
+Each vehicle is searchable by carid, display name, brand (first word of
+the name), body variant suffixes and, for imported mods, the name of the
+archive its template came from.
+
+vehicle_index() keeps the index in step with state.vehicle_ids /
+state.added_vehicles: only vehicles that are new, renamed or touched by a
+catalog change are re-indexed, so calling it on every keystroke is cheap.
+
+    from gui.vehicle_search import vehicle_index
+    visible = vehicle_index().matching(text)
+"""
+import os
+from typing import Dict, List, Set
+
+from gui.state import state
+from utils.search_index import SearchIndex
+
+try:
+    from utils.vehicle_catalog import catalog as _catalog
+except ImportError:
+    _catalog = None  # type: ignore
+
+_index = SearchIndex()
+_names: Dict[str, str] = {}     # carid → name currently in _index
+_dirty: Set[str] = set()        # carids whose variants or source changed
+_all_dirty = False
+
+
+def vehicle_index() -> SearchIndex:
+    global _all_dirty
+    vehicles = {**state.vehicle_ids, **state.added_vehicles}
+    for carid in [c for c in _names if c not in vehicles]:
+        _index.remove(carid)
+        del _names[carid]
+    stale = [c for c, n in vehicles.items()
+             if _all_dirty or c in _dirty or _names.get(c) != n]
+    if stale:
+        custom = _custom_variants()
+        for carid in stale:
+            name = vehicles[carid]
+            _index.add(carid, name, _fields(carid, name, custom.get(carid, ())))
+            _names[carid] = name
+        print(f"[DEBUG] vehicle_search: indexed {len(stale)} vehicle(s), {len(_index)} total")
+    _dirty.clear()
+    _all_dirty = False
+    return _index
+
+
+def invalidate(carid: str = "") -> None:
+    """Re-index carid (every vehicle if empty) on the next vehicle_index() call."""
+    global _all_dirty
+    if carid:
+        _dirty.add(carid)
+    else:
+        _all_dirty = True
+
+
+def _fields(carid: str, name: str, custom_variants) -> List[str]:
+    from gui.components.navigation import _get_vehicle_variants
+    fields = [carid]
+    if " " in name.strip():
+        fields.append(name.split()[0])                          # brand
+    fields.extend(s for s, _ in _get_vehicle_variants(carid) if s)
+    fields.extend(custom_variants)
+    source = _catalog.get_source(carid) if _catalog is not None else None
+    if source and source.get("archive"):
+        fields.append(os.path.splitext(os.path.basename(source["archive"]))[0])
+    return fields
+
+
+def _custom_variants() -> Dict[str, List[str]]:
+    if _catalog is None:
+        return {}
+    out: Dict[str, List[str]] = {}
+    for entry in _catalog.variants().values():
+        out.setdefault(entry.get("carid", ""), []).append(entry.get("suffix", ""))
+    return out
+
+
+def _on_catalog_change(change) -> None:
+    if change is None or change.reloaded:
+        invalidate()
+        return
+    for carid in list(change.added_vehicles) + list(change.removed_vehicles):
+        invalidate(carid)
+    for carid, _suffix in change.added_variants + change.removed_variants:
+        invalidate(carid)
+
+
+state.catalog_events.changed.connect(_on_catalog_change)
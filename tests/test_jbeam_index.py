@@ -0,0 +1,41 @@
+"""
+tests/test_jbeam_index.py — core.jbeam_index skin detection.
+
+Run from the repository root:  python -m pytest tests
+"""
+import glob
+import os
+
+import pytest
+
+from core.jbeam_index import index_jbeam, index_jbeam_text
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SHIPPED = sorted(glob.glob(os.path.join(_APP_DIR, "vehicles", "*", "*", "*.jbeam")))
+
+
+def test_shipped_templates_found():
+    assert _SHIPPED, "no shipped vehicles/*/*/*.jbeam templates found"
+
+
+@pytest.mark.parametrize(
+    "path", _SHIPPED, ids=[os.path.relpath(p, _APP_DIR) for p in _SHIPPED]
+)
+def test_shipped_template_is_skin(path):
+    index = index_jbeam(path)
+    assert index is not None
+    assert index.is_skin
+    assert index.skin_parts
+
+
+@pytest.mark.parametrize("part, expected", [
+    ('"slotType": "paint_design"', True),
+    ('"slotType": ["skin_miramar_sedan", "skin_miramar_coupe"]', True),
+    ('"slotType": "skin_schoolbus"', True),
+    ('"slotType": "body_slot", "skinType": "paint_design"', True),
+    ('"slotType": "body_slot", "globalSkin": "police"', True),
+    ('"slotType": "pickup_body", "slots": [["type"], ["skin_pickup"]]', False),
+])
+def test_skin_markers(part, expected):
+    text = '{"demo_part": {"information": {"name": "Demo"}, %s}}' % part
+    assert index_jbeam_text(text).is_skin is expected
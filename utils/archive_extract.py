@@ -0,0 +1,176 @@
+"""
+utils/archive_extract.py — Bulk, streaming extraction of archive members.
+
+extract(jobs) writes a batch of files, each either one member of a ZIP or
+a plain file copy, with a few worker threads:
+
+  * member offsets come from utils.archive_index, so no archive's central
+    directory is parsed more than once, however many members are taken
+    from it;
+  * stored and deflated members are read straight from their local header
+    offset and streamed through zlib in CHUNK-sized pieces, with the CRC
+    checked at the end; memory per worker stays at a couple of chunks no
+    matter how large the texture is (other compression methods go
+    through zipfile);
+  * every file is written to a temporary name and renamed into place, so
+    a failed or cancelled job never leaves a truncated texture behind.
+
+    jobs = [ExtractJob(zip_path, "vehicles/pickup/pickup_uv.dds", dest), ...]
+    result = extract(jobs, progress=lambda done, total: ...)
+"""
+import os
+import shutil
+import struct
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from utils.archive_index import ArchiveMember, archive_index
+
+CHUNK   = 1024 * 1024
+WORKERS = 4
+
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")      # 30 bytes
+_LOCAL_MAGIC  = b"PK\x03\x04"
+
+
+class ExtractCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ExtractJob:
+    source: str              # zip path, or the file to copy when member is ""
+    member: str              # member name inside source
+    dest:   str
+
+
+@dataclass
+class ExtractResult:
+    ok:     int = 0
+    total:  int = 0
+    bytes:  int = 0
+    failed: List[Tuple[ExtractJob, str]] = field(default_factory=list)
+    cancelled: bool = False
+
+
+def extract(
+    jobs: List[ExtractJob],
+    workers: int = WORKERS,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> ExtractResult:
+    """
+    Run every job; progress(done, total) is called on the calling thread
+    after each one.  Stops starting new jobs once cancelled() is true.
+    """
+    result = ExtractResult(total=len(jobs))
+    done   = 0
+    is_cancelled = cancelled or (lambda: False)
+
+    def _run(job: ExtractJob) -> int:
+        if is_cancelled():
+            raise ExtractCancelled()
+        return _extract_one(job, is_cancelled)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_run, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result.bytes += future.result()
+                result.ok += 1
+            except ExtractCancelled:
+                result.cancelled = True
+            except Exception as e:
+                print(f"[DEBUG] archive_extract: {job.member or job.source} failed: {e}")
+                result.failed.append((job, str(e)))
+            done += 1
+            if progress is not None:
+                progress(done, len(jobs))
+
+    print(f"[DEBUG] archive_extract: {result.ok}/{result.total} file(s), "
+          f"{result.bytes / (1024 * 1024):.1f} MB")
+    return result
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# One job
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _extract_one(job: ExtractJob, cancelled: Callable[[], bool]) -> int:
+    folder = os.path.dirname(job.dest)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = f"{job.dest}.{threading.get_ident()}.part"
+    try:
+        with open(tmp, "wb") as dst:
+            if not job.member:
+                with open(job.source, "rb") as src:
+                    shutil.copyfileobj(src, dst, CHUNK)
+            else:
+                info = archive_index.members(job.source).get(job.member)
+                if info is None:
+                    raise KeyError(f"{job.member} not in {os.path.basename(job.source)}")
+                if info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                    _stream_member(job.source, info, dst, cancelled)
+                else:
+                    with zipfile.ZipFile(job.source) as z, z.open(job.member) as src:
+                        shutil.copyfileobj(src, dst, CHUNK)
+        os.replace(tmp, job.dest)
+        if not job.member:
+            shutil.copystat(job.source, job.dest)
+        return os.path.getsize(job.dest)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _stream_member(path: str, info: ArchiveMember, dst, cancelled: Callable[[], bool]) -> None:
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        header = f.read(_LOCAL_HEADER.size)
+        if len(header) != _LOCAL_HEADER.size or header[:4] != _LOCAL_MAGIC:
+            raise zipfile.BadZipFile(f"bad local header for {info.name}")
+        fields = _LOCAL_HEADER.unpack(header)
+        name_len, extra_len = fields[-2], fields[-1]
+        f.seek(name_len + extra_len, os.SEEK_CUR)
+
+        inflater  = zlib.decompressobj(-15) if info.compress_type == zipfile.ZIP_DEFLATED else None
+        remaining = info.compress_size
+        crc = written = 0
+        while remaining > 0:
+            if cancelled():
+                raise ExtractCancelled()
+            block = f.read(min(CHUNK, remaining))
+            if not block:
+                raise zipfile.BadZipFile(f"{info.name} is truncated")
+            remaining -= len(block)
+            if inflater is not None:
+                # max_length keeps a highly compressed block from expanding all at once
+                out = inflater.decompress(block, CHUNK)
+                while True:
+                    crc = zlib.crc32(out, crc)
+                    written += len(out)
+                    dst.write(out)
+                    if not inflater.unconsumed_tail and len(out) < CHUNK:
+                        break
+                    out = inflater.decompress(inflater.unconsumed_tail, CHUNK)
+            else:
+                crc = zlib.crc32(block, crc)
+                written += len(block)
+                dst.write(block)
+        if inflater is not None:
+            tail = inflater.flush()
+            crc = zlib.crc32(tail, crc)
+            written += len(tail)
+            dst.write(tail)
+
+    if written != info.file_size or crc != info.crc:
+        raise zipfile.BadZipFile(f"{info.name} failed its CRC check")
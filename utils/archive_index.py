@@ -0,0 +1,207 @@
+"""
+utils/archive_index.py — Persistent member index of ZIP archives.
+
+BeamNG ships every vehicle as content/vehicles/<carid>.zip, plus a shared
+common.zip, and some of them are several GB.  Listing one means reading
+and parsing its whole central directory, which for common.zip is tens of
+thousands of records.
+
+members(path) does that once per version of an archive.  The member table
+(name → header offset, sizes, compression, CRC) is kept in a small LRU in
+memory and as JSON under data/cache/archives.  The file name carries the
+archive's size and mtime, so an unchanged zip is a single exists() away
+from its index and a changed one is simply re-read.  warm(paths) indexes a
+list of archives on a background thread so the first lookup is cheap too.
+
+    from utils.archive_index import archive_index
+    for name in archive_index.under(zip_path, "vehicles/pickup/"): ...
+    info = archive_index.members(zip_path)[name]     # ArchiveMember
+"""
+import bisect
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_HERE        = os.path.dirname(os.path.abspath(__file__))
+ARCHIVES_DIR = os.path.join(os.path.dirname(_HERE), "data", "cache", "archives")
+
+MEMORY_LIMIT = 8          # archives kept parsed in memory
+_VERSION     = 1
+
+
+@dataclass(frozen=True)
+class ArchiveMember:
+    name:          str
+    header_offset: int       # offset of the local file header
+    compress_size: int
+    file_size:     int
+    compress_type: int       # zipfile.ZIP_STORED, ZIP_DEFLATED, ...
+    crc:           int
+
+
+class _Listing:
+    """One archive's members, plus a sorted name list for prefix lookups."""
+
+    def __init__(self, members: Dict[str, ArchiveMember]):
+        self.members = members
+        self.names   = sorted(members)
+
+    def under(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.names, prefix)
+        out = []
+        for name in self.names[start:]:
+            if not name.startswith(prefix):
+                break
+            out.append(name)
+        return out
+
+
+class ArchiveIndex:
+
+    def __init__(self, folder: str = ARCHIVES_DIR, memory_limit: int = MEMORY_LIMIT):
+        self._folder = folder
+        self._limit  = memory_limit
+        self._lock   = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[Tuple[int, int], _Listing]]" = OrderedDict()
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    def members(self, path: str) -> Dict[str, ArchiveMember]:
+        """
+        name → ArchiveMember for every file in the archive.  Raises
+        OSError if path can't be read and zipfile.BadZipFile if it isn't
+        a zip, like zipfile.ZipFile would.
+        """
+        return self._listing(path).members
+
+    def names(self, path: str) -> List[str]:
+        """Member names, sorted."""
+        return self._listing(path).names
+
+    def under(self, path: str, prefix: str) -> List[str]:
+        """Sorted member names starting with prefix."""
+        return self._listing(path).under(prefix)
+
+    def forget(self, path: str) -> None:
+        with self._lock:
+            self._memory.pop(_norm(path), None)
+
+    # ── Background indexing ──────────────────────────────────────────────────
+
+    def warm(self, paths: Iterable[str]) -> threading.Thread:
+        """Make sure every archive in paths has a current index on disk, in the background."""
+        paths = list(paths)
+
+        def _worker():
+            built = 0
+            for path in paths:
+                try:
+                    finger = _fingerprint(path)
+                    if finger is None or os.path.exists(self._file(path, finger)):
+                        continue
+                    self._store(path, finger, _read_members(path))
+                    built += 1
+                except Exception as e:
+                    print(f"[DEBUG] archive_index: could not index {os.path.basename(path)}: {e}")
+            if built:
+                print(f"[DEBUG] archive_index: indexed {built} of {len(paths)} archive(s)")
+
+        thread = threading.Thread(target=_worker, daemon=True, name="archive-index")
+        thread.start()
+        return thread
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _listing(self, path: str) -> _Listing:
+        finger = _fingerprint(path)
+        if finger is None:
+            raise FileNotFoundError(path)
+        norm = _norm(path)
+        with self._lock:
+            hit = self._memory.get(norm)
+            if hit is not None and hit[0] == finger:
+                self._memory.move_to_end(norm)
+                return hit[1]
+
+        members = self._load(path, finger)
+        if members is None:
+            members = _read_members(path)
+            self._store(path, finger, members)
+        listing = _Listing(members)
+        with self._lock:
+            self._memory[norm] = (finger, listing)
+            self._memory.move_to_end(norm)
+            while len(self._memory) > self._limit:
+                self._memory.popitem(last=False)
+        return listing
+
+    def _stem(self, path: str) -> str:
+        return hashlib.sha1(_norm(path).encode("utf-8")).hexdigest()[:20]
+
+    def _file(self, path: str, finger: Tuple[int, int]) -> str:
+        return os.path.join(self._folder, f"{self._stem(path)}-{finger[0]}-{finger[1]}.json")
+
+    def _load(self, path: str, finger: Tuple[int, int]) -> Optional[Dict[str, ArchiveMember]]:
+        try:
+            with open(self._file(path, finger), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _VERSION:
+                return None
+            return {row[0]: ArchiveMember(*row) for row in data["members"]}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[DEBUG] archive_index: ignoring unreadable index for {os.path.basename(path)}: {e}")
+            return None
+
+    def _store(self, path: str, finger: Tuple[int, int], members: Dict[str, ArchiveMember]) -> None:
+        dest = self._file(path, finger)
+        try:
+            os.makedirs(self._folder, exist_ok=True)
+            rows = [[m.name, m.header_offset, m.compress_size, m.file_size, m.compress_type, m.crc]
+                    for m in members.values()]
+            tmp = f"{dest}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": _VERSION, "path": path, "members": rows}, f,
+                          separators=(",", ":"))
+            os.replace(tmp, dest)
+            # drop indexes of older versions of the same archive
+            stem, name = self._stem(path) + "-", os.path.basename(dest)
+            for entry in os.listdir(self._folder):
+                if entry.startswith(stem) and entry != name:
+                    try:
+                        os.remove(os.path.join(self._folder, entry))
+                    except OSError:
+                        pass
+        except OSError as e:
+            print(f"[DEBUG] archive_index: could not save index for {os.path.basename(path)}: {e}")
+
+
+def _norm(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _fingerprint(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _read_members(path: str) -> Dict[str, ArchiveMember]:
+    """Parse the central directory — zipfile reads nothing else on open."""
+    with zipfile.ZipFile(path, "r") as z:
+        return {
+            i.filename: ArchiveMember(i.filename, i.header_offset, i.compress_size,
+                                      i.file_size, i.compress_type, i.CRC)
+            for i in z.infolist() if not i.is_dir()
+        }
+
+
+archive_index = ArchiveIndex()
@@ -0,0 +1,474 @@
+"""
+utils/dds_reader.py — Mip-aware DDS reader for previews.
+
+Skin textures are often 4k–16k BC7, but a preview only needs a few hundred
+pixels.  decode_preview() parses the DDS header (legacy and DX10), maps
+the file, seeks straight to the smallest mip level that still covers the
+requested size and decodes only that level, so preview time no longer
+depends on the size of the top-level texture.
+
+Supported formats: BC1, BC2, BC3, BC4, BC5, BC7 (UNORM and sRGB — the block
+data is identical, the preview is shown as stored) and 32-bit RGBA/BGRA.
+Block decoding is vectorised with NumPy; without NumPy decode_preview()
+returns None and callers fall back to their other loaders.
+
+    from utils.dds_reader import decode_preview
+    hit = decode_preview(path, 400, 200)    # (width, height, RGBA bytes) or None
+"""
+import mmap
+import struct
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+    _NP_OK = True
+except ImportError:
+    np = None
+    _NP_OK = False
+
+_MAGIC = b"DDS "
+
+# DDS_PIXELFORMAT.dwFlags
+_DDPF_ALPHAPIXELS = 0x1
+_DDPF_FOURCC      = 0x4
+_DDPF_RGB         = 0x40
+
+_FOURCC_FORMATS = {
+    b"DXT1": "BC1", b"DXT2": "BC2", b"DXT3": "BC2", b"DXT4": "BC3", b"DXT5": "BC3",
+    b"ATI1": "BC4", b"BC4U": "BC4", b"ATI2": "BC5", b"BC5U": "BC5",
+}
+
+_DXGI_FORMATS = {
+    28: "RGBA8", 29: "RGBA8",
+    71: "BC1",   72: "BC1",
+    74: "BC2",   75: "BC2",
+    77: "BC3",   78: "BC3",
+    80: "BC4",
+    83: "BC5",
+    87: "BGRA8", 88: "BGRX8", 91: "BGRA8", 93: "BGRX8",
+    98: "BC7",   99: "BC7",
+}
+
+_DXGI_SRGB = {29, 72, 75, 78, 91, 93, 99}
+
+_BLOCK_BYTES = {"BC1": 8, "BC4": 8, "BC2": 16, "BC3": 16, "BC5": 16, "BC7": 16}
+
+
+@dataclass
+class DdsInfo:
+    width:       int
+    height:      int
+    mip_count:   int
+    format:      str      # one of the keys above, or "" if unsupported
+    data_offset: int
+    raw_format:  str      # fourcc / DXGI number, for messages
+    srgb:        bool = False
+
+    @property
+    def supported(self) -> bool:
+        return bool(self.format)
+
+    def level_size(self, level: int) -> Tuple[int, int]:
+        return max(1, self.width >> level), max(1, self.height >> level)
+
+    def level_bytes(self, level: int) -> int:
+        w, h = self.level_size(level)
+        block = _BLOCK_BYTES.get(self.format)
+        if block:
+            return ((w + 3) // 4) * ((h + 3) // 4) * block
+        return w * h * 4
+
+    def level_offset(self, level: int) -> int:
+        return self.data_offset + sum(self.level_bytes(i) for i in range(level))
+
+
+def parse_header(head: bytes) -> DdsInfo:
+    """DdsInfo from the first 148 bytes of a DDS file; raises ValueError."""
+    if len(head) < 128 or head[:4] != _MAGIC:
+        raise ValueError("not a DDS file")
+    height, width = struct.unpack_from("<II", head, 12)
+    mip_count     = struct.unpack_from("<I", head, 28)[0] or 1
+    pf_flags      = struct.unpack_from("<I", head, 80)[0]
+    fourcc        = head[84:88]
+    if width == 0 or height == 0:
+        raise ValueError("DDS has zero size")
+
+    fmt, raw, offset, srgb = "", "", 128, False
+    if pf_flags & _DDPF_FOURCC and fourcc == b"DX10":
+        if len(head) < 148:
+            raise ValueError("truncated DX10 header")
+        dxgi   = struct.unpack_from("<I", head, 128)[0]
+        fmt    = _DXGI_FORMATS.get(dxgi, "")
+        raw    = f"DXGI {dxgi}"
+        offset = 148
+        srgb   = dxgi in _DXGI_SRGB
+    elif pf_flags & _DDPF_FOURCC:
+        fmt = _FOURCC_FORMATS.get(fourcc, "")
+        raw = fourcc.decode("latin-1", "replace")
+    elif pf_flags & _DDPF_RGB:
+        bits, rmask, gmask, bmask, amask = struct.unpack_from("<5I", head, 88)
+        raw = f"RGB{bits}"
+        if bits == 32:
+            has_alpha = bool(pf_flags & _DDPF_ALPHAPIXELS and amask)
+            if (rmask, gmask, bmask) == (0xFF, 0xFF00, 0xFF0000):
+                fmt = "RGBA8" if has_alpha else "RGBX8"
+            elif (rmask, gmask, bmask) == (0xFF0000, 0xFF00, 0xFF):
+                fmt = "BGRA8" if has_alpha else "BGRX8"
+    return DdsInfo(width, height, mip_count, fmt, offset, raw, srgb)
+
+
+def pick_level(info: DdsInfo, max_w: int, max_h: int) -> int:
+    """
+    Smallest mip level that still fills max_w × max_h when scaled to fit,
+    i.e. the deepest level where the preview is never upscaled.
+    """
+    level = 0
+    for i in range(1, info.mip_count):
+        w, h = info.level_size(i)
+        if w < max_w and h < max_h:
+            break
+        level = i
+    return level
+
+
+def read_info(path: str) -> DdsInfo:
+    with open(path, "rb") as f:
+        return parse_header(f.read(148))
+
+
+def decode_preview(path: str, max_w: int, max_h: int) -> Optional[Tuple[int, int, bytes]]:
+    """
+    Decode the mip level of path best suited to a max_w × max_h preview.
+    Returns (width, height, RGBA8888 bytes) or None if the file can't be
+    handled here.
+    """
+    if not _NP_OK:
+        return None
+    try:
+        with open(path, "rb") as f:
+            info = parse_header(f.read(148))
+            if not info.supported:
+                print(f"[DEBUG] dds_reader: unsupported format {info.raw_format}: {path}")
+                return None
+            level = pick_level(info, max_w, max_h)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # A truncated mip chain: use the deepest level that is complete.
+                while level > 0 and info.level_offset(level) + info.level_bytes(level) > len(mm):
+                    level -= 1
+                start = info.level_offset(level)
+                end   = start + info.level_bytes(level)
+                if end > len(mm):
+                    print(f"[DEBUG] dds_reader: truncated file: {path}")
+                    return None
+                data = mm[start:end]
+        w, h = info.level_size(level)
+        rgba = decode_level(info.format, data, w, h)
+        print(f"[DEBUG] dds_reader: {info.format} {info.width}x{info.height} → mip {level} ({w}x{h})")
+        return w, h, rgba.tobytes()
+    except (OSError, ValueError) as e:
+        print(f"[DEBUG] dds_reader: {path}: {e}")
+        return None
+
+
+def decode_level(fmt: str, data: bytes, width: int, height: int):
+    """Decode one mip level to an (height, width, 4) uint8 array."""
+    if fmt in ("RGBA8", "RGBX8", "BGRA8", "BGRX8"):
+        px = np.frombuffer(data, dtype=np.uint8, count=width * height * 4).reshape(height, width, 4)
+        if fmt.startswith("BGR"):
+            px = px[:, :, [2, 1, 0, 3]]
+        if fmt.endswith("X8"):
+            px = px.copy()
+            px[:, :, 3] = 255
+        return np.ascontiguousarray(px)
+
+    bw, bh = (width + 3) // 4, (height + 3) // 4
+    blocks = np.frombuffer(data, dtype=np.uint8).reshape(bw * bh, _BLOCK_BYTES[fmt])
+    texels = _BLOCK_DECODERS[fmt](blocks)                   # (n, 16, 4)
+    img = texels.reshape(bh, bw, 4, 4, 4).transpose(0, 2, 1, 3, 4).reshape(bh * 4, bw * 4, 4)
+    return np.ascontiguousarray(img[:height, :width])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BC1–BC5
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _le(blocks, start: int, count: int):
+    """Little-endian unsigned integers from byte columns start..start+count."""
+    out = np.zeros(len(blocks), dtype=np.uint64)
+    for i in range(count):
+        out |= blocks[:, start + i].astype(np.uint64) << np.uint64(8 * i)
+    return out
+
+
+def _unpack_565(c):
+    r = (c >> 11) & 31
+    g = (c >> 5) & 63
+    b = c & 31
+    return np.stack([(r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)], axis=-1)
+
+
+def _decode_color(blocks, four_color_only: bool):
+    """Colour half of BC1/BC2/BC3 (8 bytes per block) → RGBA (n, 16, 4)."""
+    c0 = _le(blocks, 0, 2).astype(np.int32)
+    c1 = _le(blocks, 2, 2).astype(np.int32)
+    e0, e1 = _unpack_565(c0), _unpack_565(c1)               # (n, 3)
+
+    four = np.ones(len(blocks), dtype=bool) if four_color_only else c0 > c1
+    f = four[:, None]
+    pal = np.empty((len(blocks), 4, 4), dtype=np.int32)
+    pal[:, 0, :3] = e0
+    pal[:, 1, :3] = e1
+    pal[:, 2, :3] = np.where(f, (2 * e0 + e1) // 3, (e0 + e1) // 2)
+    pal[:, 3, :3] = np.where(f, (e0 + 2 * e1) // 3, 0)
+    pal[:, :, 3]  = 255
+    pal[:, 3, 3]  = np.where(four, 255, 0)
+
+    bits = _le(blocks, 4, 4)
+    idx  = ((bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(2))) & np.uint64(3)).astype(np.intp)
+    return np.take_along_axis(pal, idx[:, :, None], axis=1).astype(np.uint8)
+
+
+def _decode_alpha(blocks):
+    """BC4-style interpolated channel (8 bytes per block) → (n, 16)."""
+    a0 = blocks[:, 0].astype(np.int32)[:, None]
+    a1 = blocks[:, 1].astype(np.int32)[:, None]
+    i  = np.arange(1, 7, dtype=np.int32)[None, :]
+    eight = ((7 - i) * a0 + i * a1) // 7
+    six   = ((5 - i[:, :4]) * a0 + i[:, :4] * a1) // 5
+    six   = np.concatenate([six, np.zeros_like(a0), np.full_like(a0, 255)], axis=1)
+    pal   = np.concatenate([a0, a1, np.where(a0 > a1, eight, six)], axis=1)
+
+    bits = _le(blocks, 2, 6)
+    idx  = ((bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(3))) & np.uint64(7)).astype(np.intp)
+    return np.take_along_axis(pal, idx, axis=1).astype(np.uint8)
+
+
+def _decode_bc1(blocks):
+    return _decode_color(blocks, four_color_only=False)
+
+
+def _decode_bc2(blocks):
+    out = _decode_color(blocks[:, 8:], four_color_only=True)
+    bits = _le(blocks, 0, 8)
+    a = ((bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(4))) & np.uint64(15)).astype(np.uint8)
+    out[:, :, 3] = a * 17
+    return out
+
+
+def _decode_bc3(blocks):
+    out = _decode_color(blocks[:, 8:], four_color_only=True)
+    out[:, :, 3] = _decode_alpha(blocks)
+    return out
+
+
+def _decode_bc4(blocks):
+    r = _decode_alpha(blocks)
+    return np.stack([r, r, r, np.full_like(r, 255)], axis=-1)
+
+
+def _decode_bc5(blocks):
+    r = _decode_alpha(blocks[:, :8])
+    g = _decode_alpha(blocks[:, 8:])
+    return np.stack([r, g, np.zeros_like(r), np.full_like(r, 255)], axis=-1)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BC7
+# ─────────────────────────────────────────────────────────────────────────────
+
+# mode: (subsets, partition bits, rotation bits, index-selection bits,
+#        colour bits, alpha bits, endpoint p-bits, shared p-bits,
+#        index bits, secondary index bits)
+_BC7_MODES = (
+    (3, 4, 0, 0, 4, 0, 1, 0, 3, 0),
+    (2, 6, 0, 0, 6, 0, 0, 1, 3, 0),
+    (3, 6, 0, 0, 5, 0, 0, 0, 2, 0),
+    (2, 6, 0, 0, 7, 0, 1, 0, 2, 0),
+    (1, 0, 2, 1, 5, 6, 0, 0, 2, 3),
+    (1, 0, 2, 0, 7, 8, 0, 0, 2, 2),
+    (1, 0, 0, 0, 7, 7, 1, 0, 4, 0),
+    (2, 6, 0, 0, 5, 5, 1, 0, 2, 0),
+)
+
+# Subset of each texel, 1 bit per texel for 2 subsets, 2 bits for 3.
+_BC7_P2 = (
+    0xCCCC, 0x8888, 0xEEEE, 0xECC8, 0xC880, 0xFEEC, 0xFEC8, 0xEC80,
+    0xC800, 0xFFEC, 0xFE80, 0xE800, 0xFFE8, 0xFF00, 0xFFF0, 0xF000,
+    0xF710, 0x008E, 0x7100, 0x08CE, 0x008C, 0x7310, 0x3100, 0x8CCE,
+    0x088C, 0x3110, 0x6666, 0x366C, 0x17E8, 0x0FF0, 0x718E, 0x399C,
+    0xAAAA, 0xF0F0, 0x5A5A, 0x33CC, 0x3C3C, 0x55AA, 0x9696, 0xA55A,
+    0x73CE, 0x13C8, 0x324C, 0x3BDC, 0x6996, 0xC33C, 0x9966, 0x0660,
+    0x0272, 0x04E4, 0x4E40, 0x2720, 0xC936, 0x936C, 0x39C6, 0x639C,
+    0x9336, 0x9CC6, 0x817E, 0xE718, 0xCCF0, 0x0FCC, 0x7744, 0xEE22,
+)
+_BC7_P3 = (
+    0xAA685050, 0x6A5A5040, 0x5A5A4200, 0x5450A0A8, 0xA5A50000, 0xA0A05050, 0x5555A0A0, 0x5A5A5050,
+    0xAA550000, 0xAA555500, 0xAAAA5500, 0x90909090, 0x94949494, 0xA4A4A4A4, 0xA9A59450, 0x2A0A4250,
+    0xA5945040, 0x0A425054, 0xA5A5A500, 0x55A0A0A0, 0xA8A85454, 0x6A6A4040, 0xA4A45000, 0x1A1A0500,
+    0x0050A4A4, 0xAAA59090, 0x14696914, 0x69691400, 0xA08585A0, 0xAA821414, 0x50A4A450, 0x6A5A0200,
+    0xA9A58000, 0x5090A0A8, 0xA8A09050, 0x24242424, 0x00AA5500, 0x24924924, 0x24499224, 0x50A50A50,
+    0x500AA550, 0xAAAA4444, 0x66660000, 0xA5A0A5A0, 0x50A050A0, 0x69286928, 0x44AAAA44, 0x66666600,
+    0xAA444444, 0x54A854A8, 0x95809580, 0x96969600, 0xA85454A8, 0x80959580, 0xAA141414, 0x96960000,
+    0xAAAA1414, 0xA05050A0, 0xA0A5A5A0, 0x96000000, 0x40804080, 0xA9A8A9A8, 0xAAAAAA44, 0x2A4A5254,
+)
+
+# Texel whose index is stored with one bit less, for subset 1 (and 2).
+_BC7_ANCHOR2 = (
+    15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+    15,  2,  8,  2,  2,  8,  8, 15,  2,  8,  2,  2,  8,  8,  2,  2,
+    15, 15,  6,  8,  2,  8, 15, 15,  2,  8,  2,  2,  2, 15, 15,  6,
+     6,  2,  6,  8, 15, 15,  2,  2, 15, 15, 15, 15, 15,  2,  2, 15,
+)
+_BC7_ANCHOR3_1 = (
+     3,  3, 15, 15,  8,  3, 15, 15,  8,  8,  6,  6,  6,  5,  3,  3,
+     3,  3,  8, 15,  3,  3,  6, 10,  5,  8,  8,  6,  8,  5, 15, 15,
+     8, 15,  3,  5,  6, 10,  8, 15, 15,  3, 15,  5, 15, 15, 15, 15,
+     3, 15,  5,  5,  5,  8,  5, 10,  5, 10,  8, 13, 15, 12,  3,  3,
+)
+_BC7_ANCHOR3_2 = (
+    15,  8,  8,  3, 15, 15,  3,  8, 15, 15, 15, 15, 15, 15, 15,  8,
+    15,  8, 15,  3, 15,  8, 15,  8,  3, 15,  6, 10, 15, 15, 10,  8,
+    15,  3, 15, 10, 10,  8,  9, 10,  6, 15,  8, 15,  3,  6,  6,  8,
+    15,  3, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,  3, 15, 15,  8,
+)
+
+_BC7_WEIGHTS = {
+    2: (0, 21, 43, 64),
+    3: (0, 9, 18, 27, 37, 46, 55, 64),
+    4: (0, 4, 9, 13, 17, 21, 26, 30, 34, 38, 43, 47, 51, 55, 60, 64),
+}
+
+_bc7_tables = None
+
+
+def _bc7_lookup():
+    """Partition / anchor tables as arrays, built on first use."""
+    global _bc7_tables
+    if _bc7_tables is None:
+        shifts = np.arange(16, dtype=np.int64)
+        p2 = (np.array(_BC7_P2, dtype=np.int64)[:, None] >> shifts) & 1
+        p3 = (np.array(_BC7_P3, dtype=np.int64)[:, None] >> (shifts * 2)) & 3
+        anchors2 = np.zeros((64, 16), dtype=bool)
+        anchors2[:, 0] = True
+        anchors2[np.arange(64), _BC7_ANCHOR2] = True
+        anchors3 = np.zeros((64, 16), dtype=bool)
+        anchors3[:, 0] = True
+        anchors3[np.arange(64), _BC7_ANCHOR3_1] = True
+        anchors3[np.arange(64), _BC7_ANCHOR3_2] = True
+        weights = {n: np.array(w, dtype=np.int32) for n, w in _BC7_WEIGHTS.items()}
+        _bc7_tables = {
+            2: (p2.astype(np.intp), anchors2),
+            3: (p3.astype(np.intp), anchors3),
+            "weights": weights,
+        }
+    return _bc7_tables
+
+
+class _BitReader:
+    """Reads the same field from every block of a (n, 128) bit matrix."""
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.pos  = 0
+
+    def take(self, count: int, fields: int = 1):
+        """(n, fields) array of count-bit little-endian fields."""
+        if count == 0:
+            return np.zeros((len(self.bits), fields), dtype=np.int32)
+        chunk = self.bits[:, self.pos:self.pos + count * fields].reshape(-1, fields, count)
+        self.pos += count * fields
+        return (chunk.astype(np.int32) << np.arange(count, dtype=np.int32)).sum(axis=2)
+
+    def take_indices(self, count: int, anchors):
+        """Per-texel indices, anchor texels (n, 16 bool) having one bit less."""
+        widths = count - anchors.astype(np.int32)
+        starts = self.pos + np.cumsum(widths, axis=1) - widths
+        k      = np.arange(count, dtype=np.int32)
+        where  = np.minimum(starts[:, :, None] + k, 127)
+        picked = self.bits[np.arange(len(self.bits))[:, None, None], where]
+        picked = picked * (k < widths[:, :, None])
+        self.pos += 16 * count - int(anchors[0].sum())
+        return (picked.astype(np.int32) << k).sum(axis=2)
+
+
+def _unquantize(v, prec: int):
+    v = v << (8 - prec)
+    return v | (v >> prec)
+
+
+def _decode_bc7_mode(bits, mode: int):
+    ns, pb, rb, isb, cb, ab, epb, spb, ib, ib2 = _BC7_MODES[mode]
+    tables = _bc7_lookup()
+    n  = len(bits)
+    rd = _BitReader(bits)
+    rd.pos = mode + 1
+
+    part = rd.take(pb)[:, 0]
+    rot  = rd.take(rb)[:, 0]
+    sel  = rd.take(isb)[:, 0]
+
+    ends = 2 * ns
+    ep = np.empty((n, ends, 4), dtype=np.int32)
+    for ch in range(3):
+        ep[:, :, ch] = rd.take(cb, ends)
+    if ab:
+        ep[:, :, 3] = rd.take(ab, ends)
+
+    cprec, aprec = cb, ab
+    if epb or spb:
+        p = rd.take(1, ends) if epb else np.repeat(rd.take(1, ns), 2, axis=1)
+        ep[:, :, :3] = (ep[:, :, :3] << 1) | p[:, :, None]
+        if ab:
+            ep[:, :, 3] = (ep[:, :, 3] << 1) | p
+        cprec, aprec = cb + 1, ab + 1
+    ep[:, :, :3] = _unquantize(ep[:, :, :3], cprec)
+    ep[:, :, 3]  = _unquantize(ep[:, :, 3], aprec) if ab else 255
+
+    if ns == 1:
+        subset  = np.zeros((n, 16), dtype=np.intp)
+        anchors = np.zeros((n, 16), dtype=bool)
+        anchors[:, 0] = True
+    else:
+        table, anchor_table = tables[ns]
+        subset, anchors = table[part], anchor_table[part]
+
+    weights = tables["weights"]
+    w_color = weights[ib][rd.take_indices(ib, anchors)]
+    w_alpha = w_color
+    if ib2:
+        first = np.zeros((n, 16), dtype=bool)
+        first[:, 0] = True
+        w_second = weights[ib2][rd.take_indices(ib2, first)]
+        swap     = (sel == 1)[:, None]
+        w_color, w_alpha = np.where(swap, w_second, w_color), np.where(swap, w_color, w_second)
+
+    rows = np.arange(n)[:, None]
+    e0 = ep[rows, 2 * subset]                               # (n, 16, 4)
+    e1 = ep[rows, 2 * subset + 1]
+    w  = np.concatenate([np.repeat(w_color[:, :, None], 3, axis=2), w_alpha[:, :, None]], axis=2)
+    out = ((64 - w) * e0 + w * e1 + 32) >> 6
+
+    for r in (1, 2, 3):
+        hit = rot == r
+        if hit.any():
+            out[hit, :, r - 1], out[hit, :, 3] = out[hit, :, 3], out[hit, :, r - 1].copy()
+    return out.astype(np.uint8)
+
+
+def _decode_bc7(blocks):
+    bits = np.unpackbits(blocks, axis=1, bitorder="little")
+    head = bits[:, :8]
+    mode = np.where(head.any(axis=1), head.argmax(axis=1), 8)
+    out  = np.zeros((len(blocks), 16, 4), dtype=np.uint8)   # reserved mode 8: transparent black
+    for m in range(8):
+        hit = mode == m
+        if hit.any():
+            out[hit] = _decode_bc7_mode(bits[hit], m)
+    return out
+
+
+_BLOCK_DECODERS = {
+    "BC1": _decode_bc1, "BC2": _decode_bc2, "BC3": _decode_bc3,
+    "BC4": _decode_bc4, "BC5": _decode_bc5, "BC7": _decode_bc7,
+}
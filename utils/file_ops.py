@@ -9,8 +9,8 @@ import getpass
 import re
 import json
 
-VEHICLE_FOLDER = "vehicles"
-ADDED_VEHICLES_JSON = os.path.join("vehicles", "added_vehicles.json")
+from utils import lenient_json
+from utils.vehicle_catalog import catalog as vehicle_catalog, VEHICLE_FOLDER
 
 def sanitize_skin_id(name):
     print(f"[DEBUG] sanitize_skin_id called")
@@ -96,123 +96,63 @@ def delete_variant_folders(carid, suffix_upper):
 
 # ── JSON helpers ───────────────────────────────────────────────────────────────
 #
-# added_vehicles.json structure:
-#   {
-#     "pickup": "Gavril Pickup",          ← custom vehicle entries  (carid: name)
-#     "__variants__": {                   ← custom variant entries  (never shown as vehicles)
-#       "pickup__box": {"carid": "pickup", "suffix": "box"}
-#     }
-#   }
-#
-# load_added_vehicles_json() strips __ keys so callers only see vehicles.
-# Internal write helpers use _load_raw_json() so __variants__ is never lost.
-
-def _load_raw_json() -> dict:
-    """Load added_vehicles.json exactly as stored (including __variants__)."""
-    if not os.path.exists(ADDED_VEHICLES_JSON):
-        return {}
-    try:
-        with open(ADDED_VEHICLES_JSON, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"[ERROR] _load_raw_json failed: {e}")
-        return {}
+# added_vehicles.json is owned by utils.vehicle_catalog, which loads it once and
+# serves every lookup from memory (see that module for the file layout).  These
+# helpers keep their old signatures and delegate to it.
 
 def load_added_vehicles_json():
     """Return only vehicle entries — strips __variants__ and any other __ key."""
     print(f"[DEBUG] load_added_vehicles_json called")
-    if not os.path.exists(ADDED_VEHICLES_JSON):
-        print(f"[DEBUG] {ADDED_VEHICLES_JSON} not found, returning empty dict")
-        return {}
-    try:
-        raw = _load_raw_json()
-        vehicles = {k: v for k, v in raw.items() if not k.startswith("__")}
-        print(f"[DEBUG] Loaded {len(vehicles)} vehicles from {ADDED_VEHICLES_JSON}")
-        return vehicles
-    except Exception as e:
-        print(f"[ERROR] Failed to load {ADDED_VEHICLES_JSON}: {e}")
-        return {}
+    return vehicle_catalog.vehicles()
 
 def load_added_variants_json() -> dict:
     """Return the __variants__ dict:
     { "pickup__box": {"carid": "pickup", "suffix": "box"}, ... }"""
     print(f"[DEBUG] load_added_variants_json called")
-    raw = _load_raw_json()
-    variants = raw.get("__variants__", {})
-    print(f"[DEBUG] Loaded {len(variants)} variants from {ADDED_VEHICLES_JSON}")
-    return variants
+    return vehicle_catalog.variants()
 
 def save_added_vehicles_json(vehicles_dict):
-    """Save vehicle entries while preserving __variants__ already on disk."""
+    """Replace the vehicle entries; __variants__ is preserved."""
     print(f"[DEBUG] save_added_vehicles_json called with {len(vehicles_dict)} vehicles")
-    try:
-        os.makedirs(VEHICLE_FOLDER, exist_ok=True)
-        # Preserve all __ keys (e.g. __variants__) from the existing file
-        raw = _load_raw_json()
-        reserved = {k: v for k, v in raw.items() if k.startswith("__")}
-        merged = {**vehicles_dict, **reserved}
-        with open(ADDED_VEHICLES_JSON, 'w', encoding='utf-8') as f:
-            json.dump(merged, f, indent=2)
-        print(f"[DEBUG] Successfully saved to {ADDED_VEHICLES_JSON}")
-        return True
-    except Exception as e:
-        print(f"[ERROR] Failed to save {ADDED_VEHICLES_JSON}: {e}")
-        raise
+    vehicle_catalog.replace_vehicles(vehicles_dict)
+    return True
 
 def add_vehicle_to_json(carid, carname):
     print(f"[DEBUG] add_vehicle_to_json called: {carid} = {carname}")
-    raw = _load_raw_json()
-    raw[carid] = carname
-    os.makedirs(VEHICLE_FOLDER, exist_ok=True)
-    with open(ADDED_VEHICLES_JSON, 'w', encoding='utf-8') as f:
-        json.dump(raw, f, indent=2)
-    print(f"[DEBUG] Vehicle {carid} added to JSON successfully")
+    vehicle_catalog.add_vehicle(carid, carname)
     return True
 
 def remove_vehicle_from_json(carid):
     print(f"[DEBUG] remove_vehicle_from_json called: {carid}")
-    raw = _load_raw_json()
-    if carid in raw:
-        del raw[carid]
-        with open(ADDED_VEHICLES_JSON, 'w', encoding='utf-8') as f:
-            json.dump(raw, f, indent=2)
+    if vehicle_catalog.remove_vehicle(carid):
         print(f"[DEBUG] Vehicle {carid} removed from JSON successfully")
         return True
-    else:
-        print(f"[WARNING] Vehicle {carid} not found in JSON")
-        return False
+    print(f"[WARNING] Vehicle {carid} not found in JSON")
+    return False
 
 def add_variant_to_json(carid: str, suffix_lower: str) -> bool:
     """Record a custom variant under __variants__ in added_vehicles.json."""
     print(f"[DEBUG] add_variant_to_json called: {carid}__{suffix_lower}")
-    key = f"{carid}__{suffix_lower}"
-    raw = _load_raw_json()
-    raw.setdefault("__variants__", {})[key] = {"carid": carid, "suffix": suffix_lower}
-    os.makedirs(VEHICLE_FOLDER, exist_ok=True)
-    with open(ADDED_VEHICLES_JSON, 'w', encoding='utf-8') as f:
-        json.dump(raw, f, indent=2)
-    print(f"[DEBUG] Variant {key} added to JSON successfully")
+    vehicle_catalog.add_variant(carid, suffix_lower)
     return True
 
 def remove_variant_from_json(carid: str, suffix_lower: str) -> bool:
     """Remove a custom variant from __variants__ in added_vehicles.json."""
     print(f"[DEBUG] remove_variant_from_json called: {carid}__{suffix_lower}")
-    key = f"{carid}__{suffix_lower}"
-    raw = _load_raw_json()
-    variants = raw.get("__variants__", {})
-    if key in variants:
-        del variants[key]
-        if not variants:
-            raw.pop("__variants__", None)
-        else:
-            raw["__variants__"] = variants
-        with open(ADDED_VEHICLES_JSON, 'w', encoding='utf-8') as f:
-            json.dump(raw, f, indent=2)
-        print(f"[DEBUG] Variant {key} removed from JSON successfully")
+    if vehicle_catalog.remove_variant(carid, suffix_lower):
+        print(f"[DEBUG] Variant {carid}__{suffix_lower} removed from JSON successfully")
         return True
-    else:
-        print(f"[WARNING] Variant {key} not found in JSON")
-        return False
+    print(f"[WARNING] Variant {carid}__{suffix_lower} not found in JSON")
+    return False
+
+def add_entries_to_json(vehicles: dict, variants: list, sources: dict = None) -> bool:
+    """Register a whole batch at once: vehicles is {carid: carname},
+    variants is [(carid, suffix_lower), ...], sources is template provenance
+    keyed like the catalog.  Written to disk before returning; raises (with
+    nothing recorded) if the write fails."""
+    print(f"[DEBUG] add_entries_to_json called: {len(vehicles)} vehicle(s), {len(variants)} variant(s)")
+    vehicle_catalog.update(vehicles=vehicles, variants=variants, sources=sources, flush=True)
+    return True
 
 def fix_stage_two_material_properties(stage2, carid, prefix):
     print(f"[DEBUG] Fixing Stage 2 material properties for prefix: {prefix}...")
@@ -250,49 +190,61 @@ def fix_stage_two_material_properties(stage2, carid, prefix):
 
     return stage2
 
-def edit_material_json(source_json_path, target_folder, carid):
+def materials_output_name(source_json_path):
+    """Name edit_material_json gives the template's materials file."""
+    if os.path.basename(source_json_path).startswith("skin."):
+        return "skin.materials.json"
+    return "materials.json"
+
+def template_files(folder):
+    """{lower name: name} of the files a SKINNAME template consists of:
+    its materials file (materials.json or skin.materials.json) and jbeams."""
+    if not os.path.isdir(folder):
+        return {}
+    return {n.lower(): n for n in os.listdir(folder)
+            if n.lower() == "materials.json" or n.lower().endswith((".materials.json", ".jbeam"))}
+
+def install_template(staging, target, replaced_jbeams=()):
+    """Swap the template files built in staging into target.  The new files
+    are copied in before stale ones are removed, so a failed copy never
+    leaves target without a template.  A stale materials file is removed;
+    a jbeam only when it is named in replaced_jbeams (one the generator
+    wrote earlier), so hand-authored jbeams and their parts are never lost."""
+    os.makedirs(target, exist_ok=True)
+    new = template_files(staging)
+    for name in new.values():
+        shutil.copy2(os.path.join(staging, name), os.path.join(target, name))
+    replaced = {n.lower() for n in replaced_jbeams}
+    for key, name in template_files(target).items():
+        if key not in new and (not key.endswith(".jbeam") or key in replaced):
+            os.remove(os.path.join(target, name))
+
+def edit_material_json(source_json_path, target_folder, carid, content=None):
+    """content: the source text when it was read from an archive member
+    rather than a file; source_json_path then only supplies the name."""
     print(f"[DEBUG] edit_material_json called")
     print(f"[DEBUG]   Source: {source_json_path}")
     print(f"[DEBUG]   Target: {target_folder}")
     print(f"[DEBUG]   CarID: {carid}")
 
     try:
-        source_basename = os.path.basename(source_json_path)
-
-        if source_basename.startswith("skin."):
-            output_name = "skin.materials.json"
-        else:
-            output_name = "materials.json"
-
+        output_name = materials_output_name(source_json_path)
         target_path = os.path.join(target_folder, output_name)
 
-        with open(source_json_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(source_json_path, 'r', encoding='utf-8') as f:
+                content = f.read()
 
         try:
-            data = json.loads(content)
-            print(f"[DEBUG] Parsed JSON successfully (standard format)")
+            data = lenient_json.loads(content)
+            print(f"[DEBUG] Parsed materials JSON successfully")
         except json.JSONDecodeError as e:
-            print(f"[DEBUG] Standard JSON parse failed: {e}")
-            print(f"[DEBUG] Attempting to fix JSON5 format (trailing commas, comments)...")
-
-            content = re.sub(r'//[^\n]*', '', content)
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-            content = re.sub(r',(\s*[}\]])', r'\1', content)
-
-            try:
-                data = json.loads(content)
-                print(f"[DEBUG] Successfully parsed after JSON5 fixes")
-            except json.JSONDecodeError as e2:
-                print(f"[ERROR] Still cannot parse JSON after fixes: {e2}")
-                print(f"[DEBUG] Falling back to direct copy without validation...")
-
-                with open(source_json_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                print(f"[DEBUG] Copied file directly (BeamNG will parse it)")
-                return True
+            print(f"[ERROR] Cannot parse materials JSON: {e}")
+            print(f"[DEBUG] Falling back to direct copy without validation...")
+            with open(target_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            print(f"[DEBUG] Copied file directly (BeamNG will parse it)")
+            return True
 
         # Match any key of the form:  {prefix}.skin.{skinname}
         # or the lbe variant:         {prefix}.skin_lbe.{skinname}
@@ -409,14 +361,15 @@ def edit_material_json(source_json_path, target_folder, carid):
         traceback.print_exc()
         raise
 
-def edit_jbeam_material(source_jbeam_path, target_folder, carid):
+def edit_jbeam_material(source_jbeam_path, target_folder, carid, output_name=None):
+    """output_name: file name to write; defaults to the source's name."""
     print(f"[DEBUG] edit_jbeam_material called")
     print(f"[DEBUG]   Source: {source_jbeam_path}")
     print(f"[DEBUG]   Target: {target_folder}")
     print(f"[DEBUG]   CarID: {carid}")
 
     try:
-        output_name = os.path.basename(source_jbeam_path)
+        output_name = output_name or os.path.basename(source_jbeam_path)
         target_path = os.path.join(target_folder, output_name)
 
         template = f'''{{
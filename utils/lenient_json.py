@@ -0,0 +1,168 @@
+"""
+utils/lenient_json.py — Tolerant parser for BeamNG's JSON dialect.
+
+BeamNG materials.json / info.json / .jbeam files are "almost JSON":
+they may contain // and /* */ comments, trailing commas, and missing
+commas between entries.  Instead of patching the text with several
+regexes (which breaks on "//" inside URLs or strings), this module runs a
+single tokenizer pass that understands string literals, rebuilds a strict
+JSON token stream and hands it to the C json decoder.
+
+    from utils.lenient_json import loads, load
+    data = load("vehicles/pickup/skin.materials.json")
+
+Errors are raised as json.JSONDecodeError, so existing ``except
+json.JSONDecodeError`` handlers keep working.
+"""
+import json
+import re
+from typing import Any, List
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_SCALAR = (r'(?:' + _STRING + r'|(?:-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null)'
+           r'(?![^\s{}\[\]:,"/]))')
+
+# Leading whitespace is folded into every token.  Alternatives, in order:
+# a whole `"key": scalar` pair (the bulk of any materials file, emitted as
+# one string-like token), comment, string, punctuation, bare atom, stray char.
+_TOKEN_RE = re.compile(
+    r'\s*('
+    + _STRING + r'\s*:\s*' + _SCALAR +
+    r'|//[^\n]*|/\*.*?(?:\*/|\Z)'
+    r'|' + _STRING +
+    r'|[{}\[\]:,]'
+    r'|[^\s{}\[\]:,"/]+'
+    r'|\S'
+    r')',
+    re.DOTALL,
+)
+
+_PUNCT       = frozenset("{}[]:,")
+_VALUE_END   = frozenset('"}]a')   # string, close bracket, atom
+_VALUE_START = frozenset('"{[a')   # string, open bracket, atom
+_COMMA_SKIP  = frozenset(("", ",", "{", "[", ":"))
+_NUM_FIX_RE  = re.compile(r'^(-?)\.(\d)|(\d)\.$')
+
+
+def _fix_atom(atom: str) -> str:
+    """Normalise number shorthands jbeam allows but JSON does not (.5, 1.)."""
+    return _NUM_FIX_RE.sub(
+        lambda m: f"{m.group(1)}0.{m.group(2)}" if m.group(2) else f"{m.group(3)}.0",
+        atom,
+    )
+
+
+def _stray_slash(text: str) -> json.JSONDecodeError:
+    for m in _TOKEN_RE.finditer(text):
+        if m.group(1) == "/":
+            return json.JSONDecodeError("Unexpected character", text, m.start(1))
+    return json.JSONDecodeError("Unexpected character", text, 0)
+
+
+def to_strict_json(text: str) -> str:
+    """
+    Rewrite lenient BeamNG JSON into strict JSON text in one pass.
+
+    Comments and whitespace are dropped, trailing / duplicate commas are
+    removed and missing commas between two values are inserted.
+    """
+    if text.startswith("\ufeff"):
+        text = text[1:]
+
+    out: List[str] = []
+    append, pop = out.append, out.pop
+    prev = ""          # kind of the last emitted token: '"', 'a', or the punct char
+
+    for tok in _TOKEN_RE.findall(text):
+        c = tok[0]
+        if c == '"':
+            kind = '"'
+        elif c in _PUNCT:
+            kind = c
+            if c == ",":
+                # Leading or doubled commas carry no meaning — drop them.
+                if prev in _COMMA_SKIP:
+                    continue
+            elif c == "}" or c == "]" or c == ":":
+                if prev == ",":
+                    pop()
+        elif c == "/":
+            if len(tok) > 1:
+                continue       # comment
+            raise _stray_slash(text)
+        else:
+            kind = "a"
+            if "." in tok:
+                tok = _fix_atom(tok)
+
+        if kind in _VALUE_START and prev in _VALUE_END:
+            append(",")
+        append(tok)
+        prev = kind
+
+    if prev == ",":
+        pop()
+    return "".join(out)
+
+
+def loads(text: str) -> Any:
+    """Parse lenient BeamNG JSON text and return the decoded object."""
+    try:
+        # Most files are already strict JSON — let the C decoder take them.
+        return json.loads(text, strict=False)
+    except json.JSONDecodeError:
+        pass
+    return json.loads(to_strict_json(text), strict=False)
+
+
+def load(path: str, encoding: str = "utf-8") -> Any:
+    """Read and parse a lenient BeamNG JSON / jbeam file."""
+    with open(path, "r", encoding=encoding, errors="replace") as f:
+        return loads(f.read())
+
+
+if __name__ == "__main__":
+    # Micro-benchmark against the regex repair chain this module replaced:
+    #   python -m utils.lenient_json [file ...]
+    import sys
+    import timeit
+
+    def _regex_path(text: str) -> Any:
+        text = re.sub(r'(?<!:)//[^\n]*', '', text)
+        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+        text = re.sub(r',(\s*[}\]])', r'\1', text)
+        text = re.sub(r'(["\d\w\]}])\s*\n(\s*")', r'\1,\n\2', text)
+        return json.loads(text)
+
+    samples = []
+    for p in sys.argv[1:]:
+        with open(p, "r", encoding="utf-8", errors="replace") as f:
+            samples.append((p, f.read()))
+    if not samples:
+        # Only uses constructs the regex chain can also handle, so both
+        # paths are timed on the same input.
+        entry = (
+            '  "body.skin.demo%d": { // material\n'
+            '    "name": "body.skin.demo%d", "mapTo": "body.skin.demo%d",\n'
+            '    "Stages": [ {"colorMap": "vehicles/carid/a.png"}, '
+            '{"baseColorMap": "vehicles/carid/skinname/a.dds", "roughnessFactor": 0.5,}, {}, {} ],\n'
+            '    "version": 1.5\n'
+            '  }\n'
+        )
+        text = "{\n" + "".join(entry % (i, i, i) for i in range(2000)) + "}\n"
+        samples.append(("<synthetic 2000 materials>", text))
+
+    # Best of several rounds, so one noisy round or a warm-up pass doesn't
+    # decide the comparison.
+    def _best(fn, text, n=10, rounds=7):
+        return min(timeit.repeat(lambda: fn(text), number=n, repeat=rounds)) / n
+
+    def _timed(fn, text):
+        try:
+            return f"{_best(fn, text) * 1000:8.2f} ms"
+        except (json.JSONDecodeError, ValueError) as e:
+            return f"fails ({type(e).__name__})"
+
+    for name, text in samples:
+        new, old = _timed(loads, text), _timed(_regex_path, text)
+        print(f"{name}: {len(text) / 1024:.0f} KB  tokenizer {new}  regex {old}")
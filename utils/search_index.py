@@ -0,0 +1,220 @@
+"""
+utils/search_index.py — Trigram search index with fuzzy ranking.
+
+Every entry has a key, a label (its display name) and any number of extra
+searchable fields.  A query is split into words; an entry matches when
+every query word is found in it, either exactly (as a substring of some
+field) or, for words of FUZZY_MIN_LEN letters or more, approximately
+(sharing at least FUZZY_THRESHOLD of its trigrams with a word of the
+entry, which forgives most single typos).
+
+Ranking, per query word, summed:
+    4    start of a word in the label
+    3    start of a word in another field
+    2    anywhere else in a field
+    0..1 fuzzy match, by trigram overlap
+
+Lookups go through trigram posting lists, so their cost follows the number
+of candidate entries rather than the size of the index.  Typing one more
+letter only re-checks the entries that matched the previous query.
+
+    index = SearchIndex()
+    index.add("pickup", "Gavril D-Series", ["pickup", "Gavril"])
+    index.search("gavrl d")          # → [("pickup", 4.5)]
+"""
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+FUZZY_MIN_LEN   = 4
+FUZZY_THRESHOLD = 0.5
+
+_WORD = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+def words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _grams(word: str) -> Set[str]:
+    """Trigrams of word, padded so its start and end count too."""
+    padded = f" {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class _Entry:
+    label:        str
+    label_words:  Tuple[str, ...]
+    other_words:  Tuple[str, ...]
+    text:         str                  # every field, lower case, for substring checks
+    grams:        frozenset
+    word_grams:   Tuple[Tuple[str, frozenset], ...]
+
+
+class SearchIndex:
+
+    def __init__(self):
+        self._entries:  Dict[str, _Entry]   = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        # last query → keys that matched it exactly, for incremental narrowing
+        self._last: Optional[Tuple[Tuple[str, ...], Set[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # ── Building ─────────────────────────────────────────────────────────────
+
+    def add(self, key: str, label: str, fields: Iterable[str] = ()) -> None:
+        """Add or replace key."""
+        fields = [f for f in fields if f]
+        label_words = tuple(words(label))
+        other_words = tuple(w for f in fields for w in words(f))
+        word_grams = tuple((w, frozenset(_grams(w))) for w in dict.fromkeys(label_words + other_words))
+        grams = frozenset().union(*(wg for _, wg in word_grams))
+        entry = _Entry(label, label_words, other_words,
+                       " ".join([label.lower()] + [f.lower() for f in fields]), grams, word_grams)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = entry
+            for g in grams:
+                self._postings.setdefault(g, set()).add(key)
+            self._last = None
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+            self._last = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            self._last = None
+
+    def _drop(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is None:
+            return
+        for g in old.grams:
+            keys = self._postings.get(g)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[g]
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """(key, score) for every match, best first, then by label."""
+        terms = tuple(words(query))
+        with self._lock:
+            if not terms:
+                ranked = [(k, 0.0) for k in self._entries]
+                ranked.sort(key=lambda kv: self._entries[kv[0]].label.lower())
+            else:
+                keys, fuzzy = self._match(terms)
+                ranked = [(k, self._score(k, terms, fuzzy)) for k in keys]
+                ranked.sort(key=lambda kv: (-kv[1], self._entries[kv[0]].label.lower()))
+        return ranked[:limit] if limit else ranked
+
+    def matching(self, query: str) -> Set[str]:
+        """Keys matching query, unordered.  Every key for an empty query."""
+        terms = tuple(words(query))
+        with self._lock:
+            if not terms:
+                return set(self._entries)
+            return self._match(terms)[0]
+
+    def _match(self, terms: Tuple[str, ...]) -> Tuple[Set[str], Dict[str, Dict[str, float]]]:
+        """Matching keys, plus term → {key: similarity} for the fuzzy hits."""
+        exact = self._exact(terms)
+        fuzzy = {t: self._fuzzy(t, exact) for t in terms if len(t) >= FUZZY_MIN_LEN}
+        extra: Set[str] = set()
+        for key in set().union(*fuzzy.values()):
+            text = self._entries[key].text
+            if all(t in text or key in fuzzy.get(t, ()) for t in terms):
+                extra.add(key)
+        return exact | extra, fuzzy
+
+    def _exact(self, terms: Tuple[str, ...]) -> Set[str]:
+        """Keys where every term is a substring, narrowed from the last query if possible."""
+        pool: Optional[Set[str]] = None
+        if self._last is not None and _extends(terms, self._last[0]):
+            pool = self._last[1]
+        else:
+            longest = max(terms, key=len)
+            if len(longest) >= 3:
+                # a word containing the term has all of its inner trigrams
+                hits = [self._postings.get(longest[i:i + 3], set()) for i in range(len(longest) - 2)]
+                pool = set.intersection(*hits)
+        if pool is None:
+            pool = self._entries.keys()
+        entries = self._entries
+        result = {k for k in pool if all(t in entries[k].text for t in terms)}
+        self._last = (terms, result)
+        return result
+
+    def _fuzzy(self, term: str, skip: Set[str]) -> Dict[str, float]:
+        """key → similarity for keys outside skip with a word close to term."""
+        grams = _grams(term)
+        counts: Counter = Counter()
+        for g in grams:
+            counts.update(self._postings.get(g, set()) - skip)
+        need = FUZZY_THRESHOLD * len(grams)
+        sims = {}
+        for key, n in counts.items():
+            if n >= need:
+                sim = self._best_word_similarity(term, grams, self._entries[key])
+                if sim >= FUZZY_THRESHOLD:
+                    sims[key] = min(sim, 0.99)
+        return sims
+
+    def _score(self, key: str, terms: Tuple[str, ...], fuzzy: Dict[str, Dict[str, float]]) -> float:
+        entry = self._entries[key]
+        total = 0.0
+        for term in terms:
+            s = self._term_score(term, entry)
+            total += s if s else fuzzy.get(term, {}).get(key, 0.0)
+        return total
+
+    @staticmethod
+    def _best_word_similarity(term: str, grams: Set[str], entry: _Entry) -> float:
+        best = 0.0
+        for w, wg in entry.word_grams:
+            if abs(len(w) - len(term)) <= 3:
+                best = max(best, len(grams & wg) / max(len(grams), len(wg)))
+        return best
+
+    @staticmethod
+    def _term_score(term: str, entry: _Entry) -> float:
+        if any(w.startswith(term) for w in entry.label_words):
+            return 4.0
+        if any(w.startswith(term) for w in entry.other_words):
+            return 3.0
+        if term in entry.text:
+            return 2.0
+        return 0.0
+
+
+def _extends(terms: Tuple[str, ...], previous: Tuple[str, ...]) -> bool:
+    """
+    True when every entry matching `terms` exactly must also have matched
+    `previous` exactly — the user typed more letters or another word.
+    """
+    if not previous or len(terms) < len(previous):
+        return False
+    for i, prev in enumerate(previous):
+        term = terms[i]
+        if i == len(previous) - 1:
+            if prev not in term:
+                return False
+        elif term != prev:
+            return False
+    return True
@@ -0,0 +1,187 @@
+"""
+utils/texture_info.py — Texture metadata from file headers only.
+
+inspect(path) reports a texture's dimensions, pixel format, mip count and
+colour space by reading a few hundred bytes of header — nothing is
+decoded.  Results are cached per file fingerprint (size + mtime), so
+asking again about an unchanged file is a dict lookup.
+
+Handles DDS (legacy and DX10 headers), PNG and JPEG.  Anything else, or a
+file whose header can't be parsed, gives None.
+
+    from utils.texture_info import inspect
+    info = inspect(path)
+    if info and info.width > 8192: ...
+"""
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from utils.dds_reader import parse_header as _parse_dds_header
+
+_CACHE_LIMIT = 4096
+_JPEG_SCAN   = 256 * 1024     # give up looking for a SOF marker after this
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COLOR_TYPES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+
+
+@dataclass(frozen=True)
+class TextureInfo:
+    path:      str
+    kind:      str              # "dds", "png" or "jpeg"
+    width:     int
+    height:    int
+    format:    str              # "BC7", "RGBA8", "PNG RGBA", "JPEG", ...
+    mip_count: int = 1
+    srgb:      Optional[bool] = None   # None: the file doesn't say
+    has_alpha: bool = False
+    bit_depth: int = 8          # bits per channel
+    file_size: int = 0
+    supported: bool = True      # False for DDS formats we can't preview natively
+
+    @property
+    def is_power_of_two(self) -> bool:
+        return (self.width & (self.width - 1)) == 0 and (self.height & (self.height - 1)) == 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Rough in-game memory footprint: DDS levels as stored, other
+        formats as uncompressed RGBA8 plus a full mip chain.
+        """
+        if self.kind == "dds":
+            return self.file_size
+        return self.width * self.height * 4 * 4 // 3
+
+    def describe(self) -> str:
+        parts = [f"{self.width}×{self.height}", self.format]
+        if self.mip_count > 1:
+            parts.append(f"{self.mip_count} mips")
+        if self.srgb is not None:
+            parts.append("sRGB" if self.srgb else "linear")
+        return " · ".join(parts)
+
+
+_cache: "OrderedDict[str, Tuple[Tuple[int, int], Optional[TextureInfo]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def inspect(path: str) -> Optional[TextureInfo]:
+    """Header metadata for path, or None if it isn't a readable texture."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    norm   = os.path.normcase(os.path.abspath(path))
+    finger = (st.st_size, st.st_mtime_ns)
+    with _cache_lock:
+        hit = _cache.get(norm)
+        if hit is not None and hit[0] == finger:
+            _cache.move_to_end(norm)
+            return hit[1]
+
+    info = _read(path, st.st_size)
+    with _cache_lock:
+        _cache[norm] = (finger, info)
+        _cache.move_to_end(norm)
+        while len(_cache) > _CACHE_LIMIT:
+            _cache.popitem(last=False)
+    return info
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Header parsers
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _read(path: str, file_size: int) -> Optional[TextureInfo]:
+    try:
+        with open(path, "rb") as f:
+            head = f.read(148)
+            if head.startswith(b"DDS "):
+                return _dds_info(path, head, file_size)
+            if head.startswith(_PNG_SIGNATURE):
+                return _png_info(path, f, file_size)
+            if head.startswith(b"\xff\xd8"):
+                return _jpeg_info(path, f, file_size)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[DEBUG] texture_info: {os.path.basename(path)}: {e}")
+    return None
+
+
+def _dds_info(path: str, head: bytes, file_size: int) -> TextureInfo:
+    dds = _parse_dds_header(head)
+    fmt = dds.format or dds.raw_format
+    return TextureInfo(
+        path, "dds", dds.width, dds.height, fmt,
+        mip_count=dds.mip_count,
+        srgb=dds.srgb if dds.raw_format.startswith("DXGI") else None,
+        has_alpha=dds.format in ("BC2", "BC3", "BC7", "RGBA8", "BGRA8"),
+        file_size=file_size,
+        supported=dds.supported,
+    )
+
+
+def _png_info(path: str, f, file_size: int) -> TextureInfo:
+    f.seek(8)
+    length, ctype = struct.unpack(">I4s", f.read(8))
+    if ctype != b"IHDR" or length < 13:
+        raise ValueError("PNG without IHDR")
+    width, height, depth, color = struct.unpack(">IIBB", f.read(10))
+    mode = _PNG_COLOR_TYPES.get(color, "?")
+    f.seek(length - 10 + 4, os.SEEK_CUR)        # rest of IHDR + CRC
+
+    # Ancillary chunks that matter here all come before the image data.
+    srgb, alpha = None, color in (4, 6)
+    while True:
+        hdr = f.read(8)
+        if len(hdr) < 8:
+            break
+        length, ctype = struct.unpack(">I4s", hdr)
+        if ctype in (b"IDAT", b"IEND"):
+            break
+        if ctype == b"sRGB":
+            srgb = True
+        elif ctype == b"tRNS":
+            alpha = True
+        f.seek(length + 4, os.SEEK_CUR)
+    return TextureInfo(path, "png", width, height, f"PNG {mode}",
+                       srgb=srgb, has_alpha=alpha, bit_depth=depth, file_size=file_size)
+
+
+# SOF markers carrying frame dimensions (C4 = DHT, C8 = JPG, CC = DAC are not frames)
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _jpeg_info(path: str, f, file_size: int) -> TextureInfo:
+    f.seek(2)
+    while f.tell() < _JPEG_SCAN:
+        byte = f.read(1)
+        if not byte:
+            break
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":                # fill bytes
+            marker = f.read(1)
+        if not marker:
+            break
+        m = marker[0]
+        if m in (0x01, 0xD8) or 0xD0 <= m <= 0xD7:
+            continue                            # markers without a length
+        (length,) = struct.unpack(">H", f.read(2))
+        if m in _JPEG_SOF:
+            depth, height, width, comps = struct.unpack(">BHHB", f.read(6))
+            kind = "progressive " if m in (0xC2, 0xC6, 0xCA, 0xCE) else ""
+            return TextureInfo(path, "jpeg", width, height, f"JPEG {kind}{comps}ch",
+                               bit_depth=depth, file_size=file_size)
+        f.seek(length - 2, os.SEEK_CUR)
+    raise ValueError("no JPEG frame header found")
@@ -0,0 +1,178 @@
+"""
+utils/thumb_cache.py — Persistent on-disk cache of small preview images.
+
+Decoding a 16k BC7 texture just to show a 400×200 preview takes seconds,
+so the scaled result is kept under data/cache/thumbs as a PNG and reused
+until the source file changes.
+
+Entries are keyed by the source's absolute path, size and mtime plus the
+requested preview size (and an optional transform tag), so an edited
+texture simply gets a new key and its stale thumbnail ages out.
+
+The cache is capped at MAX_BYTES.  Hits bump the file's mtime, which is
+what the LRU order is rebuilt from on the next start; when a store pushes
+the total over the cap the least recently used entries are deleted until
+it is back under TRIM_RATIO of the cap.
+
+A hit costs one dict lookup and one utime() — the caller then loads a
+small PNG instead of the original texture.
+
+    from utils.thumb_cache import thumb_cache
+    key = thumb_cache.key(path, 400, 200)
+    hit = thumb_cache.get(key)              # path of the cached PNG or None
+    if hit is None:
+        thumb_cache.put(key, png_bytes)
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+_HERE      = os.path.dirname(os.path.abspath(__file__))
+THUMBS_DIR = os.path.join(os.path.dirname(_HERE), "data", "cache", "thumbs")
+
+MAX_BYTES  = 128 * 1024 * 1024
+TRIM_RATIO = 0.8
+_EXT       = ".png"
+
+
+class ThumbCache:
+
+    def __init__(self, folder: str = THUMBS_DIR, max_bytes: int = MAX_BYTES):
+        self._folder    = folder
+        self._max_bytes = max_bytes
+        self._lock      = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()   # key → size, oldest first
+        self._total     = 0
+        self._loaded    = False
+
+    # ── Keys ─────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def key(path: str, max_w: int, max_h: int, transform: str = "") -> Optional[str]:
+        """Cache key for a preview of path, or None if the file can't be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        ident = f"{os.path.normcase(os.path.abspath(path))}|{st.st_size}|{st.st_mtime_ns}|{max_w}x{max_h}|{transform}"
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self._folder, key + _EXT)
+
+    # ── Index ────────────────────────────────────────────────────────────────
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        found = []
+        try:
+            with os.scandir(self._folder) as it:
+                for entry in it:
+                    if not entry.name.endswith(_EXT) or not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    found.append((st.st_mtime, entry.name[:-len(_EXT)], st.st_size))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[WARNING] ThumbCache: could not read {self._folder}: {e}")
+        found.sort()
+        self._entries = OrderedDict((k, size) for _, k, size in found)
+        self._total   = sum(self._entries.values())
+        self._loaded  = True
+        print(f"[DEBUG] ThumbCache: {len(self._entries)} thumbnails, "
+              f"{self._total / 1048576:.1f} MB in {self._folder}")
+
+    # ── Lookups / stores ─────────────────────────────────────────────────────
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Path of the cached thumbnail for key, or None on a miss."""
+        if not key:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        path = self._file(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Deleted behind our back — forget it.
+            with self._lock:
+                size = self._entries.pop(key, None)
+                if size is not None:
+                    self._total -= size
+            return None
+        return path
+
+    def put(self, key: Optional[str], data: bytes) -> Optional[str]:
+        """Store encoded image bytes under key; returns the cached file path."""
+        if not key or not data:
+            return None
+        path = self._file(key)
+        tmp  = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._folder, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[WARNING] ThumbCache: could not store thumbnail: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return None
+
+        with self._lock:
+            self._ensure_loaded()
+            self._total -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total += len(data)
+            if self._total > self._max_bytes:
+                self._evict(int(self._max_bytes * TRIM_RATIO), keep=key)
+        return path
+
+    def _evict(self, target: int, keep: str) -> None:
+        start   = time.perf_counter()
+        removed = 0
+        for old in list(self._entries):
+            if self._total <= target:
+                break
+            if old == keep:
+                continue
+            size = self._entries.pop(old)
+            self._total -= size
+            removed += 1
+            try:
+                os.remove(self._file(old))
+            except OSError:
+                pass
+        print(f"[DEBUG] ThumbCache: evicted {removed} thumbnail(s) in "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"{self._total / 1048576:.1f} MB left")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            for key in list(self._entries):
+                try:
+                    os.remove(self._file(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total = 0
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return self._total
+
+
+thumb_cache = ThumbCache()
@@ -0,0 +1,111 @@
+"""
+utils/variant_index.py — In-memory index of each vehicle's body variants.
+
+A vehicle's variants are the SKINNAME* folders under vehicles/<carid>/:
+SKINNAME is the normal body, SKINNAMEAMBULANCE / SKINNAMEBOX / ... are the
+variant bodies.  The sidebar needs them for every vehicle on every rebuild,
+so the vehicles/ tree is scanned once, on first use, and every lookup
+after that is served from memory.
+
+The index follows VehicleCatalog change events: an import that adds or
+removes vehicles or variants rescans just those vehicles' folders.  Code
+that writes template folders without going through the catalog can call
+refresh(carid), or refresh() to rescan everything.
+
+    from utils.variant_index import variant_index
+    variant_index.get("pickup")    # [("", "Normal"), ("ambulance", "Ambulance")]
+"""
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from utils.vehicle_catalog import VEHICLE_FOLDER, catalog as _catalog
+except ImportError:
+    VEHICLE_FOLDER = "vehicles"
+    _catalog = None  # type: ignore
+
+Variant = Tuple[str, str]               # (suffix, display label); suffix "" is the normal body
+
+NORMAL_ONLY: Tuple[Variant, ...] = (("", "Normal"),)
+
+
+class VariantIndex:
+
+    def __init__(self, root: str = VEHICLE_FOLDER):
+        self._root = root
+        self._lock = threading.Lock()
+        self._variants: Optional[Dict[str, Tuple[Variant, ...]]] = None
+
+    def get(self, carid: str) -> List[Variant]:
+        """
+        Variants of carid, normal body first, then alphabetically by
+        label.  Always at least [("", "Normal")].
+        """
+        with self._lock:
+            if self._variants is None:
+                self._variants = self._scan_all()
+            return list(self._variants.get(carid, NORMAL_ONLY))
+
+    def refresh(self, carid: str = "") -> None:
+        """Rescan carid's folder, or the whole tree when carid is empty."""
+        with self._lock:
+            if not carid:
+                self._variants = None           # rebuilt on the next get()
+            elif self._variants is not None:
+                found = self._scan(carid)
+                if found is None:
+                    self._variants.pop(carid, None)
+                else:
+                    self._variants[carid] = found
+
+    def _scan_all(self) -> Dict[str, Tuple[Variant, ...]]:
+        out: Dict[str, Tuple[Variant, ...]] = {}
+        try:
+            with os.scandir(self._root) as it:
+                carids = [e.name for e in it if e.is_dir()]
+        except OSError:
+            carids = []
+        for carid in carids:
+            found = self._scan(carid)
+            if found is not None:
+                out[carid] = found
+        print(f"[DEBUG] variant_index: scanned {len(carids)} vehicle folder(s), "
+              f"{sum(len(v) > 1 for v in out.values())} with variants")
+        return out
+
+    def _scan(self, carid: str) -> Optional[Tuple[Variant, ...]]:
+        """SKINNAME* folders of one vehicle; None when it has none."""
+        variants: List[Variant] = []
+        try:
+            with os.scandir(os.path.join(self._root, carid)) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    dl = entry.name.lower()
+                    if dl == "skinname":
+                        variants.append(("", "Normal"))
+                    elif dl.startswith("skinname"):
+                        suffix = dl[len("skinname"):]          # e.g. "ambulance", "box"
+                        variants.append((suffix, suffix.capitalize()))
+        except OSError:
+            return None
+        if not variants:
+            return None
+        variants.sort(key=lambda x: (x[0] != "", x[1].lower()))
+        return tuple(variants)
+
+    def _on_catalog_change(self, change) -> None:
+        if change.reloaded:
+            self.refresh()
+            return
+        carids = set(change.added_vehicles) | set(change.removed_vehicles)
+        carids |= {c for c, _ in change.added_variants + change.removed_variants}
+        for carid in carids:
+            self.refresh(carid)
+
+
+variant_index = VariantIndex()
+
+if _catalog is not None:
+    _catalog.subscribe(variant_index._on_catalog_change)
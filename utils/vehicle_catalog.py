@@ -0,0 +1,302 @@
+"""
+utils/vehicle_catalog.py — In-process catalog of custom vehicles and variants.
+
+added_vehicles.json structure:
+  {
+    "pickup": "Gavril Pickup",          ← custom vehicle entries  (carid: name)
+    "__variants__": {                   ← custom variant entries  (never shown as vehicles)
+      "pickup__box": {"carid": "pickup", "suffix": "box"}
+    },
+    "__sources__": {                    ← where each template was generated from
+      "pickup": {"archive": "...zip", "json": ".../materials.json", "jbeam": ".../pickup.jbeam",
+                 "stamp": [size, crc_or_mtime], "sha1": "..."}
+    }
+  }
+
+The file is read once, on first use, and every lookup after that is served
+from memory.  Mutations update memory immediately and schedule a write;
+writes within WRITE_DELAY seconds are coalesced into one atomic replace
+(temp file + os.replace).  Pending writes are flushed at interpreter exit.
+
+Listeners registered with subscribe() receive a CatalogChange describing
+exactly what changed, so views can update incrementally instead of
+reloading the whole list.  They are called on the thread that made the
+change — GUI code must hop to the main thread itself.
+
+    from utils.vehicle_catalog import catalog
+    catalog.add_vehicle("pickup", "Gavril Pickup")
+    catalog.has_variant("pickup", "box")
+"""
+import atexit
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+VEHICLE_FOLDER      = "vehicles"
+ADDED_VEHICLES_JSON = os.path.join(VEHICLE_FOLDER, "added_vehicles.json")
+
+VARIANTS_KEY = "__variants__"
+SOURCES_KEY  = "__sources__"
+WRITE_DELAY  = 0.25   # seconds
+
+
+def variant_key(carid: str, suffix: str) -> str:
+    return f"{carid}__{suffix.lower()}"
+
+
+@dataclass
+class CatalogChange:
+    """What one catalog operation changed."""
+    added_vehicles:   Dict[str, str]        = field(default_factory=dict)   # new or renamed
+    removed_vehicles: List[str]             = field(default_factory=list)
+    added_variants:   List[Tuple[str, str]] = field(default_factory=list)   # (carid, suffix)
+    removed_variants: List[Tuple[str, str]] = field(default_factory=list)
+    reloaded:         bool = False   # everything may have changed
+
+    def __bool__(self) -> bool:
+        return bool(self.reloaded or self.added_vehicles or self.removed_vehicles
+                    or self.added_variants or self.removed_variants)
+
+
+class VehicleCatalog:
+
+    def __init__(self, path: str = ADDED_VEHICLES_JSON, write_delay: float = WRITE_DELAY):
+        self._path        = path
+        self._write_delay = write_delay
+        self._lock        = threading.RLock()
+        self._loaded      = False
+        self._vehicles:  Dict[str, str]            = {}
+        self._variants:  Dict[str, Dict[str, str]] = {}
+        self._sources:   Dict[str, Dict[str, Any]] = {}   # vehicle / variant key → provenance
+        self._reserved:  Dict[str, Any]            = {}   # other __ keys, kept verbatim
+        self._dirty      = False
+        self._timer: Optional[threading.Timer] = None
+        self._listeners: List[Callable[[CatalogChange], None]] = []
+
+    # ── Loading ──────────────────────────────────────────────────────────────
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._load()
+
+    def _load(self) -> None:
+        raw: Dict[str, Any] = {}
+        if os.path.exists(self._path):
+            try:
+                with open(self._path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                if not isinstance(raw, dict):
+                    raw = {}
+            except Exception as e:
+                print(f"[ERROR] VehicleCatalog: failed to read {self._path}: {e}")
+                raw = {}
+
+        self._vehicles = {k: v for k, v in raw.items() if not k.startswith("__")}
+        variants = raw.get(VARIANTS_KEY)
+        self._variants = dict(variants) if isinstance(variants, dict) else {}
+        sources = raw.get(SOURCES_KEY)
+        self._sources  = dict(sources) if isinstance(sources, dict) else {}
+        self._reserved = {k: v for k, v in raw.items()
+                          if k.startswith("__") and k not in (VARIANTS_KEY, SOURCES_KEY)}
+        self._loaded = True
+        print(f"[DEBUG] VehicleCatalog: loaded {len(self._vehicles)} vehicles, "
+              f"{len(self._variants)} variants from {self._path}")
+
+    def reload(self) -> None:
+        """Write pending changes, then re-read the file (e.g. after an external edit)."""
+        with self._lock:
+            self.flush()
+            self._load()
+        self._publish(CatalogChange(reloaded=True))
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    def vehicles(self) -> Dict[str, str]:
+        """Copy of {carid: display name} for every custom vehicle."""
+        self._ensure_loaded()
+        with self._lock:
+            return dict(self._vehicles)
+
+    def variants(self) -> Dict[str, Dict[str, str]]:
+        """Copy of the __variants__ mapping: {"carid__suffix": {"carid", "suffix"}}."""
+        self._ensure_loaded()
+        with self._lock:
+            return {k: dict(v) for k, v in self._variants.items()}
+
+    def has_vehicle(self, carid: str) -> bool:
+        self._ensure_loaded()
+        return carid in self._vehicles
+
+    def get_name(self, carid: str, default: Optional[str] = None) -> Optional[str]:
+        self._ensure_loaded()
+        return self._vehicles.get(carid, default)
+
+    def has_variant(self, carid: str, suffix: str) -> bool:
+        self._ensure_loaded()
+        return variant_key(carid, suffix) in self._variants
+
+    def get_source(self, key: str) -> Optional[Dict[str, Any]]:
+        """Provenance of the template stored under a carid or variant_key()."""
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._sources.get(key)
+            return dict(entry) if entry is not None else None
+
+    def sources(self) -> Dict[str, Dict[str, Any]]:
+        self._ensure_loaded()
+        with self._lock:
+            return {k: dict(v) for k, v in self._sources.items()}
+
+    # ── Mutations ────────────────────────────────────────────────────────────
+
+    def update(
+        self,
+        vehicles: Optional[Dict[str, str]] = None,
+        variants: Iterable[Tuple[str, str]] = (),
+        remove_vehicles: Iterable[str] = (),
+        remove_variants: Iterable[Tuple[str, str]] = (),
+        sources: Optional[Dict[str, Dict[str, Any]]] = None,
+        flush: bool = False,
+    ) -> CatalogChange:
+        """
+        Apply a batch of changes as one operation.  With flush=True the file
+        is written before returning; if that write fails the in-memory
+        catalog is restored and the error is raised.  Removing a vehicle or
+        variant also drops its template provenance.
+        """
+        self._ensure_loaded()
+        change = CatalogChange()
+        with self._lock:
+            snapshot = (dict(self._vehicles), dict(self._variants), dict(self._sources))
+
+            for carid, name in (vehicles or {}).items():
+                if self._vehicles.get(carid) != name:
+                    self._vehicles[carid] = name
+                    change.added_vehicles[carid] = name
+            for carid in remove_vehicles:
+                if self._vehicles.pop(carid, None) is not None:
+                    change.removed_vehicles.append(carid)
+                    self._sources.pop(carid, None)
+            for carid, suffix in variants:
+                key = variant_key(carid, suffix)
+                if key not in self._variants:
+                    self._variants[key] = {"carid": carid, "suffix": suffix.lower()}
+                    change.added_variants.append((carid, suffix.lower()))
+            for carid, suffix in remove_variants:
+                if self._variants.pop(variant_key(carid, suffix), None) is not None:
+                    change.removed_variants.append((carid, suffix.lower()))
+                    self._sources.pop(variant_key(carid, suffix), None)
+
+            # Provenance is bookkeeping only — saved, but not published.
+            touched = bool(change)
+            for key, entry in (sources or {}).items():
+                if self._sources.get(key) != entry:
+                    self._sources[key] = dict(entry)
+                    touched = True
+
+            if touched:
+                self._dirty = True
+                if flush:
+                    try:
+                        self._write()
+                    except Exception:
+                        self._vehicles, self._variants, self._sources = snapshot
+                        raise
+                else:
+                    self._schedule_write()
+
+        if change:
+            self._publish(change)
+        return change
+
+    def add_vehicle(self, carid: str, name: str) -> None:
+        self.update(vehicles={carid: name})
+
+    def remove_vehicle(self, carid: str) -> bool:
+        return bool(self.update(remove_vehicles=[carid]).removed_vehicles)
+
+    def add_variant(self, carid: str, suffix: str) -> None:
+        self.update(variants=[(carid, suffix)])
+
+    def remove_variant(self, carid: str, suffix: str) -> bool:
+        return bool(self.update(remove_variants=[(carid, suffix)]).removed_variants)
+
+    def replace_vehicles(self, vehicles: Dict[str, str]) -> CatalogChange:
+        """Make the vehicle entries exactly `vehicles`; variants are untouched."""
+        self._ensure_loaded()
+        with self._lock:
+            gone = [c for c in self._vehicles if c not in vehicles]
+        return self.update(vehicles=vehicles, remove_vehicles=gone)
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def _to_raw(self) -> Dict[str, Any]:
+        raw: Dict[str, Any] = dict(self._vehicles)
+        if self._variants:
+            raw[VARIANTS_KEY] = self._variants
+        if self._sources:
+            raw[SOURCES_KEY] = self._sources
+        raw.update(self._reserved)
+        return raw
+
+    def _schedule_write(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self._write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _write(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        folder = os.path.dirname(self._path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._to_raw(), f, indent=2)
+        os.replace(tmp_path, self._path)
+        self._dirty = False
+        print(f"[DEBUG] VehicleCatalog: saved {self._path}")
+
+    def flush(self) -> bool:
+        """Write pending changes now.  Returns False if the write failed."""
+        with self._lock:
+            if not self._dirty:
+                return True
+            try:
+                self._write()
+                return True
+            except Exception as e:
+                print(f"[ERROR] VehicleCatalog: failed to save {self._path}: {e}")
+                return False
+
+    # ── Change events ────────────────────────────────────────────────────────
+
+    def subscribe(self, listener: Callable[[CatalogChange], None]) -> Callable[[], None]:
+        """Register listener(change); returns a function that unsubscribes it."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return _unsubscribe
+
+    def _publish(self, change: CatalogChange) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(change)
+            except Exception as e:
+                print(f"[WARNING] VehicleCatalog listener failed: {e}")
+
+
+catalog = VehicleCatalog()
+atexit.register(catalog.flush)
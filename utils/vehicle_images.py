@@ -0,0 +1,188 @@
+"""
+utils/vehicle_images.py — In-memory index of each vehicle's images.
+
+Two folders hold pictures of a vehicle:
+
+  gui/images/vehicles/<carid>/   preview images (default.jpg, one per body
+                                 variant) and UV maps copied in on import
+  vehicles/<carid>/              the template tree, which for imported mods
+                                 can carry the mod's own UV layout images
+
+The car list needs the previews of every card it paints and the UV maps
+behind every "UV map" button, so both trees are walked once — on first use,
+or ahead of time with warm() — and every lookup after that is served from
+memory.  VehicleCatalog change events rescan just the vehicles an import
+or removal touched; code that writes images without going through the
+catalog can call refresh(carid), or refresh() to rescan everything.
+
+    from utils.vehicle_images import vehicle_images
+    vehicle_images.previews("pickup")   # [("Default", ".../default.jpg"), ...]
+    vehicle_images.uv_maps("mymod")     # [".../mymod_uv.png"]
+"""
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from utils.vehicle_catalog import catalog as _catalog
+except ImportError:
+    _catalog = None  # type: ignore
+
+_APP_DIR     = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGES_DIR   = os.path.join(_APP_DIR, "gui", "images", "vehicles")
+VEHICLES_DIR = os.path.join(_APP_DIR, "vehicles")
+
+PREVIEW_EXTS = (".jpg", ".jpeg", ".png")
+
+_UV_KEYWORDS = ("uv", "uvmap", "uv_map", "uv_layout", "uv1_layout")
+_UV_EXTS     = (".dds", ".png", ".jpg", ".jpeg", ".pdn")
+# Same qualifier list as mod_scanner — catches double-extension typed textures
+# like name.color.dds / name.data.dds that happen to contain "uv" in the stem.
+_UV_TYPE_QUALIFIERS = (
+    ".color", ".colour", ".data", ".normal", ".nrm",
+    ".metallic", ".roughness", ".alpha", ".ao",
+)
+_UV_MAX_UNDERSCORES = 3
+
+
+def is_uv_map_file(fn: str) -> bool:
+    """Return True when *fn* looks like a UV layout template, not a livery texture."""
+    lower = fn.lower()
+    if not any(lower.endswith(ext) for ext in _UV_EXTS):
+        return False
+    stem = os.path.splitext(lower)[0]
+    if not any(kw in stem for kw in _UV_KEYWORDS):
+        return False
+    if any(stem.endswith(q) or (q + ".") in stem for q in _UV_TYPE_QUALIFIERS):
+        return False
+    if stem.count("_") > _UV_MAX_UNDERSCORES:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class VehicleImages:
+    previews: Tuple[Tuple[str, str], ...] = ()      # (label, path), "Default" first
+    uv_maps:  Tuple[str, ...] = ()                  # images folder first, then the template tree
+
+    def preview(self, stem: str) -> str:
+        """Path of the preview image named stem (e.g. "default", "box"), or ""."""
+        stem = stem.lower()
+        for _label, path in self.previews:
+            if os.path.splitext(os.path.basename(path))[0].lower() == stem:
+                return path
+        return ""
+
+
+_NONE = VehicleImages()
+
+
+class VehicleImageIndex:
+
+    def __init__(self, images_dir: str = IMAGES_DIR, vehicles_dir: str = VEHICLES_DIR):
+        self._images_dir   = images_dir
+        self._vehicles_dir = vehicles_dir
+        self._lock = threading.Lock()
+        self._images: Optional[Dict[str, VehicleImages]] = None
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    def get(self, carid: str) -> VehicleImages:
+        with self._lock:
+            if self._images is None:
+                self._images = self._scan_all()
+            return self._images.get(carid, _NONE)
+
+    def previews(self, carid: str) -> List[Tuple[str, str]]:
+        """[(label, path), …] of carid's preview images, "Default" first."""
+        return list(self.get(carid).previews)
+
+    def uv_maps(self, carid: str) -> List[str]:
+        return list(self.get(carid).uv_maps)
+
+    def refresh(self, carid: str = "") -> None:
+        """Rescan carid's folders, or both trees when carid is empty."""
+        with self._lock:
+            if not carid:
+                self._images = None             # rebuilt on the next get()
+            elif self._images is not None:
+                found = self._scan(carid)
+                if found is _NONE:
+                    self._images.pop(carid, None)
+                else:
+                    self._images[carid] = found
+
+    def warm(self) -> threading.Thread:
+        """Build the index on a background thread so the first lookup doesn't."""
+        thread = threading.Thread(target=self.get, args=("",), daemon=True,
+                                  name="vehicle-images")
+        thread.start()
+        return thread
+
+    # ── Scanning ─────────────────────────────────────────────────────────────
+
+    def _scan_all(self) -> Dict[str, VehicleImages]:
+        carids = set()
+        for root in (self._images_dir, self._vehicles_dir):
+            try:
+                with os.scandir(root) as it:
+                    carids.update(e.name for e in it if e.is_dir())
+            except OSError:
+                pass
+        out: Dict[str, VehicleImages] = {}
+        for carid in carids:
+            found = self._scan(carid)
+            if found is not _NONE:
+                out[carid] = found
+        print(f"[DEBUG] vehicle_images: scanned {len(carids)} vehicle folder(s), "
+              f"{sum(bool(v.uv_maps) for v in out.values())} with UV maps")
+        return out
+
+    def _scan(self, carid: str) -> VehicleImages:
+        previews: List[Tuple[str, str]] = []
+        uv_maps:  List[str] = []
+
+        images_dir = os.path.join(self._images_dir, carid)
+        try:
+            names = sorted(os.listdir(images_dir))
+        except OSError:
+            names = []
+        for fn in names:
+            if is_uv_map_file(fn):
+                uv_maps.append(os.path.join(images_dir, fn))
+            elif fn.lower().endswith(PREVIEW_EXTS):
+                stem = os.path.splitext(fn)[0]
+                label = "Default" if stem.lower() == "default" else stem.replace("_", " ").title()
+                previews.append((label, os.path.join(images_dir, fn)))
+        # subfolders of the images folder can hold UV maps too
+        for dirpath, _dirs, filenames in os.walk(images_dir):
+            if dirpath == images_dir:
+                continue
+            uv_maps.extend(os.path.join(dirpath, fn) for fn in sorted(filenames)
+                           if is_uv_map_file(fn))
+
+        # the template tree, walked with the same rules as mod_scanner._find_uv_maps
+        for dirpath, _dirs, filenames in os.walk(os.path.join(self._vehicles_dir, carid)):
+            uv_maps.extend(os.path.join(dirpath, fn) for fn in sorted(filenames)
+                           if is_uv_map_file(fn))
+
+        if not previews and not uv_maps:
+            return _NONE
+        previews.sort(key=lambda x: (x[0] != "Default", x[0].lower()))
+        return VehicleImages(tuple(previews), tuple(dict.fromkeys(uv_maps)))
+
+    def _on_catalog_change(self, change) -> None:
+        if change.reloaded:
+            self.refresh()
+            return
+        carids = set(change.added_vehicles) | set(change.removed_vehicles)
+        carids |= {c for c, _ in change.added_variants + change.removed_variants}
+        for carid in carids:
+            self.refresh(carid)
+
+
+vehicle_images = VehicleImageIndex()
+
+if _catalog is not None:
+    _catalog.subscribe(vehicle_images._on_catalog_change)